@@ -0,0 +1,265 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quicksight_assets_class import *
+
+###############################################################################
+### Generates synthetic analyses and measures how compiling and serializing ###
+### them scales. Run from the src folder:                                   ###
+###     python benchmarks/compile_benchmark.py --output bench_results.json  ###
+###############################################################################
+
+DATA_SET = 'SaaS-Sales.csv'
+
+# PivotTableVisual is left out because it does not implement compile() yet
+def populate_bar_chart(visual):
+	visual.set_bars_arrangement('CLUSTERED')
+	visual.set_orientation('HORIZONTAL')
+	visual.add_categorical_dimension_field('Product', DATA_SET)
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM')
+	visual.set_scroll_bar_visibility("HIDDEN")
+	visual.add_filter_action(visual.id + "_action", "Quick Filter", "DATA_POINT_CLICK", selected_field_options = "ALL_FIELDS", target_visual_options = "ALL_VISUALS")
+
+def populate_line_chart(visual):
+	visual.set_type('LINE')
+	visual.add_date_dimension_field('Order Date', DATA_SET, date_granularity = "MONTH")
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM')
+	visual.add_numerical_measure_field('Profit', DATA_SET, 'SUM')
+
+def populate_table(visual):
+	visual.add_categorical_dimension_field('Product', DATA_SET)
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM', currency_symbol = "USD")
+	visual.add_numerical_measure_field('Discount', DATA_SET, 'AVERAGE', percentage_suffix = '%')
+	visual.add_inline_visualization('Sales')
+	visual.set_cell_border_type('UniformBorder', style = 'NONE')
+	visual.add_field_sort("Sales", "DESC")
+
+def populate_kpi(visual):
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM', currency_symbol = "USD")
+
+def populate_pie_chart(visual):
+	visual.set_donut_type('MEDIUM')
+	visual.add_categorical_dimension_field('Segment', DATA_SET)
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM')
+
+def populate_scatter_plot(visual):
+	visual.add_categorical_dimension_field('Customer', DATA_SET)
+
+def populate_tree_map(visual):
+	visual.add_group_categorical_dimension_field('Industry', DATA_SET)
+	visual.add_size_numerical_measure_field('Sales', DATA_SET, 'SUM')
+	visual.add_color_numerical_measure_field('Profit', DATA_SET, 'SUM')
+
+def populate_waterfall(visual):
+	visual.add_categorical_dimension_field('Region', DATA_SET)
+	visual.add_breakdown_categorical_dimension_field('Segment', DATA_SET)
+	visual.add_numerical_measure_field('Profit', DATA_SET, 'SUM')
+
+def populate_filled_map(visual):
+	visual.add_geospatial_categorical_dimension_field('Country', DATA_SET)
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM')
+
+def populate_geospatial_map(visual):
+	visual.add_geospatial_categorical_dimension_field('City', DATA_SET)
+	visual.add_color_categorical_dimension_field('Region', DATA_SET)
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM')
+
+def populate_funnel_chart(visual):
+	visual.add_categorical_dimension_field('Segment', DATA_SET)
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM')
+
+def populate_heat_map(visual):
+	visual.add_column_categorical_dimension_field('Region', DATA_SET)
+	visual.add_row_categorical_dimension_field('Segment', DATA_SET)
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM')
+
+def populate_box_plot(visual):
+	visual.add_categorical_dimension_field('Region', DATA_SET)
+	visual.add_numerical_measure_field('Profit', DATA_SET, 'SUM')
+
+def populate_gauge_chart(visual):
+	visual.add_numerical_measure_field('Sales', DATA_SET, 'SUM')
+	visual.add_target_value_numerical_measure_field('Profit', DATA_SET, 'SUM')
+
+VISUAL_TYPES = [
+	(BarChartVisual, populate_bar_chart),
+	(LineChartVisual, populate_line_chart),
+	(TableVisual, populate_table),
+	(KPIVisual, populate_kpi),
+	(PieChartVisual, populate_pie_chart),
+	(ScatterPlotVisual, populate_scatter_plot),
+	(TreeMapVisual, populate_tree_map),
+	(WaterfallVisual, populate_waterfall),
+	(FilledMapVisual, populate_filled_map),
+	(GeospatialMapVisual, populate_geospatial_map),
+	(FunnelChartVisual, populate_funnel_chart),
+	(HeatMapVisual, populate_heat_map),
+	(BoxPlotVisual, populate_box_plot),
+	(GaugeChartVisual, populate_gauge_chart)
+]
+
+# Builds an analysis with sheet_count sheets of visuals_per_sheet visuals each, cycling through every visual type.
+# Each TableVisual gets conditional_formats_per_table conditional formatting rules.
+def generate_analysis(sheet_count, visuals_per_sheet, conditional_formats_per_table = 0, filter_group_count = 0):
+	analysis = Analysis('123456789012', 'benchmark', 'Benchmark Analysis')
+	definition = Definition([{"DataSetArn": "arn:aws:quicksight:us-east-1:123456789012:dataset/benchmark", "Identifier": DATA_SET}])
+	definition.set_analysis_default()
+
+	sheets = []
+	for sheet_index in range(sheet_count):
+		sheet = Sheet('sheet' + str(sheet_index), name = "Sheet " + str(sheet_index))
+		sheet.set_grid_layout("FIXED", "1600px")
+
+		visuals = []
+		for visual_index in range(visuals_per_sheet):
+			visual_class, populate = VISUAL_TYPES[visual_index % len(VISUAL_TYPES)]
+			visual = visual_class('sheet' + str(sheet_index) + '_visual' + str(visual_index))
+			populate(visual)
+			visual.add_title("VISIBLE", "PlainText", visual_class.__name__ + " " + str(visual_index))
+
+			if visual_class is TableVisual:
+				for rule_index in range(conditional_formats_per_table):
+					visual.add_icon_conditional_formatting('Sales', 'SUM({Sales}) > ' + str(rule_index * 1000), icon = 'THREE_BAR', color = '#0251D3')
+
+			visuals.append(visual)
+
+		sheet.add_visuals(visuals)
+		for visual_index, visual in enumerate(visuals):
+			sheet.add_grid_layout_element(visual, 12, 8, (visual_index % 3) * 12, (visual_index // 3) * 8)
+		sheets.append(sheet)
+
+	filter_groups = []
+	for filter_group_index in range(filter_group_count):
+		category_filter = CategoryFilter('filter' + str(filter_group_index), 'Product', DATA_SET)
+		category_filter.add_filter_list_configuration('CONTAINS', ['Alchemy', 'Big Ol Database', 'Data Smasher'])
+
+		filter_group = FilterGroup("ALL_DATASETS", 'filtergroup' + str(filter_group_index))
+		filter_group.add_scope_configuration("ALL_VISUALS", sheets[filter_group_index % len(sheets)].id if sheets else "")
+		filter_group.add_filters([category_filter])
+		filter_group.set_status("ENABLED")
+		filter_groups.append(filter_group)
+
+	definition.add_sheets(sheets)
+	definition.add_filter_groups(filter_groups)
+	analysis.add_definition(definition)
+
+	return analysis
+
+# Runs function once for wall time and once under tracemalloc for peak memory.
+# The analysis is generated again for every run so that cached compile output is not reused.
+def measure(build, function):
+	analysis = build()
+	start = time.perf_counter()
+	result = function(analysis)
+	seconds = time.perf_counter() - start
+
+	analysis = build()
+	tracemalloc.start()
+	function(analysis)
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	return result, seconds, peak
+
+def run_scenario(sheet_count, visuals_per_sheet, conditional_formats_per_table, filter_group_count):
+	build = lambda: generate_analysis(sheet_count, visuals_per_sheet, conditional_formats_per_table, filter_group_count)
+
+	# Output is written to a real file, so that the measured peak does not include the text kept in memory
+	def serialize(analysis):
+		with tempfile.TemporaryFile("w") as outfile:
+			outfile.write(json.dumps(analysis.compile(), indent = 6))
+			return outfile.tell()
+
+	def stream(analysis):
+		with tempfile.TemporaryFile("w") as outfile:
+			dump_analysis(analysis, outfile)
+			return outfile.tell()
+
+	def stream_compact(analysis):
+		with tempfile.TemporaryFile("w") as outfile:
+			dump_analysis(analysis, outfile, compact = True)
+			return outfile.tell()
+
+	result = {
+		"sheets": sheet_count,
+		"visuals_per_sheet": visuals_per_sheet,
+		"conditional_formats_per_table": conditional_formats_per_table,
+		"filter_groups": filter_group_count
+	}
+
+	_, seconds, peak = measure(build, lambda analysis: analysis.compile())
+	result["compile"] = {"seconds": seconds, "peak_bytes": peak}
+
+	for name, function in [("json_dumps", serialize), ("dump_analysis", stream), ("dump_analysis_compact", stream_compact)]:
+		output_bytes, seconds, peak = measure(build, function)
+		result[name] = {"seconds": seconds, "peak_bytes": peak, "output_bytes": output_bytes}
+
+	return result
+
+# One axis is varied at a time, the others stay at the baseline values
+BASELINE = {"sheets": 5, "visuals_per_sheet": 20, "conditional_formats_per_table": 3, "filter_groups": 5}
+AXES = {
+	"sheets": [1, 10, 25, 50, 100],
+	"visuals_per_sheet": [1, 10, 50, 100, 200],
+	"conditional_formats_per_table": [0, 10, 50, 100],
+	"filter_groups": [0, 10, 50, 100]
+}
+QUICK_AXES = {
+	"sheets": [1, 10],
+	"visuals_per_sheet": [1, 50],
+	"conditional_formats_per_table": [0, 20],
+	"filter_groups": [0, 20]
+}
+
+def library_hash():
+	library_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "quicksight_assets_class")
+	digest = hashlib.sha256()
+	for module_name in sorted(os.listdir(library_path)):
+		if module_name.endswith(".py"):
+			with open(os.path.join(library_path, module_name), "rb") as library_file:
+				digest.update(module_name.encode("utf-8"))
+				digest.update(library_file.read())
+	return digest.hexdigest()
+
+def main():
+	parser = argparse.ArgumentParser(description = "Benchmark Analysis.compile() and JSON serialization on synthetic analyses.")
+	parser.add_argument("--output", default = "bench_results.json", help = "JSON file the results are written to")
+	parser.add_argument("--quick", action = "store_true", help = "run a reduced set of scenarios")
+	args = parser.parse_args()
+
+	scenarios = []
+	for axis, values in (QUICK_AXES if args.quick else AXES).items():
+		for value in values:
+			scenario = dict(BASELINE)
+			scenario[axis] = value
+			if scenario not in scenarios:
+				scenarios.append(scenario)
+
+	results = []
+	for scenario in scenarios:
+		result = run_scenario(scenario["sheets"], scenario["visuals_per_sheet"], scenario["conditional_formats_per_table"], scenario["filter_groups"])
+		results.append(result)
+		print("sheets=%-4d visuals=%-4d rules=%-4d filter_groups=%-4d compile=%.3fs peak=%.1fMB output=%dB" % (
+			scenario["sheets"], scenario["visuals_per_sheet"], scenario["conditional_formats_per_table"], scenario["filter_groups"],
+			result["compile"]["seconds"], result["compile"]["peak_bytes"] / 1e6, result["json_dumps"]["output_bytes"]))
+
+	with open(args.output, "w") as outfile:
+		json.dump({
+			"python_version": platform.python_version(),
+			# Identifies the library version the results belong to
+			"library_sha256": library_hash(),
+			"visual_types": [visual_class.__name__ for visual_class, _ in VISUAL_TYPES],
+			"results": results
+		}, outfile, indent = 2)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+#########################################################################
+### Measures how long importing the library takes in a fresh         ###
+### interpreter, using python -X importtime. Run from the src folder: ###
+###     python benchmarks/import_benchmark.py                          ###
+#########################################################################
+
+SRC_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import statements to time, from the lightest to the heaviest
+SCENARIOS = {
+	"package": "import quicksight_assets_class",
+	"bar_chart_and_table": "from quicksight_assets_class import Analysis, Definition, Sheet, BarChartVisual, TableVisual",
+	"star": "from quicksight_assets_class import *"
+}
+
+# Runs one import in a new interpreter and returns the cumulative microseconds and the submodules loaded.
+# -X importtime writes one line per module to stderr: "import time: self [us] | cumulative | imported package".
+def time_import(statement):
+	completed = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", statement],
+		cwd = SRC_PATH, capture_output = True, text = True, check = True
+	)
+	cumulative_us = 0
+	modules = []
+	for line in completed.stderr.splitlines():
+		parts = line.split("|")
+		if not line.startswith("import time:") or len(parts) != 3 or not parts[1].strip().isdigit():
+			continue
+		module_name = parts[2].strip()
+		if not module_name.startswith("quicksight_assets_class"):
+			continue
+		modules.append(module_name)
+		# Nested imports are indented further; their time is already part of the top-level entry that imported them
+		if len(parts[2]) - len(parts[2].lstrip()) == 1:
+			cumulative_us += int(parts[1])
+	return cumulative_us, modules
+
+def main():
+	parser = argparse.ArgumentParser(description = "Benchmark the import time of the library with python -X importtime.")
+	parser.add_argument("--repeat", type = int, default = 20, help = "number of fresh interpreters per scenario")
+	parser.add_argument("--output", default = None, help = "optional JSON file the results are written to")
+	args = parser.parse_args()
+
+	results = {}
+	for name, statement in SCENARIOS.items():
+		timings = []
+		for _ in range(args.repeat):
+			cumulative_us, modules = time_import(statement)
+			timings.append(cumulative_us)
+		results[name] = {
+			"statement": statement,
+			"median_us": statistics.median(timings),
+			"min_us": min(timings),
+			"modules": modules
+		}
+		print("%-22s median=%6dus min=%6dus modules=%s" % (name, results[name]["median_us"], results[name]["min_us"], ", ".join(modules)))
+
+	if args.output:
+		with open(args.output, "w") as outfile:
+			json.dump({"python_version": platform.python_version(), "results": results}, outfile, indent = 2)
+
+if __name__ == "__main__":
+	main()
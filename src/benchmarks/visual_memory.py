@@ -0,0 +1,57 @@
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quicksight_assets_class import *
+
+##############################################################################
+### Measures the memory held by each visual object, using tracemalloc.    ###
+### Run from the src folder: python benchmarks/visual_memory.py           ###
+##############################################################################
+
+def populate_bar_chart(visual):
+	visual.set_bars_arrangement('CLUSTERED')
+	visual.add_categorical_dimension_field('Product','SaaS-Sales.csv')
+	visual.add_numerical_measure_field('Sales','SaaS-Sales.csv','SUM')
+	visual.add_title("VISIBLE","PlainText","Sum of Sales by Product")
+
+def populate_table(visual):
+	visual.add_categorical_dimension_field('Product','SaaS-Sales.csv')
+	visual.add_numerical_measure_field('Sales','SaaS-Sales.csv','SUM', currency_symbol="USD")
+	visual.add_title("VISIBLE","PlainText","Product Metrics Table")
+
+def populate_kpi(visual):
+	visual.add_numerical_measure_field('Sales','SaaS-Sales.csv','SUM', currency_symbol="USD")
+
+# Returns the average number of bytes still allocated per visual after creating count visuals
+def bytes_per_visual(visual_class, populate, count = 10000):
+	tracemalloc.start()
+	before, _ = tracemalloc.get_traced_memory()
+
+	visuals = []
+	for index in range(count):
+		visual = visual_class('visual' + str(index))
+		if populate is not None:
+			populate(visual)
+		visuals.append(visual)
+
+	after, _ = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	return (after - before) / count
+
+def main():
+	measurements = [
+		("BarChartVisual", BarChartVisual, populate_bar_chart),
+		("TableVisual", TableVisual, populate_table),
+		("KPIVisual", KPIVisual, populate_kpi)
+	]
+
+	print("%-16s %12s %12s" % ("Visual", "empty", "populated"))
+	for name, visual_class, populate in measurements:
+		print("%-16s %12.0f %12.0f" % (name, bytes_per_visual(visual_class, None), bytes_per_visual(visual_class, populate)))
+
+if __name__ == "__main__":
+	main()
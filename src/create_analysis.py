@@ -1,5 +1,4 @@
 from quicksight_assets_class import *
-import json
 import boto3
 ###################################################################
 ### This where we are going to create dashboard objects as code ###
@@ -97,24 +96,11 @@ def main():
 	kpi_1.add_numerical_measure_field('Sales','SaaS-Sales.csv','SUM', currency_symbol="USD")
 
 	# Visuals in Sheet 2
-	barchart_3 = BarChartVisual('barchart3')
-	barchart_3.set_bars_arrangement('CLUSTERED')
-	barchart_3.set_orientation('HORIZONTAL')
-	barchart_3.add_categorical_dimension_field('Product','SaaS-Sales.csv')
-	barchart_3.add_numerical_measure_field('Sales','SaaS-Sales.csv','SUM')
-	barchart_3.add_title("VISIBLE","PlainText","Sum of Sales by Product")
-	barchart_3.add_subtitle("VISIBLE","PlainText","Use this visual to drill down into specific products.")
-	barchart_3.set_scroll_bar_visibility("HIDDEN")
-	barchart_3.add_filter_action("quick_filter_action_2", "Quick Filter", "DATA_POINT_CLICK", selected_field_options = "ALL_FIELDS", target_visual_options= "ALL_VISUALS")
-
-	linechart_3 = LineChartVisual('linechart3')
-	linechart_3.set_type('LINE')
-	linechart_3.add_date_dimension_field('Order Date','SaaS-Sales.csv', date_granularity = "MONTH")
-	linechart_3.add_numerical_measure_field('Sales','SaaS-Sales.csv','SUM')
-	linechart_3.add_numerical_measure_field('Profit','SaaS-Sales.csv','SUM')
-	linechart_3.add_numerical_measure_field('Cost','SaaS-Sales.csv','SUM')
-	linechart_3.add_title("VISIBLE","PlainText","Sales vs Profit over time")
-	linechart_3.set_scroll_bar_visibility("HIDDEN")
+	# Visuals that only differ by their ID can be cloned from an existing visual
+	barchart_3 = barchart_1.clone('barchart3')
+	barchart_3.set_custom_action_id("quick_filter_action_1", "quick_filter_action_2")
+
+	linechart_3 = linechart_1.clone('linechart3')
 
 	# Filter Group
 	filter_group_1 = FilterGroup("ALL_DATASETS", "filtergroup1")
@@ -196,19 +182,17 @@ def main():
 	return response
 	'''
 
-	# When calling this code from the AWS CLI, you will want to dump the dictionary into an output JSON file (assets_definition.json).
+	# When calling this code from the AWS CLI, you will want to dump the analysis into an output JSON file (assets_definition.json).
 	# This assets_definition.json file will be referenced as the definition file when you call the API through CLI commands.
+	# dump_analysis streams the analysis into the file sheet by sheet instead of building the whole JSON string first.
+	# Pass compact = True to leave out the indentation and make the file smaller.
 	'''
-	file = json.dumps(analysis_json, indent=6)
-
 	with open("asset_definition.json", "w") as outfile:
-		outfile.write(file)
+		dump_analysis(analysis_1, outfile, compact = True)
 	'''
 
-	file = json.dumps(analysis_json, indent=6)
-
 	with open("asset_definition.json", "w") as outfile:
-		outfile.write(file)
+		dump_analysis(analysis_1, outfile)
 
 if __name__ == "__main__":
 	main()
\ No newline at end of file
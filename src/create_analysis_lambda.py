@@ -1,15 +1,38 @@
 import json
+import time
 import boto3
-from quicksight_assets_class import *
+from quicksight_assets_class import (Analysis, BarChartVisual, CalculatedField, CategoryFilter, DateTimeParameter, Definition,
+	FilterGroup, IntegerParameter, LineChartVisual, ParameterDateTimePickerControl, Sheet, TableVisual, TimeRangeFilter)
+from quicksight_deployer import AnalysisDeployer
 
 client = boto3.client('quicksight')
 
-def lambda_handler(event, context):
+# Event keys that change the built analysis, with the values used when the event does not set them
+BUILD_PARAMETERS = {
+	"AwsAccountId": "<your-aws-account-id>",
+	"AnalysisId": "analysis1",
+	"AnalysisName": "Assets as Code - Sample Analysis",
+	"DataSetArn": "<your-dataset-arn>"
+}
+
+# Compiled analyses kept at module scope so that warm invocations skip the build phase, keyed by build parameters.
+# A new deployment of this function starts new containers, so the build code cannot change under the cache.
+# Only the MAX_CACHED_ANALYSES most recently used analyses are kept, so events with many different parameters
+# do not grow the container's memory without bound.
+MAX_CACHED_ANALYSES = 8
+_compiled_analyses = {}
+
+# True until the first invocation of this container has run
+_cold_start = True
+
+# Build phase: creates the sheets, visuals and filters and compiles the analysis.
+# The result only depends on the build parameters, so lambda_handler caches it.
+def build_analysis(aws_account_id, analysis_id, analysis_name, data_set_arn):
 	#Analysis
-	analysis_1 = Analysis('<your-aws-account-id>','analysis1','Assets as Code - Sample Analysis')
+	analysis_1 = Analysis(aws_account_id, analysis_id, analysis_name)
 
 	#Analysis Definition
-	analysis_definition = Definition([{"DataSetArn":"<your-dataset-arn>","Identifier":"SaaS-Sales.csv"}])
+	analysis_definition = Definition([{"DataSetArn":data_set_arn,"Identifier":"SaaS-Sales.csv"}])
 	analysis_definition.set_analysis_default()
 
 	# Parameters
@@ -93,24 +116,11 @@ def lambda_handler(event, context):
 	table_1.add_title("VISIBLE","PlainText","Product Metrics Table")
 
 	# Visuals in Sheet 2
-	barchart_3 = BarChartVisual('barchart3')
-	barchart_3.set_bars_arrangement('CLUSTERED')
-	barchart_3.set_orientation('HORIZONTAL')
-	barchart_3.add_categorical_dimension_field('Product','SaaS-Sales.csv')
-	barchart_3.add_numerical_measure_field('Sales','SaaS-Sales.csv','SUM')
-	barchart_3.add_title("VISIBLE","PlainText","Sum of Sales by Product")
-	barchart_3.add_subtitle("VISIBLE","PlainText","Use this visual to drill down into specific products.")
-	barchart_3.set_scroll_bar_visibility("HIDDEN")
-	barchart_3.add_filter_action("quick_filter_action_2", "Quick Filter", "DATA_POINT_CLICK", selected_field_options = "ALL_FIELDS", target_visual_options= "ALL_VISUALS")
-
-	linechart_3 = LineChartVisual('linechart3')
-	linechart_3.set_type('LINE')
-	linechart_3.add_date_dimension_field('Order Date','SaaS-Sales.csv', date_granularity = "MONTH")
-	linechart_3.add_numerical_measure_field('Sales','SaaS-Sales.csv','SUM')
-	linechart_3.add_numerical_measure_field('Profit','SaaS-Sales.csv','SUM')
-	linechart_3.add_numerical_measure_field('Cost','SaaS-Sales.csv','SUM')
-	linechart_3.add_title("VISIBLE","PlainText","Sales vs Profit over time")
-	linechart_3.set_scroll_bar_visibility("HIDDEN")
+	# Visuals that only differ by their ID can be cloned from an existing visual
+	barchart_3 = barchart_1.clone('barchart3')
+	barchart_3.set_custom_action_id("quick_filter_action_1", "quick_filter_action_2")
+
+	linechart_3 = linechart_1.clone('linechart3')
 
 	# Filter Group
 	filter_group_1 = FilterGroup("ALL_DATASETS", "filtergroup1")
@@ -149,44 +159,57 @@ def lambda_handler(event, context):
 	analysis_1.add_definition(analysis_definition)
 
 	# Finally, compile everything together into a single JSON file.
-	analysis_json = analysis_1.compile()
-
-	# When calling this code directly from Lambda, you will want to 1) import boto3, 2) make sure your Lambda function has the right permissions, and 
-	# 3) pass the values directly to the API.
-	'''
-	# Creating a new analysis
-	response = client.create_analysis(
-		AwsAccountId = analysis_json["AwsAccountId"],
-		AnalysisId = analysis_json["AnalysisId"],
-		Definition = analysis_json["Definition"],
-		Name = analysis_json["Name"],
-		# # Remove if not used
-		# Parameters = analysis_json["Parameters"],
-		# # Remove if not used
-		# Permissions = analysis_json["Permissions"],
-		# # Remove if not used
-		# SourceEntity = analysis_json["SourceEntity"],
-		# # Remove if not used
-		# Tags = analysis_json["Tags"],
-		# # Remove if not used
-		# ThemeArn = analysis_json["ThemeArn"]
-		)
-	'''
-		
-	'''
-	# Updating an existing analysis
-	response = client.create_analysis(
-		AwsAccountId = analysis_json["AwsAccountId"],
-		AnalysisId = analysis_json["AnalysisId"],
-		Definition = analysis_json["Definition"],
-		Name = analysis_json["Name"],
-		# # Remove if not used
-		# Parameters = analysis_json["Parameters"],
-		# # Remove if not used
-		# SourceEntity = analysis_json["SourceEntity"],
-		# # Remove if not used
-		# ThemeArn = analysis_json["ThemeArn"]
-		)
-
+	# The analysis object is dropped after this, so its cached output is returned without a copy.
+	return analysis_1.compile(shared = True)
+
+# Deploy phase: looks up or builds the compiled analysis, then deploys it when the event sets "Deploy": true.
+#
+#	{"AnalysisId": "analysis1", "Deploy": true}
+#
+# Make sure your Lambda function has the right permissions to create and update QuickSight analyses.
+def lambda_handler(event, context):
+	global _cold_start
+	cold_start = _cold_start
+	_cold_start = False
+
+	build_parameters = [event.get(key, default) for key, default in BUILD_PARAMETERS.items()]
+	cache_key = tuple(build_parameters)
+
+	start = time.perf_counter()
+	# Dicts keep insertion order, so re-inserting a hit makes it the most recent and the first key is the oldest
+	analysis_json = _compiled_analyses.pop(cache_key, None)
+	cache_hit = analysis_json is not None
+	if not cache_hit:
+		analysis_json = build_analysis(*build_parameters)
+		if len(_compiled_analyses) >= MAX_CACHED_ANALYSES:
+			del _compiled_analyses[next(iter(_compiled_analyses))]
+	_compiled_analyses[cache_key] = analysis_json
+	compile_ms = (time.perf_counter() - start) * 1000
+
+	_log_metrics(cold_start, cache_hit, compile_ms)
+
+	response = {
+		"AnalysisId": analysis_json["AnalysisId"],
+		"ColdStart": cold_start,
+		"CacheHit": cache_hit,
+		"CompileMilliseconds": round(compile_ms, 3)
+	}
+	if event.get("Deploy", False):
+		response["Deployment"] = AnalysisDeployer(client, max_workers = 1).deploy_analysis(analysis_json).to_dict()
 	return response
-	'''
\ No newline at end of file
+
+# Prints the compile time in CloudWatch Embedded Metric Format, so cold and warm compile times can be graphed without extra API calls
+def _log_metrics(cold_start, cache_hit, compile_ms):
+	print(json.dumps({
+		"_aws": {
+			"Timestamp": int(time.time() * 1000),
+			"CloudWatchMetrics": [{
+				"Namespace": "QuickSightAssetsAsCode",
+				"Dimensions": [["Invocation"]],
+				"Metrics": [{"Name": "CompileTime", "Unit": "Milliseconds"}]
+			}]
+		},
+		"Invocation": "cold" if cold_start else "warm",
+		"CacheHit": cache_hit,
+		"CompileTime": compile_ms
+	}))
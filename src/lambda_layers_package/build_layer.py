@@ -0,0 +1,145 @@
+import argparse
+import hashlib
+import importlib.util
+import io
+import os
+import py_compile
+import sys
+import tempfile
+import zipfile
+
+###########################################################################
+### Builds the Lambda layer zip from the current source tree. Run from   ###
+### the src folder:                                                      ###
+###     python lambda_layers_package/build_layer.py                      ###
+###     python lambda_layers_package/build_layer.py --check              ###
+###########################################################################
+
+SRC_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAYER_PATH = os.path.join(SRC_PATH, "lambda_layers_package", "assets-as-code-mylayer.zip")
+
+# Packages (folders) and modules (files) under src that go into the layer's python/ folder
+LAYER_SOURCES = ["quicksight_assets_class", "quicksight_deployer.py"]
+
+# Every entry gets the same timestamp and permissions, so the same source always gives the same zip
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+FILE_MODE = 0o100644
+DIRECTORY_MODE = 0o40755
+
+# Returns {path in the layer: source bytes} for every .py file of the layer, e.g. "python/quicksight_deployer.py"
+def collect_sources():
+	sources = {}
+	for name in LAYER_SOURCES:
+		path = os.path.join(SRC_PATH, name)
+		if os.path.isfile(path):
+			with open(path, "rb") as infile:
+				sources["python/" + name] = infile.read()
+			continue
+		for root, directories, files in os.walk(path):
+			directories[:] = sorted(directory for directory in directories if directory != "__pycache__")
+			for file_name in sorted(files):
+				if file_name.endswith(".py"):
+					file_path = os.path.join(root, file_name)
+					with open(file_path, "rb") as infile:
+						sources["python/" + os.path.relpath(file_path, SRC_PATH).replace(os.sep, "/")] = infile.read()
+	return sources
+
+# Compiles each source to the __pycache__ path the running interpreter looks for.
+# Lambda does not run Python with -O, so .opt-1/.opt-2 files would be ignored; optimization level 0 is used instead.
+# UNCHECKED_HASH pycs embed a hash of the source instead of its mtime, so they are reproducible and the runtime
+# loads them without checking the .py file again.
+def compile_sources(sources):
+	compiled = {}
+	with tempfile.TemporaryDirectory() as build_path:
+		for layer_path, source in sources.items():
+			source_path = os.path.join(build_path, *layer_path.split("/"))
+			os.makedirs(os.path.dirname(source_path), exist_ok = True)
+			with open(source_path, "wb") as outfile:
+				outfile.write(source)
+
+			cache_path = importlib.util.cache_from_source(source_path)
+			py_compile.compile(
+				source_path, cfile = cache_path, dfile = layer_path, doraise = True,
+				invalidation_mode = py_compile.PycInvalidationMode.UNCHECKED_HASH
+			)
+			with open(cache_path, "rb") as infile:
+				compiled[os.path.relpath(cache_path, build_path).replace(os.sep, "/")] = infile.read()
+	return compiled
+
+# Returns the zip as bytes. Entries are sorted and directories are listed explicitly.
+def build_layer(sources, compiled):
+	files = dict(sources)
+	files.update(compiled)
+
+	directories = set()
+	for path in files:
+		parts = path.split("/")[:-1]
+		for depth in range(1, len(parts) + 1):
+			directories.add("/".join(parts[:depth]) + "/")
+
+	buffer = io.BytesIO()
+	with zipfile.ZipFile(buffer, "w") as layer:
+		for path in sorted(directories | set(files)):
+			info = zipfile.ZipInfo(path, date_time = ZIP_DATE_TIME)
+			info.create_system = 3
+			if path in directories:
+				info.external_attr = DIRECTORY_MODE << 16
+				layer.writestr(info, b"")
+			else:
+				info.external_attr = FILE_MODE << 16
+				info.compress_type = zipfile.ZIP_DEFLATED
+				layer.writestr(info, files[path], compresslevel = 9)
+	return buffer.getvalue()
+
+# Returns a list of differences between the layer zip and the source tree; an empty list means they match.
+# The bytecode is compared too: the runtime never checks UNCHECKED_HASH pycs against their source, so a stale pyc would win.
+def check_layer(layer_path, sources, compiled):
+	problems = []
+	if not os.path.exists(layer_path):
+		return ["%s does not exist" % layer_path]
+
+	with zipfile.ZipFile(layer_path) as layer:
+		names = set(layer.namelist())
+		for path, source in sources.items():
+			if path not in names:
+				problems.append("missing from the layer: %s" % path)
+			elif layer.read(path) != source:
+				problems.append("differs from the source tree: %s" % path)
+
+		for path, bytecode in compiled.items():
+			if path not in names:
+				problems.append("no bytecode in the layer: %s" % path)
+			elif layer.read(path) != bytecode:
+				problems.append("bytecode differs from the source tree: %s" % path)
+		for path in sorted(names):
+			if path.endswith(".py") and path not in sources:
+				problems.append("not in the source tree: %s" % path)
+	return problems
+
+def main():
+	parser = argparse.ArgumentParser(description = "Build a reproducible Lambda layer zip with precompiled bytecode.")
+	parser.add_argument("--output", default = LAYER_PATH, help = "path of the layer zip")
+	parser.add_argument("--check", action = "store_true", help = "only verify that the layer matches the source tree")
+	args = parser.parse_args()
+
+	sources = collect_sources()
+	compiled = compile_sources(sources)
+	if args.check:
+		problems = check_layer(args.output, sources, compiled)
+		for problem in problems:
+			print(problem)
+		if problems:
+			sys.exit(1)
+		print("%s matches the source tree" % args.output)
+		return
+
+	layer = build_layer(sources, compiled)
+	with open(args.output, "wb") as outfile:
+		outfile.write(layer)
+
+	# The bytecode is only used by a Lambda runtime with the same Python version as the one that built the layer
+	print("%s: %d bytes, sha256 %s, bytecode for the python%d.%d runtime" % (
+		args.output, len(layer), hashlib.sha256(layer).hexdigest(), sys.version_info[0], sys.version_info[1]))
+
+if __name__ == "__main__":
+	main()
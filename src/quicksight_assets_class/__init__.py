@@ -0,0 +1,72 @@
+import sys
+
+# The library is split by family into submodules that are only imported when one of their names is first used,
+# so a Lambda function that only builds a bar chart and a table does not load the parameter, control and filter classes.
+# Import the names you need to keep cold starts short:
+#
+#	from quicksight_assets_class import Analysis, Definition, Sheet, BarChartVisual, TableVisual
+#
+# from quicksight_assets_class import * still works, but it loads every submodule.
+#
+#	core        Analysis, Dashboard, Template, Definition, CalculatedField, compile caching and JSON output
+#	sheets      Sheet, TextBox
+#	layout      GridOccupancy, FreeformIndex, parse_pixels: the occupancy bitmap and spatial index behind the layout checks of Sheet
+#	parameters  DateTimeParameter, DecimalParameter, IntegerParameter, StringParameter
+#	controls    Parameter controls and filter controls
+#	filters     FilterGroup and filters
+#	visuals     All visual types
+#	profiling   CompileProfiler
+#	payload     PayloadReport, minify_analysis and hoist_column_formats, for keeping compiled analyses under a size budget
+#	importer    load_analysis and the other functions that rebuild objects from existing QuickSight JSON
+#	validation  validate_analysis, an offline check against the QuickSight shape model shipped with botocore
+#	references  ReferenceIndex, the dangling and duplicate ID check behind Definition.check_references
+_SUBMODULES = {
+	"core": [
+		"CompiledObject", "Analysis", "Dashboard", "Template", "Definition", "CalculatedField",
+		"get_compile_stats", "reset_compile_stats", "clean_dict", "dump_analysis"
+	],
+	"sheets": ["Sheet", "TextBox"],
+	"layout": ["GridOccupancy", "FreeformIndex", "parse_pixels"],
+	"parameters": ["Parameter", "DateTimeParameter", "DecimalParameter", "IntegerParameter", "StringParameter"],
+	"controls": [
+		"ParameterControl", "ParameterDateTimePickerControl", "ParameterDropDownControl", "ParameterListControl",
+		"ParameterSliderControl", "ParameterTextAreaControl", "ParameterTextFieldControl",
+		"FilterControl", "FilterDateTimePickerControl"
+	],
+	"filters": ["FilterGroup", "Filter", "CategoryFilter", "NumericEqualityFilter", "TimeRangeFilter"],
+	"visuals": [
+		"Visual", "BarChartVisual", "LineChartVisual", "TableVisual", "PivotTableVisual", "KPIVisual",
+		"PieChartVisual", "ScatterPlotVisual", "TreeMapVisual", "WaterfallVisual", "FilledMapVisual",
+		"GeospatialMapVisual", "FunnelChartVisual", "HeatMapVisual", "BoxPlotVisual", "GaugeChartVisual"
+	],
+	"profiling": ["CompileProfiler"],
+	"payload": ["PayloadReport", "payload_bytes", "minify_analysis", "ColumnFormatReport", "hoist_column_formats"],
+	"validation": ["SchemaValidator", "ValidationIssue", "get_validator", "validate_analysis"],
+	"references": ["ReferenceIndex"],
+	"importer": ["RawNode", "load_analysis", "load_definition", "import_analysis", "import_definition", "iter_sheets"],
+}
+
+# Name -> submodule that defines it
+_NAMES = {name: submodule for submodule, names in _SUBMODULES.items() for name in names}
+
+__all__ = list(_NAMES)
+
+# Called only for names that are not loaded yet. The value is stored in the package namespace,
+# so later lookups of the same name do not come back here.
+def __getattr__(name):
+	submodule = _NAMES.get(name)
+	if submodule is None:
+		raise AttributeError("module '%s' has no attribute '%s'" % (__name__, name))
+	# __import__ rather than importlib.import_module, so that python -X importtime reports the submodule
+	value = getattr(__import__(submodule, globals(), None, [name], 1), name)
+	globals()[name] = value
+	return value
+
+def __dir__():
+	return sorted(set(globals()) | set(__all__))
+
+# Imports every submodule and binds all names in the package namespace, for tools that need all classes (see CompileProfiler)
+def _load_all():
+	for name in __all__:
+		__getattr__(name)
+	return [sys.modules[__name__ + "." + submodule] for submodule in _SUBMODULES]
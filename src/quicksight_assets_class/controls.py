@@ -0,0 +1,338 @@
+from .core import CompiledObject, _sparse, clean_dict
+
+### PARAMETER CONTROLS ###
+class ParameterControl(CompiledObject):
+	def __init__(self, parameter_control_id, parameter_name, title):
+		# ID of parameter control
+		self.id = parameter_control_id
+		self.element_type = "PARAMETER_CONTROL"
+		# Name of source parameter
+		self.source_parameter_name = parameter_name
+		# Title of parameter control
+		self.title = title
+
+		self.custom_label = ""
+		self.font_color = ""
+		self.font_decoration = ""
+		self.font_size = ""
+		self.font_style = ""
+		self.font_weight = ""
+		self.title_options_visibility = ""
+
+	# Returns a copy of this control with a new id. The copy shares its lists and dicts with this control until either
+	# of them changes one. Keyword arguments replace attributes on the copy, for example title = "Region".
+	def clone(self, new_id, **overrides):
+		return self._clone("id", new_id)._override(overrides)
+
+	def set_title_font(self, font_color = "", font_decoration = "", font_size = "", font_style = "", font_weight = ""):
+		self.font_color = font_color
+		self.font_decoration = font_decoration
+		self.font_size = font_size
+		self.font_style = font_style
+		self.font_weight = font_weight
+class ParameterDateTimePickerControl(ParameterControl):
+	def __init__(self, parameter_control_id, parameter, title):
+		ParameterControl.__init__(self, parameter_control_id, parameter, title)
+
+		self.date_time_format = ""
+
+	def compile(self):
+		self.json = _sparse(
+			DateTimePicker = _sparse(
+				ParameterControlId = self.id,
+				SourceParameterName = self.source_parameter_name,
+				Title = self.title,
+				DisplayOptions = _sparse(
+					DateTimeFormat = self.date_time_format,
+					TitleOptions = _sparse(
+						CustomLabel = self.custom_label,
+						FontConfiguration = _sparse(
+							FontColor = self.font_color,
+							FontDecoration = self.font_decoration,
+							FontSize = _sparse(
+								Relative = self.font_size
+							),
+							FontStyle = self.font_style,
+							FontWeight = _sparse(
+								Name = self.font_weight
+							)
+						),
+						Visibility = self.title_options_visibility						
+					)
+				)
+			)
+		)
+		return self.json
+	
+class ParameterDropDownControl(ParameterControl):
+	def __init__(self, parameter_control_id, parameter, title):
+		ParameterControl.__init__(self, parameter_control_id, parameter, title)
+		self.select_all_options_visibility = ""
+		self.type = ""
+		self.column_name = ""
+		self.data_set_identifier = ""
+		self.values = []
+
+	def compile(self):
+		self.json = _sparse(
+			Dropdown = _sparse(
+				ParameterControlId = self.id,
+				SourceParameterName = self.source_parameter_name,
+				Title = self.title,
+				DisplayOptions = _sparse(
+					SelectAllOptions = _sparse(
+						Visibility = self.select_all_options_visibility
+					),
+					TitleOptions = _sparse(
+						CustomLabel = self.custom_label,
+						FontConfiguration = _sparse(
+							FontColor = self.font_color,
+							FontDecoration = self.font_decoration,
+							FontSize = _sparse(
+								Relative = self.font_size
+							),
+							FontStyle = self.font_style,
+							FontWeight = _sparse(
+								Name = self.font_weight
+							)
+						),
+						Visibility = self.title_options_visibility
+					)
+				),
+				Type = self.type,
+				SelectableValues = _sparse(
+					LinkToDataSetColumn = _sparse(
+						ColumnName = self.column_name,
+						DataSetIdentifier = self.data_set_identifier					
+					),
+					Values = clean_dict(self.values)
+				)
+			)
+		)
+		return self.json
+	
+class ParameterListControl(ParameterControl):
+	def __init__(self, parameter_control_id, parameter, title):
+		ParameterControl.__init__(self, parameter_control_id, parameter, title)
+		self.search_options_visibility = ""
+		self.select_all_options_visibility = ""
+		self.column_name = ""
+		self.data_set_identifier = ""
+		self.values = []
+		self.type = ""
+
+	def compile(self):
+		self.json = _sparse(
+			Dropdown = _sparse(
+				ParameterControlId = self.id,
+				SourceParameterName = self.source_parameter_name,
+				Title = self.title,
+				CascadingControlConfiguration = {					
+
+				},
+				DisplayOptions = _sparse(
+					SearchOptions = _sparse(
+						Visibility = self.search_options_visibility
+					),
+					SelectAllOptions = _sparse(
+						Visibility = self.select_all_options_visibility
+					),
+					TitleOptions = _sparse(
+						CustomLabel = self.custom_label,
+						FontConfiguration = _sparse(
+							FontColor = self.font_color,
+							FontDecoration = self.font_decoration,
+							FontSize = _sparse(
+								Relative = self.font_size
+							),
+							FontStyle = self.font_style,
+							FontWeight = _sparse(
+								Name = self.font_weight
+							)
+						),
+						Visibility = self.title_options_visibility
+					)
+				),
+				SelectableValues = _sparse(
+					LinkToDataSetColumn = _sparse(
+						ColumnName = self.column_name,
+						DataSetIdentifier = self.data_set_identifier					
+					),
+					Values = clean_dict(self.values)
+				),
+				Type = self.type
+			)
+		)
+		return self.json
+	
+class ParameterSliderControl(ParameterControl):
+	def __init__(self, parameter_control_id, parameter, title, maximum_value, minimum_value, step_size):
+		ParameterControl.__init__(self, parameter_control_id, parameter, title)
+		self.maximum_value = maximum_value
+		self.minimum_value = minimum_value
+		self.step_size = step_size
+
+	def compile(self):
+		self.json = _sparse(
+			Slider = _sparse(
+				MaximumValue = self.maximum_value,
+				MinimumValue = self.minimum_value,
+				ParameterControlId = self.id,
+				SourceParameterName = self.source_parameter_name,
+				StepSize = self.step_size,
+				Title = self.title,
+				DisplayOptions = _sparse(
+					TitleOptions = _sparse(
+						CustomLabel = self.custom_label,
+						FontConfiguration = _sparse(
+							FontColor = self.font_color,
+							FontDecoration = self.font_decoration,
+							FontSize = _sparse(
+								Relative = self.font_size
+							),
+							FontStyle = self.font_style,
+							FontWeight = _sparse(
+								Name = self.font_weight
+							)
+						),
+						Visibility = self.title_options_visibility
+					)
+				)
+			)
+		)
+		return self.json
+	
+class ParameterTextAreaControl(ParameterControl):
+	def __init__(self, parameter_control_id, parameter, title):
+		ParameterControl.__init__(self, parameter_control_id, parameter, title)
+		self.delimiter = ""
+		self.placeholder_options_visibility = ""
+
+	def compile(self):
+		self.json = _sparse(
+			TextArea = _sparse(
+				ParameterControlId = self.id,
+				SourceParameterName = self.source_parameter_name,
+				Title = self.title,
+				Delimiter = self.delimiter,
+				DisplayOptions = _sparse(
+					PlaceholderOptions = _sparse(
+						Visibility = self.placeholder_options_visibility
+					),
+					TitleOptions = _sparse(
+						CustomLabel = self.custom_label,
+						FontConfiguration = _sparse(
+							FontColor = self.font_color,
+							FontDecoration = self.font_decoration,
+							FontSize = _sparse(
+								Relative = self.font_size
+							),
+							FontStyle = self.font_style,
+							FontWeight = _sparse(
+								Name = self.font_weight
+							)
+						),
+						Visibility = self.title_options_visibility
+					)
+				)
+			)
+		)
+		return self.json
+	
+class ParameterTextFieldControl(ParameterControl):
+	def __init__(self, parameter_control_id, parameter, title):
+		ParameterControl.__init__(self, parameter_control_id, parameter, title)
+		self.placeholder_options_visibility = ""
+
+	def compile(self):
+		self.json = _sparse(
+			TextArea = _sparse(
+				ParameterControlId = self.id,
+				SourceParameterName = self.source_parameter_name,
+				Title = self.title,
+				DisplayOptions = _sparse(
+					PlaceholderOptions = _sparse(
+						Visibility = self.placeholder_options_visibility
+					),
+					TitleOptions = _sparse(
+						CustomLabel = self.custom_label,
+						FontConfiguration = _sparse(
+							FontColor = self.font_color,
+							FontDecoration = self.font_decoration,
+							FontSize = _sparse(
+								Relative = self.font_size
+							),
+							FontStyle = self.font_style,
+							FontWeight = _sparse(
+								Name = self.font_weight
+							)
+						),
+						Visibility = self.title_options_visibility
+					)
+				)
+			)
+		)
+		return self.json
+
+### FILTER CONTROLS ###
+class FilterControl(CompiledObject):
+	def __init__(self, filter_control_id, source_filter_id, title):
+		# ID of filter control
+		self.id = filter_control_id
+		self.element_type = "FILTER_CONTROL"
+		# Name of source filter
+		self.source_filter_id = source_filter_id
+		# Title of filter control
+		self.title = title
+
+		self.custom_label = ""
+		self.font_color = ""
+		self.font_decoration = ""
+		self.font_size = ""
+		self.font_style = ""
+		self.font_weight = ""
+		self.title_options_visibility = ""
+
+	# Returns a copy of this control with a new id, like ParameterControl.clone
+	def clone(self, new_id, **overrides):
+		return self._clone("id", new_id)._override(overrides)
+
+class FilterDateTimePickerControl(FilterControl):
+	def __init__(self, filter_control_id, source_filter_id, title):
+		FilterControl.__init__(self, filter_control_id, source_filter_id, title)
+
+		self.type = ""
+		self.date_time_format = ""
+	
+	def set_date_time_format(self, date_time_format):
+		self.date_time_format = date_time_format
+
+	def compile(self):
+		self.json = _sparse(
+			DateTimePicker = _sparse(
+				FilterControlId = self.id,
+				SourceFilterId = self.source_filter_id,
+				Title = self.title,
+				DisplayOptions = _sparse(
+					DateTimeFormat = self.date_time_format,
+					TitleOptions = _sparse(
+						CustomLabel = self.custom_label,
+						FontConfiguration = _sparse(
+							FontColor = self.font_color,
+							FontDecoration = self.font_decoration,
+							FontSize = _sparse(
+								Relative = self.font_size
+							),
+							FontStyle = self.font_style,
+							FontWeight = _sparse(
+								Name = self.font_weight
+							),
+						Visibility = self.title_options_visibility
+						),
+					)
+				),
+				Type = self.type
+			)
+		)
+
+		return self.json
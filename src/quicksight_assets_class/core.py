@@ -0,0 +1,835 @@
+import functools
+import json
+import threading
+
+### COMPILE CACHE ###
+# Number of objects that were compiled again and that returned their cached output during the last Analysis.compile()
+# in the current thread. Counts are kept per thread, so compiles in other threads do not interfere. Sheets compiled
+# by an executor count towards the thread that started the compile (see _compile_object).
+_compile_stats = threading.local()
+
+def _stats():
+	try:
+		return _compile_stats.counts
+	except AttributeError:
+		_compile_stats.counts = {"recompiled": 0, "reused": 0}
+		return _compile_stats.counts
+
+def get_compile_stats():
+	return dict(_stats())
+
+def reset_compile_stats():
+	_compile_stats.counts = {"recompiled": 0, "reused": 0}
+
+# List and dict settings that slotted classes (visuals, filters, parameters) only allocate when they are first used.
+# Until then, reading one of them returns a read-only empty value (see _UnsetList), so compiling an object
+# does not allocate them either.
+_LAZY_FIELDS = {
+	"default_value": dict,
+	"configuration": dict,
+	"actions": list,
+	"title": dict,
+	"subtitle": dict,
+	"column_hierarchies": list,
+	"conditional_formatting": dict,
+	"sizes": list,
+	"category": list,
+	"values": list,
+	"colors": list,
+	"small_multiples": list,
+	"groups": list,
+	"unaggregated_values": list,
+	"field_sort": list,
+	"inline_visualizations": list,
+	"conditional_formatting_options": list,
+	"cell_border": dict,
+	"header_border": dict,
+	"target_values": list,
+	"trend_groups": list,
+	"x_axis": list,
+	"y_axis": list,
+	"breakdowns": list,
+	"geospatial": list,
+	"columns": list,
+	"rows": list,
+}
+
+# Read-only empty values that unset lazy fields read as. Changing one raises instead of losing the change,
+# because the value is not stored on the object.
+def _unset_field(self, *args, **kwargs):
+	raise TypeError("this setting was never set and reads as a read-only empty value; assign a new list or dict to it, or use the add_* and set_* methods")
+
+class _UnsetList(tuple):
+	__slots__ = ()
+	append = extend = insert = remove = pop = clear = sort = reverse = _unset_field
+	__setitem__ = __delitem__ = __iadd__ = __imul__ = _unset_field
+
+class _UnsetDict(dict):
+	__slots__ = ()
+	update = setdefault = pop = popitem = clear = _unset_field
+	__setitem__ = __delitem__ = __ior__ = _unset_field
+
+_UNSET_VALUES = {list: _UnsetList(), dict: _UnsetDict()}
+
+class CompiledObject():
+	# Base class for objects that cache the output of compile().
+	# Any add_* or set_* call, or a direct assignment to a public attribute, marks the object as dirty.
+	# A clean object returns its cached output, unless one of its children (see _children) is dirty.
+	# Subclasses without __slots__ keep a regular __dict__.
+	# _shared holds the names of list and dict attributes that are shared with a clone (see _clone)
+	# _version goes up each time the object is compiled again, and _child_versions holds (child, version) of the
+	# children the cached output was built from. A child can be compiled again through another parent, or on its own,
+	# and is then clean, so its parents compare versions to see that their output is out of date.
+	__slots__ = ("_dirty", "_compiled", "_shared", "_version", "_child_versions", "json")
+
+	def __new__(cls, *args, **kwargs):
+		self = object.__new__(cls)
+		self._dirty = True
+		self._compiled = None
+		self._shared = None
+		self._version = 0
+		self._child_versions = ()
+		return self
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+		for name, method in list(vars(cls).items()):
+			if not callable(method):
+				continue
+			if name == "compile":
+				setattr(cls, name, _cached_compile(method))
+			elif name.startswith("add_") or name.startswith("set_"):
+				setattr(cls, name, _marks_dirty(method))
+
+	def __getattr__(self, name):
+		# Only called when the attribute was never set
+		if name in _LAZY_FIELDS and hasattr(type(self), name):
+			return _UNSET_VALUES[_LAZY_FIELDS[name]]
+		raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+	# Returns the list stored under name so that it can be appended to, allocating it on first use.
+	# A list that is still shared with a clone is copied first.
+	def _field_well(self, name):
+		try:
+			field_well = object.__getattribute__(self, name)
+		except AttributeError:
+			field_well = []
+			setattr(self, name, field_well)
+			return field_well
+		if self._shared and name in self._shared:
+			field_well = list(field_well)
+			setattr(self, name, field_well)
+			self._shared = self._shared - {name}
+		return field_well
+
+	# Returns a copy of this object with new_id stored under id_name. Visuals, sheets, filter groups and controls
+	# expose it as clone(); the other objects cannot be cloned.
+	# The copy shares its field wells and other lists and dicts with this object until either of them changes 
+	# one (copy-on-write), so cloning costs the same no matter how many fields were added.
+	def _clone(self, id_name, new_id):
+		state = self.__getstate__()
+		state.pop("_shared", None)
+		shared = frozenset(name for name, value in state.items() if type(value) in (list, dict))
+
+		clone = type(self).__new__(type(self))
+		clone.__setstate__(state)
+		clone._shared = shared
+		self._shared = shared if not self._shared else self._shared | shared
+
+		setattr(clone, id_name, new_id)
+		return clone
+
+	# Sets the keyword arguments given to clone(), for example orientation = "VERTICAL"
+	def _override(self, overrides):
+		for name, value in overrides.items():
+			if not hasattr(self, name):
+				raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+			setattr(self, name, value)
+		return self
+
+	def __setattr__(self, name, value):
+		object.__setattr__(self, name, value)
+		if not name.startswith("_") and name != "json":
+			object.__setattr__(self, "_dirty", True)
+
+	def _children(self):
+		return []
+
+	def is_dirty(self):
+		if self._dirty or self._compiled is None:
+			return True
+		children = self._children()
+		if len(children) != len(self._child_versions):
+			return True
+		for child, (compiled_child, version) in zip(children, self._child_versions):
+			if child is not compiled_child or child._version != version or child.is_dirty():
+				return True
+		return False
+
+	def mark_dirty(self):
+		self._dirty = True
+
+	# The cached output is not pickled, so objects sent to a process pool stay small
+	def __getstate__(self):
+		state = dict(getattr(self, "__dict__", {}))
+		for name in _slot_names(type(self)):
+			try:
+				state[name] = object.__getattribute__(self, name)
+			except AttributeError:
+				pass
+		state.pop("_compiled", None)
+		state.pop("_child_versions", None)
+		state.pop("json", None)
+		return state
+
+	def __setstate__(self, state):
+		for name, value in state.items():
+			object.__setattr__(self, name, value)
+		self._dirty = True
+		self._compiled = None
+		self._child_versions = ()
+
+def _slot_names(cls):
+	names = []
+	for klass in cls.__mro__:
+		slots = vars(klass).get("__slots__", ())
+		names.extend([slots] if isinstance(slots, str) else slots)
+	return names
+
+def _cached_compile(compile):
+	@functools.wraps(compile)
+	def wrapper(self):
+		if not self.is_dirty():
+			_stats()["reused"] += 1
+			return self._compiled
+		return _store_compiled(self, compile(self))
+	return wrapper
+
+# Caches the output of an object that was just compiled, from its children's current versions
+def _store_compiled(compiled_object, compiled):
+	compiled_object._compiled = compiled
+	compiled_object._dirty = False
+	compiled_object._version += 1
+	compiled_object._child_versions = tuple((child, child._version) for child in compiled_object._children())
+	_stats()["recompiled"] += 1
+	return compiled
+
+def _marks_dirty(setter):
+	@functools.wraps(setter)
+	def wrapper(self, *args, **kwargs):
+		self._dirty = True
+		return setter(self, *args, **kwargs)
+	return wrapper
+
+### SPARSE BUILDERS ###
+# Builds a compiled dict that only holds the keys whose values are set, so compiled output never has to be cleaned.
+# Values are dropped the same way clean_dict drops them: None, "", {} and [] (0 and False are kept).
+# Lists and dicts passed in by the caller (lists of values, dataset declarations, ...) go through clean_dict first.
+# Nested dicts are expected to be built with _sparse already; lists are filtered one level deep.
+# Lists are always copied, so a later add_* call on the object that owns the list does not change earlier output.
+# Keys that are not valid Python names can be passed in a dict as the first argument.
+def _sparse(_mapping = None, /, **items):
+	if _mapping is not None:
+		_mapping.update(items)
+		items = _mapping
+
+	empty_keys = None
+	for key, value in items.items():
+		if type(value) is list:
+			value = [item for item in value if item or item == 0]
+			items[key] = value
+		if not (value or value == 0):
+			if empty_keys is None:
+				empty_keys = []
+			empty_keys.append(key)
+
+	if empty_keys is not None:
+		for key in empty_keys:
+			del items[key]
+	return items
+
+class Analysis():
+	def __init__(self, aws_account_id, analysis_id, analysis_name):
+		# The ID of the AWS account where you are creating an analysis.
+		self.aws_account_id = aws_account_id
+
+		# The ID for the analysis that you're creating. This ID displays in the URL of the analysis.
+		self.analysis_id = analysis_id
+
+		# A descriptive name for the analysis that you're creating. 
+		# This name displays for the analysis in the Amazon QuickSight console.
+		self.analysis_name = analysis_name
+
+		# A definition is the data model of all features in a Dashboard, Template, or Analysis.
+		#Either a SourceEntity or a Definition must be provided in order for the request to be valid.
+		# The Definition object is kept as-is and only compiled when the analysis is compiled, 
+		# so changes made to its sheets, visuals or filters after they are added are not lost.
+		self.definition = None
+
+		# The parameter names and override values that you want to use.
+		self.parameters = {}
+
+		# A structure that describes the principals and the resource-level permissions on an analysis. 
+		# You can use the Permissions structure to grant permissions by providing a list of 
+		# AWS Identity and Access Management (IAM) action information for each principal listed by Amazon Resource Name (ARN).
+		self.permissions = []
+
+		# A source entity to use for the analysis that you're creating. 
+		# This metadata structure contains details that describe a source template and one or more datasets.
+		self.source_entity = {}
+
+		# Contains a map of the key-value pairs for the resource tag or tags assigned to the analysis.
+		self.tags = []
+
+		# The ARN for the theme to apply to the analysis that you're creating.
+		self.theme_arn = ""
+
+	def add_tag(self, tag_key, tag_value):
+		self.tags.append(_sparse(Key = tag_key,Value = tag_value))
+
+	def add_permission(self, actions, principal):
+		self.permissions.append(_sparse(Actions = clean_dict(actions), Principal = principal))
+
+	def add_definition(self, definition):
+		self.definition = definition
+
+	def set_theme_arn(self, theme_arn):
+		self.theme_arn = theme_arn
+
+	# Returns a Dashboard that publishes this analysis. It shares the Definition object, so compiling both
+	# compiles the definition once. Parameters, tags and the theme are copied; permissions are not, because
+	# dashboards take different actions.
+	def to_dashboard(self, dashboard_id, dashboard_name = None):
+		dashboard = Dashboard(self.aws_account_id, dashboard_id, dashboard_name or self.analysis_name)
+		dashboard.definition = self.definition
+		dashboard.parameters = self.parameters
+		dashboard.tags = list(self.tags)
+		dashboard.theme_arn = self.theme_arn
+		return dashboard
+
+	# Returns a Template built from this analysis. It shares the Definition object, like to_dashboard.
+	def to_template(self, template_id, template_name = None):
+		template = Template(self.aws_account_id, template_id, template_name or self.analysis_name)
+		template.definition = self.definition
+		template.tags = list(self.tags)
+		return template
+
+	# Every object compiles to sparse output (see _sparse), so the result does not need to be cleaned.
+	# Pass a concurrent.futures executor (ThreadPoolExecutor or ProcessPoolExecutor) to compile 
+	# the sheets of the definition in parallel. Sheets are merged back in their original order, so the output 
+	# is the same as a serial compile. With a process pool, compiled sheets are not cached in this process.
+	# The result is a copy that the caller can change. With shared = True, the cached output itself is returned
+	# without copying it; it is then read-only, since later compiles reuse its sheets, visuals and filters.
+	def compile(self, executor = None, shared = False):
+		reset_compile_stats()
+		self.json = self._compile_header(_compile_definition(self.definition, executor))
+		return self.json if shared else _copy_tree(self.json)
+
+	def _compile_header(self, definition_json):
+		return _sparse(
+			AwsAccountId = self.aws_account_id,
+		    AnalysisId = self.analysis_id,
+		    Name = self.analysis_name,
+		    Definition = definition_json,
+		    Parameters = clean_dict(self.parameters),
+		    Permissions = self.permissions,
+		    SourceEntity = clean_dict(self.source_entity),
+		    Tags = self.tags,
+		    ThemeArn = self.theme_arn
+		)
+
+### DASHBOARD ###
+class Dashboard():
+	def __init__(self, aws_account_id, dashboard_id, dashboard_name):
+		# The ID of the AWS account where you want to create the dashboard.
+		self.aws_account_id = aws_account_id
+
+		# The ID for the dashboard, also added to the IAM policy.
+		self.dashboard_id = dashboard_id
+
+		# The display name of the dashboard.
+		self.dashboard_name = dashboard_name
+
+		# The Definition object, usually shared with the Analysis the dashboard publishes (see Analysis.to_dashboard).
+		# Its compiled output is cached, so it is not compiled again for the dashboard.
+		self.definition = None
+
+		# The parameters for the creation of the dashboard, which you want to use to override the default settings.
+		self.parameters = {}
+
+		# A structure that contains the permissions of the dashboard.
+		self.permissions = []
+
+		# The entity that you are using as a source when you create the dashboard, instead of a definition.
+		self.source_entity = {}
+
+		# Contains a map of the key-value pairs for the resource tag or tags assigned to the dashboard.
+		self.tags = []
+
+		# A description for the first version of the dashboard being created, or for the new version of an update.
+		self.version_description = ""
+
+		# Options for publishing the dashboard, for example AdHocFilteringOption or ExportToCSVOption.
+		self.publish_options = {}
+
+		# The Amazon Resource Name (ARN) of the theme that is being used for this dashboard.
+		self.theme_arn = ""
+
+	def add_tag(self, tag_key, tag_value):
+		self.tags.append(_sparse(Key = tag_key,Value = tag_value))
+
+	def add_permission(self, actions, principal):
+		self.permissions.append(_sparse(Actions = clean_dict(actions), Principal = principal))
+
+	def add_definition(self, definition):
+		self.definition = definition
+
+	def set_theme_arn(self, theme_arn):
+		self.theme_arn = theme_arn
+
+	def set_version_description(self, version_description):
+		self.version_description = version_description
+
+	# Sets one of the publish options that take an availability status, for example
+	# set_publish_option("ExportToCSVOption", "DISABLED"). availability_status: ENABLED | DISABLED
+	def set_publish_option(self, option, availability_status):
+		self.publish_options[option] = _sparse(AvailabilityStatus = availability_status)
+
+	# visibility_state: EXPANDED | COLLAPSED
+	def set_sheet_controls_option(self, visibility_state):
+		self.publish_options["SheetControlsOption"] = _sparse(VisibilityState = visibility_state)
+
+	# availability_status: ENABLED | DISABLED
+	def set_export_hidden_fields_option(self, availability_status):
+		self.publish_options["VisualPublishOptions"] = _sparse(
+			ExportHiddenFieldsOption = _sparse(AvailabilityStatus = availability_status)
+		)
+
+	# Returns a copy, or the cached output with shared = True, like Analysis.compile
+	def compile(self, executor = None, shared = False):
+		reset_compile_stats()
+		self.json = _sparse(
+			AwsAccountId = self.aws_account_id,
+			DashboardId = self.dashboard_id,
+			Name = self.dashboard_name,
+			Definition = _compile_definition(self.definition, executor),
+			Parameters = clean_dict(self.parameters),
+			Permissions = self.permissions,
+			SourceEntity = clean_dict(self.source_entity),
+			Tags = self.tags,
+			VersionDescription = self.version_description,
+			DashboardPublishOptions = dict(self.publish_options),
+			ThemeArn = self.theme_arn
+		)
+		return self.json if shared else _copy_tree(self.json)
+
+### TEMPLATE ###
+class Template():
+	def __init__(self, aws_account_id, template_id, template_name):
+		# The ID for the AWS account that the group is in.
+		self.aws_account_id = aws_account_id
+
+		# An ID for the template that you want to create. This template is unique per Amazon Web Services Region.
+		self.template_id = template_id
+
+		# A display name for the template.
+		self.template_name = template_name
+
+		# The Definition object, usually shared with an Analysis (see Analysis.to_template).
+		# Its dataset declarations become the template's dataset placeholders.
+		self.definition = None
+
+		# A list of resource permissions to be set on the template.
+		self.permissions = []
+
+		# The entity that you are using as a source when you create the template, instead of a definition.
+		self.source_entity = {}
+
+		# Contains a map of the key-value pairs for the resource tag or tags assigned to the resource.
+		self.tags = []
+
+		# A description of the current template version being created.
+		self.version_description = ""
+
+	def add_tag(self, tag_key, tag_value):
+		self.tags.append(_sparse(Key = tag_key,Value = tag_value))
+
+	def add_permission(self, actions, principal):
+		self.permissions.append(_sparse(Actions = clean_dict(actions), Principal = principal))
+
+	def add_definition(self, definition):
+		self.definition = definition
+
+	def set_version_description(self, version_description):
+		self.version_description = version_description
+
+	# Creates the template from an existing analysis instead of a definition.
+	# data_set_references maps each dataset placeholder to the ARN of the dataset the analysis uses.
+	def set_source_analysis(self, analysis_arn, data_set_references):
+		self.definition = None
+		self.source_entity = _sparse(
+			SourceAnalysis = _sparse(
+				Arn = analysis_arn,
+				DataSetReferences = [
+					_sparse(DataSetPlaceholder = placeholder, DataSetArn = data_set_arn)
+					for placeholder, data_set_arn in data_set_references.items()
+				]
+			)
+		)
+
+	# Returns a copy, or the cached output with shared = True, like Analysis.compile
+	def compile(self, executor = None, shared = False):
+		reset_compile_stats()
+		definition_json = _compile_definition(self.definition, executor)
+
+		# Templates name datasets by placeholder instead of declaring them with an ARN
+		if definition_json:
+			definition_json = dict(definition_json)
+			declarations = definition_json.pop("DataSetIdentifierDeclarations", [])
+			definition_json["DataSetConfigurations"] = [_sparse(Placeholder = declaration.get("Identifier")) for declaration in declarations]
+
+		self.json = _sparse(
+			AwsAccountId = self.aws_account_id,
+			TemplateId = self.template_id,
+			Name = self.template_name,
+			Definition = definition_json,
+			Permissions = self.permissions,
+			SourceEntity = clean_dict(self.source_entity),
+			Tags = self.tags,
+			VersionDescription = self.version_description
+		)
+		return self.json if shared else _copy_tree(self.json)
+
+# Compiles the definition shared by analyses, dashboards and templates. The Definition caches its output,
+# so a dashboard or template compiled after its analysis reuses the compiled sheets, visuals and filters.
+def _compile_definition(definition, executor = None):
+	if definition is None:
+		return {}
+	if executor is None or not definition.sheets or not definition.is_dirty():
+		return definition.compile()
+
+	stats = _stats()
+	sheets = []
+	for compiled, sheet_stats in executor.map(_compile_object, definition.sheets):
+		sheets.append(compiled)
+		stats["recompiled"] += sheet_stats["recompiled"]
+		stats["reused"] += sheet_stats["reused"]
+	definition_json = definition._compile_declarations()
+	definition_json["Sheets"] = sheets
+
+	# Cached like a serial compile. Sheets compiled in another process stay dirty here, so the definition is
+	# compiled again next time.
+	definition.json = definition._finish(_sparse(definition_json))
+	return _store_compiled(definition, definition.json)
+
+class Definition(CompiledObject):
+	def __init__(self, data_set_definition):
+		# An array of dataset identifier declarations. 
+		# This mapping allows the usage of dataset identifiers instead of dataset ARNs throughout analysis sub-structures.
+		self.data_set_definition = data_set_definition
+
+		# The configuration for default analysis settings.
+		self.analysis_defaults = {}		
+
+		# An array of calculated field definitions for the analysis.
+		self.calculated_fields = []
+
+		# An array of analysis-level column configurations. 
+		# Column configurations can be used to set default formatting for a column to be used throughout an analysis.
+		self.column_configurations = []
+
+		# With column_format_hoisting, a field format that many visuals repeat for a column is written once, as the
+		# column configuration of that column, and dropped from the fields when compiling (see hoist_column_formats).
+		self.column_format_hoisting = False
+
+		# Filter definitions for an analysis.
+		self.filter_groups = []
+
+		#An array of parameter declarations for an analysis.
+		self.parameter_declarations = []
+
+		# An array of sheet definitions for an analysis. 
+		# Each SheetDefinition provides detailed information about a sheet within this analysis.
+		self.sheets = []
+
+		# Definition keys the library does not model (Options, ...), written to the output as they are.
+		# The importer keeps such keys here so that imported definitions compile back to their input.
+		self.raw_fields = {}
+
+		# Index of the IDs declared and referenced in the last compiled output, built by check_references
+		self._references = None
+
+		# What the last compile hoisted into column configurations (see column_format_report)
+		self._column_formats = None
+
+	def add_sheet(self, sheet):
+		self.sheets.append(sheet)
+
+	def add_sheets(self, sheet_list):
+		for sheet in sheet_list:
+			self.add_sheet(sheet)
+
+	def add_calculated_field(self, calculated_field):
+		self.calculated_fields.append(calculated_field)
+
+	def add_calculated_fields(self, calculated_field_list):
+		for calculated_field in calculated_field_list:
+			self.add_calculated_field(calculated_field)
+
+	def add_parameter(self, parameter):
+		self.parameter_declarations.append(parameter)
+
+	def add_parameters(self, parameter_list):
+		for parameter in parameter_list:
+			self.add_parameter(parameter)
+
+	def add_filter_group(self, filter_group):
+		self.filter_groups.append(filter_group)
+
+	def add_filter_groups(self, filter_group_list):
+		for filter_group in filter_group_list:
+			self.add_filter_group(filter_group)
+
+	# Sets the default format of a column for the whole analysis, replacing an earlier configuration of the column.
+	# format_configuration holds one of StringFormatConfiguration, NumberFormatConfiguration or DateTimeFormatConfiguration.
+	def add_column_configuration(self, column_name, data_set_identifier, format_configuration = None, role = ""):
+		column_configuration = _sparse(
+			Column = _sparse(
+				ColumnName = column_name,
+				DataSetIdentifier = data_set_identifier
+			),
+			FormatConfiguration = clean_dict(format_configuration),
+			Role = role
+		)
+		column_configurations = self._field_well("column_configurations")
+		for position, existing in enumerate(column_configurations):
+			if existing.get("Column") == column_configuration["Column"]:
+				column_configurations[position] = column_configuration
+				return
+		column_configurations.append(column_configuration)
+
+	def set_column_format_hoisting(self, column_format_hoisting = True):
+		self.column_format_hoisting = column_format_hoisting
+
+	def _children(self):
+		return self.calculated_fields + self.filter_groups + self.parameter_declarations + self.sheets
+
+	def set_analysis_default(self):
+		self.analysis_defaults = _sparse(
+
+				DefaultNewSheetConfiguration = _sparse(
+					InteractiveLayoutConfiguration = _sparse(
+						FreeForm = _sparse(
+							CanvasSizeOptions = _sparse(
+								ScreenCanvasSizeOptions = _sparse(
+									OptimizedViewPortWidth = "1600px"
+								)
+							)
+						)
+						# "Grid": {
+						# 	"CanvasSizeOptions": {
+						# 		"ScreenCanvasSizeOptions": {
+						# 			"ResizeOption": "FIXED",
+						# 			"OptimizedViewPortWidth": "1600px"
+						# 		}
+						# 	}
+						# }
+					),
+					PaginatedLayoutConfiguration = {
+
+					},
+					SheetContentType = "INTERACTIVE"
+				)
+			)
+	
+	def compile(self):
+		self.json = self._finish(_sparse(self._compile_declarations(), Sheets = [sheet.compile() for sheet in self.sheets]))
+
+		return self.json
+
+	# Hoists repeated field formats into column configurations if enabled, and indexes the IDs of the output
+	# payload and references are imported here and in check_references rather than at the top of the module,
+	# so that compiling without these features does not load them (see _SUBMODULES in __init__)
+	def _finish(self, definition_json):
+		self._references = None
+		self._column_formats = None
+		if self.column_format_hoisting:
+			from .payload import hoist_column_formats
+			definition_json, self._column_formats = hoist_column_formats(definition_json)
+		return definition_json
+
+	# Returns a ColumnFormatReport of the formats the last compile moved into column configurations and the bytes
+	# that saved, or None when column_format_hoisting is not set
+	def column_format_report(self):
+		if not self.column_format_hoisting:
+			return None
+		if self._column_formats is None or self.is_dirty():
+			self.compile()
+		return self._column_formats
+
+	# Returns the dangling references and duplicate IDs of the definition as ValidationIssue, for example a layout
+	# element whose visual was never added to the sheet, or a control whose parameter is not declared.
+	# The index is built from the compiled output on the first call after the definition changed, so compiling
+	# does not pay for it and calling this again is free.
+	def check_references(self):
+		if self._references is None or self.is_dirty():
+			from .references import ReferenceIndex
+			definition_json = self.compile()
+			self._references = ReferenceIndex(definition_json)
+		return self._references.issues
+
+	# Everything in the definition except its sheets, which can then be compiled separately
+	def _compile_declarations(self):
+		return _sparse(
+		    clean_dict(self.raw_fields),
+		    DataSetIdentifierDeclarations = clean_dict(self.data_set_definition),
+		    AnalysisDefaults = clean_dict(self.analysis_defaults),
+		    CalculatedFields = [calculated_field.compile() for calculated_field in self.calculated_fields],
+		    ColumnConfigurations = clean_dict(self.column_configurations),
+		    FilterGroups = [filter_group.compile() for filter_group in self.filter_groups],
+		    ParameterDeclarations = [parameter.compile() for parameter in self.parameter_declarations]
+		)
+
+### CALCULATED FIELDS ###
+class CalculatedField(CompiledObject):
+	def __init__(self, data_set_identifier, expression, name):
+		# The data set that is used in this calculated field.
+		self.data_set_identifier = data_set_identifier
+
+		# The expression of the calculated field.
+		self.expression = expression
+
+		# The name of the calculated field.
+		self.name = name
+
+	def compile(self):
+		self.json = _sparse(
+			DataSetIdentifier = self.data_set_identifier,
+			Expression = self.expression,
+			Name = self.name
+		)
+
+		return self.json
+	
+
+# Recursive function to remove parameters with empty values from dictionary object.
+# Each node is cleaned exactly once: children are cleaned first and the cleaned result is reused
+# both to decide whether the key survives and as the value that is kept.
+def clean_dict(input):
+	if type(input) is dict:
+		cleaned = {}
+		for key, value in input.items():
+			if value or value == 0:
+				value = clean_dict(value)
+				if value not in _EMPTY_VALUES:
+					cleaned[key] = value
+		return cleaned
+	elif type(input) is list:
+		cleaned = []
+		for item in input:
+			if item or item == 0:
+				item = clean_dict(item)
+				if item not in _EMPTY_VALUES:
+					cleaned.append(item)
+		return cleaned
+	else:
+		if input or input == 0:
+			return input
+
+# Values that are dropped from the compiled output once their children have been cleaned
+_EMPTY_VALUES = ({}, [], "")
+
+# Returns a copy of compiled output in which every dict and list is new, so that the caller can change it
+def _copy_tree(value):
+	if type(value) is dict:
+		return {key: _copy_tree(child) for key, child in value.items()}
+	if type(value) is list:
+		return [_copy_tree(child) for child in value]
+	return value
+
+# Compiles a sheet in an executor worker and returns its output with the worker's compile stats, which
+# _compile_definition adds to the stats of the thread that started the compile.
+# Module-level so that it can be sent to a process pool
+def _compile_object(compiled_object):
+	outer_stats = _stats()
+	reset_compile_stats()
+	try:
+		return compiled_object.compile(), get_compile_stats()
+	finally:
+		# An executor that runs the call in the calling thread keeps that thread's stats
+		_compile_stats.counts = outer_stats
+
+
+# Writes the analysis to a file handle as JSON, producing the same text as json.dumps(analysis.compile(), indent=indent).
+# Nothing is joined into a single string, and sheets are compiled and written one at a time: a sheet that was not
+# compiled before is compiled, written and then let go, so memory does not grow with the number of sheets.
+# Sheets that were already compiled keep their cached output. With column_format_hoisting set, the definition is
+# compiled as a whole first, because hoisting looks at every sheet.
+# Set compact to True to write without indentation or whitespace between separators.
+def dump_analysis(analysis, outfile, indent=6, compact=False):
+	definition = analysis.definition
+	if definition is None or definition.column_format_hoisting or not definition.sheets or not definition.is_dirty():
+		analysis_json = analysis.compile(shared = True)
+	else:
+		reset_compile_stats()
+		definition_json = definition._compile_declarations()
+		definition_json["Sheets"] = _SheetStream(definition.sheets)
+		analysis_json = analysis._compile_header(_sparse(definition_json))
+	if compact:
+		_write_json(analysis_json, outfile.write, None, ",", ":", 0)
+	else:
+		_write_json(analysis_json, outfile.write, indent, ",", ": ", 0)
+
+# Stands in for the compiled sheets of a definition in dump_analysis, which compiles them as they are written
+class _SheetStream():
+	def __init__(self, sheets):
+		self.sheets = sheets
+
+	def __bool__(self):
+		return bool(self.sheets)
+
+	# Yields (None, compiled sheet) like the items of a list. Once a sheet is written, the output of the sheet and
+	# of its children is dropped again, unless it was cached before.
+	def items(self):
+		for sheet in self.sheets:
+			uncached = [compiled_object for compiled_object in [sheet] + sheet._children() if compiled_object.is_dirty()]
+			yield None, sheet.compile()
+			for compiled_object in uncached:
+				compiled_object._compiled = None
+				compiled_object.json = None
+
+def _write_json(value, write, indent, item_separator, key_separator, level):
+	if type(value) is dict:
+		items = value.items()
+		opening, closing = "{", "}"
+	elif type(value) is list:
+		items = [(None, child) for child in value]
+		opening, closing = "[", "]"
+	elif type(value) is _SheetStream:
+		items = value.items()
+		opening, closing = "[", "]"
+	else:
+		write(json.dumps(value))
+		return
+
+	if not items:
+		write(opening + closing)
+		return
+
+	if indent is None:
+		separator = item_separator
+		closing_indent = ""
+		child_indent = ""
+	else:
+		child_indent = "\n" + " " * (indent * (level + 1))
+		closing_indent = "\n" + " " * (indent * level)
+		separator = item_separator + child_indent
+
+	write(opening + child_indent)
+	for position, (key, child) in enumerate(items):
+		if position:
+			write(separator)
+		if key is not None:
+			write(json.dumps(key) + key_separator)
+		_write_json(child, write, indent, item_separator, key_separator, level + 1)
+	write(closing_indent + closing)
@@ -0,0 +1,200 @@
+from .core import CompiledObject, _sparse, clean_dict
+
+### FILTER GROUP ###
+class FilterGroup(CompiledObject):
+	def __init__(self,cross_dataset, filter_group_id):
+		self.id = filter_group_id
+		self.cross_dataset = cross_dataset
+		self.filters = []
+		self.sheet_visual_scoping_configurations = []
+		self.status = ""
+
+	def add_filter(self, filter):
+		self._field_well("filters").append(filter)
+
+	def add_filters(self, filter_list):
+		for filter in filter_list:
+			self.add_filter(filter)
+
+	def _children(self):
+		return self.filters
+
+	# Returns a copy of this filter group with a new id. Its filters are cloned too, with id_suffix 
+	# (by default "-" + new_id) added to their filter IDs, since filter IDs must be unique in the analysis.
+	# Keyword arguments replace attributes on the copy, for example status = "DISABLED".
+	def clone(self, new_id, id_suffix = None, **overrides):
+		if id_suffix is None:
+			id_suffix = "-" + new_id
+		clone = self._clone("id", new_id)
+		clone.filters = [filter._clone("filter_id", filter.filter_id + id_suffix) for filter in self.filters]
+		return clone._override(overrides)
+
+	def add_scope_configuration(self, scope, sheet_id, visual_ids = None):
+		self._field_well("sheet_visual_scoping_configurations").append(_sparse(
+			Scope = scope,
+			SheetId = sheet_id,
+			VisualIds = clean_dict(visual_ids)
+		))
+	
+	def set_status(self, status):
+		self.status = status
+
+	def compile(self):
+		self.json = _sparse(
+			CrossDataset = self.cross_dataset,
+			FilterGroupId = self.id,
+			Filters = [filter.compile() for filter in self.filters],
+			ScopeConfiguration = _sparse(
+				SelectedSheets = _sparse(
+					SheetVisualScopingConfigurations = self.sheet_visual_scoping_configurations
+					)
+				),
+			Status = self.status
+		)
+
+		return self.json
+
+### FILTERS ###
+class Filter(CompiledObject):
+	__slots__ = ("filter_id", "column_name", "data_set_identifier")
+
+	def __init__(self, filter_id, column_name, data_set_identifier):
+
+		self.filter_id = filter_id
+		self.column_name = column_name
+		self.data_set_identifier = data_set_identifier
+class CategoryFilter(Filter):
+	__slots__ = ("configuration",)
+
+	def __init__(self, filter_id, column_name, data_set_identifier):
+		Filter.__init__(self, filter_id, column_name, data_set_identifier)
+	
+	def add_custom_filter_configuration(self, match_operator, null_option, category_value = "", parameter_name = "", select_all_options = ""):
+		self.configuration = _sparse(
+			CustomFilterConfiguration = _sparse(
+				MatchOperator = match_operator,
+				NullOption = null_option,
+				CategoryValue = category_value,
+				ParameterName = parameter_name,
+				SelectAllOptions = select_all_options
+			)
+		)
+
+	def add_custom_filter_list_configuration(self, match_operator, null_option, category_values = None, select_all_options = ""):
+		self.configuration = _sparse(
+			CustomFilterListConfiguration = _sparse(
+				MatchOperator = match_operator,
+				NullOption = null_option,
+				CategoryValues = clean_dict(category_values),
+				SelectAllOptions = select_all_options
+			)
+		)
+
+	def add_filter_list_configuration(self, match_operator, category_values = None, select_all_options = ""):
+		self.configuration = _sparse(
+			FilterListConfiguration = _sparse(
+				MatchOperator = match_operator,
+				CategoryValues = clean_dict(category_values),
+				SelectAllOptions = select_all_options
+			)
+		)
+
+	def compile(self):
+		self.json = _sparse(
+			CategoryFilter = _sparse(
+				FilterId = self.filter_id,
+				Column = _sparse(
+					DataSetIdentifier = self.data_set_identifier,
+					ColumnName = self.column_name
+				),
+				Configuration = self.configuration
+			)
+		)
+		return self.json
+	
+class NumericEqualityFilter(Filter):
+	__slots__ = ("match_operator", "null_option", "select_all_options", "value", "parameter_name")
+
+	def __init__(self, filter_id, column_name, data_set_identifier, match_operator, null_option):
+		Filter.__init__(self, filter_id, column_name, data_set_identifier)
+		
+		self.match_operator = match_operator
+		self.null_option = null_option
+		self.select_all_options = ""
+		self.value = ""
+		self.parameter_name = ""
+	
+	def set_value(self, value):
+		self.value = value
+
+	def compile(self):
+		self.json = _sparse(
+			NumericEqualityFilter = _sparse(
+				FilterId = self.filter_id,
+				Column = _sparse(
+					DataSetIdentifier = self.data_set_identifier,
+					ColumnName = self.column_name
+				),
+				MatchOperator = self.match_operator,
+				NullOption = self.null_option,
+				AggregationFunction = _sparse(
+					CategoricalAggrecationFunction = "",
+					DateAggregationFunction = "",
+					NumericalAggregationFunction = _sparse(
+						PercentileAggregation = _sparse(
+							PercentileValue = ""
+						),
+						SimpleNumericalAggregation = ""
+					)
+
+				),
+				ParameterName = self.parameter_name,
+				SelectAllOptions = self.select_all_options,
+				Value = self.value
+			)
+		)
+		return self.json
+class TimeRangeFilter(Filter):
+	__slots__ = ("amount", "granularity", "status", "include_maximum", "include_minimum", "max_value_parameter", "min_value_parameter", "time_granularity", "null_option")
+
+	def __init__(self, filter_id, column_name, data_set_identifier, null_option):
+		Filter.__init__(self, filter_id, column_name, data_set_identifier)
+		
+		self.amount = ""
+		self.granularity = ""
+		self.status = ""
+		self.include_maximum = ""
+		self.include_minimum = ""
+		self.max_value_parameter = ""
+		self.min_value_parameter = ""
+		self.time_granularity = ""
+
+		self.null_option = null_option
+	
+	def add_min_value_parameter(self, min_value_parameter):
+		self.min_value_parameter = min_value_parameter
+
+	def compile(self):
+		self.json = _sparse(
+			TimeRangeFilter = _sparse(
+				FilterId = self.filter_id,
+				Column = _sparse(
+					DataSetIdentifier = self.data_set_identifier,
+					ColumnName = self.column_name
+				),
+				NullOption = self.null_option,
+				ExcludePeriodConfiguration = _sparse(
+					Amount = self.amount,
+					Granularity = self.granularity,
+					Status = self.status
+				),
+				IncludeMaximum = self.include_maximum,
+				IncludeMinimum = self.include_minimum,
+				RangeMaximumValue = {},
+				RangeMinimumValue = _sparse(
+					Parameter = self.min_value_parameter
+				),
+				TimeGranularity = self.time_granularity
+			)
+		)
+		return self.json
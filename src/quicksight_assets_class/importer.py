@@ -0,0 +1,438 @@
+import inspect
+import io
+import json
+import re
+
+from .core import CompiledObject, Analysis, Definition, CalculatedField, _LAZY_FIELDS, _slot_names, clean_dict
+from .sheets import Sheet, TextBox
+from .parameters import DateTimeParameter, DecimalParameter, IntegerParameter, StringParameter
+from .controls import (
+	ParameterDateTimePickerControl, ParameterDropDownControl, ParameterListControl, ParameterSliderControl,
+	ParameterTextAreaControl, ParameterTextFieldControl, FilterDateTimePickerControl
+)
+from .filters import FilterGroup, CategoryFilter, NumericEqualityFilter, TimeRangeFilter
+from .visuals import (
+	BarChartVisual, LineChartVisual, TableVisual, PivotTableVisual, KPIVisual, PieChartVisual, ScatterPlotVisual,
+	TreeMapVisual, WaterfallVisual, FilledMapVisual, GeospatialMapVisual, FunnelChartVisual, HeatMapVisual,
+	BoxPlotVisual, GaugeChartVisual
+)
+
+### IMPORTER ###
+# Rebuilds library objects from QuickSight JSON, for example the output of DescribeAnalysisDefinition
+# or a file written by dump_analysis:
+#
+#	analysis_1 = load_analysis("analysis.json", aws_account_id = "111122223333")
+#	analysis_1.definition.sheets[0].visuals[0].set_orientation("HORIZONTAL")
+#
+# Every imported object is compiled and compared with the JSON it came from. Visuals, controls, filters and
+# other nodes that no class reproduces exactly (PivotTableVisual has no compile yet, a console setting the class
+# does not model, ...) are kept as a RawNode that compiles to its JSON unchanged. So compile() always gives back
+# the input, except for empty values (None, "", {} and []) that the library never writes.
+
+# Classes tried for each kind of node. Classes that compile to the same top-level key (ParameterTextAreaControl and
+# ParameterTextFieldControl both write TextArea) are tried in order.
+VISUAL_CLASSES = [
+	BarChartVisual, LineChartVisual, TableVisual, PivotTableVisual, KPIVisual, PieChartVisual, ScatterPlotVisual,
+	TreeMapVisual, WaterfallVisual, FilledMapVisual, GeospatialMapVisual, FunnelChartVisual, HeatMapVisual,
+	BoxPlotVisual, GaugeChartVisual
+]
+PARAMETER_CLASSES = [DateTimeParameter, DecimalParameter, IntegerParameter, StringParameter]
+PARAMETER_CONTROL_CLASSES = [
+	ParameterDateTimePickerControl, ParameterDropDownControl, ParameterListControl, ParameterSliderControl,
+	ParameterTextAreaControl, ParameterTextFieldControl
+]
+FILTER_CONTROL_CLASSES = [FilterDateTimePickerControl]
+FILTER_CLASSES = [CategoryFilter, NumericEqualityFilter, TimeRangeFilter]
+
+# A node of the definition the library has no class for. It keeps the JSON and compiles to it unchanged,
+# so it can stay in a sheet, filter group or definition next to regular objects.
+class RawNode(CompiledObject):
+	def __init__(self, raw, element_type = ""):
+		self.raw = raw
+		# The ID of the visual, control or filter, read from the first *Id key of its JSON
+		self.id = _raw_id(raw)
+		# Layout element type, for sheets that place this node in their layout
+		self.element_type = element_type
+
+	def compile(self):
+		self.json = self.raw
+		return self.json
+
+def _raw_id(raw):
+	if type(raw) is dict and len(raw) == 1:
+		raw = next(iter(raw.values()))
+	if type(raw) is dict:
+		for key, value in raw.items():
+			if key.endswith("Id") and type(value) is str:
+				return value
+	return ""
+
+# Returns an Analysis built from a DescribeAnalysisDefinition response, an analysis written by dump_analysis
+# or a bare definition. source is a dict, a path or a file object. Files are read sheet by sheet, so the
+# JSON text of a large definition is never held in memory as a whole.
+# aws_account_id is used when the JSON does not have one (DescribeAnalysisDefinition responses do not).
+def load_analysis(source, aws_account_id = ""):
+	if type(source) is dict:
+		return import_analysis(source, aws_account_id)
+
+	with _open(source) as infile:
+		stream = _JsonStream(infile)
+		header = {}
+		definition = None
+		keys = stream.iter_object()
+		for key in keys:
+			if key == "Definition":
+				definition = _import_definition_items(_definition_members(stream, stream.iter_object()))
+			elif key in _DEFINITION_KEYS:
+				# A bare definition: this key and the ones after it belong to the definition
+				definition = _import_definition_items(_definition_members(stream, _chain_first(key, keys)))
+				break
+			else:
+				header[key] = stream.decode_value()
+	return _build_analysis(header, definition, aws_account_id)
+
+# Returns a Definition built from a definition dict, path or file object (see load_analysis)
+def load_definition(source):
+	if type(source) is dict:
+		return import_definition(source)
+	with _open(source) as infile:
+		stream = _JsonStream(infile)
+		return _import_definition_items(_definition_members(stream, stream.iter_object()))
+
+def import_analysis(analysis_json, aws_account_id = ""):
+	if "Definition" not in analysis_json and any(key in analysis_json for key in _DEFINITION_KEYS):
+		return _build_analysis({}, import_definition(analysis_json), aws_account_id)
+	header = {key: value for key, value in analysis_json.items() if key != "Definition"}
+	definition = analysis_json.get("Definition")
+	return _build_analysis(header, None if definition is None else import_definition(definition), aws_account_id)
+
+def import_definition(definition_json):
+	return _import_definition_items(definition_json.items())
+
+# Yields the sheets of a definition dict, path or file object one at a time, as Sheet objects (or a RawNode for a
+# sheet that does not round-trip). Only one sheet is decoded at a time, so this is the way to go through
+# definitions that are too large to import at once.
+def iter_sheets(source):
+	if type(source) is dict:
+		for sheet_json in source.get("Definition", source).get("Sheets", []):
+			yield _import_sheet(sheet_json)
+		return
+
+	with _open(source) as infile:
+		stream = _JsonStream(infile)
+		for key in stream.iter_object():
+			if key == "Definition":
+				for key in stream.iter_object():
+					if key == "Sheets":
+						for _ in stream.iter_array():
+							yield _import_sheet(stream.decode_value())
+					else:
+						stream.skip_value()
+			elif key == "Sheets":
+				for _ in stream.iter_array():
+					yield _import_sheet(stream.decode_value())
+			else:
+				stream.skip_value()
+
+# Keys of a definition, to recognize a file that holds a bare definition
+_DEFINITION_KEYS = [
+	"DataSetIdentifierDeclarations", "Sheets", "CalculatedFields", "ParameterDeclarations", "FilterGroups",
+	"ColumnConfigurations", "AnalysisDefaults", "Options"
+]
+
+def _build_analysis(header, definition, aws_account_id):
+	analysis = Analysis(aws_account_id or header.get("AwsAccountId", ""), header.get("AnalysisId", ""), header.get("Name", ""))
+	analysis.definition = definition
+	analysis.parameters = header.get("Parameters", {})
+	analysis.permissions = header.get("Permissions", [])
+	analysis.source_entity = header.get("SourceEntity", {})
+	analysis.tags = header.get("Tags", [])
+	analysis.theme_arn = header.get("ThemeArn", "")
+	return analysis
+
+def _chain_first(key, keys):
+	yield key
+	yield from keys
+
+# Yields (key, value) for each key of a definition object in the stream. The value of Sheets is
+# a generator that decodes one sheet at a time; it has to be used up before the next member is read.
+def _definition_members(stream, keys):
+	for key in keys:
+		if key == "Sheets":
+			yield key, (stream.decode_value() for _ in stream.iter_array())
+		else:
+			yield key, stream.decode_value()
+
+def _import_definition_items(items):
+	definition = Definition([])
+	for key, value in items:
+		if key == "DataSetIdentifierDeclarations":
+			definition.data_set_definition = value
+		elif key == "AnalysisDefaults":
+			definition.analysis_defaults = value
+		elif key == "ColumnConfigurations":
+			definition.column_configurations = value
+		elif key == "CalculatedFields":
+			definition.calculated_fields = [_import_node(calculated_field, [CalculatedField]) for calculated_field in value]
+		elif key == "ParameterDeclarations":
+			definition.parameter_declarations = [_import_node(parameter, PARAMETER_CLASSES) for parameter in value]
+		elif key == "FilterGroups":
+			definition.filter_groups = [_import_filter_group(filter_group) for filter_group in value]
+		elif key == "Sheets":
+			definition.sheets = [_import_sheet(sheet) for sheet in value]
+		else:
+			definition.raw_fields[key] = value
+	return definition
+
+def _import_sheet(sheet_json):
+	sheet = Sheet(sheet_json.get("SheetId", ""), sheet_json.get("Name", ""))
+	sheet.content_type = sheet_json.get("ContentType", "")
+	sheet.description = sheet_json.get("Description", "")
+	sheet.title = sheet_json.get("Title", "")
+	sheet.sheet_control_layouts = sheet_json.get("SheetControlLayouts", [])
+	sheet.visuals = [_import_node(visual, VISUAL_CLASSES, "VISUAL") for visual in sheet_json.get("Visuals", [])]
+	sheet.parameter_controls = [
+		_import_node(control, PARAMETER_CONTROL_CLASSES, "PARAMETER_CONTROL") for control in sheet_json.get("ParameterControls", [])
+	]
+	sheet.filter_controls = [
+		_import_node(control, FILTER_CONTROL_CLASSES, "FILTER_CONTROL") for control in sheet_json.get("FilterControls", [])
+	]
+	sheet.text_boxes = [_import_node(text_box, [TextBox], "TEXT_BOX") for text_box in sheet_json.get("TextBoxes", [])]
+
+	# A sheet holds one layout with a single configuration (GridLayout, FreeFormLayout or SectionBasedLayout)
+	layouts = sheet_json.get("Layouts", [])
+	if len(layouts) == 1 and len(layouts[0].get("Configuration", {})) == 1:
+		sheet.layout_type, layout = next(iter(layouts[0]["Configuration"].items()))
+		elements_key = "BodySections" if sheet.layout_type == "SectionBasedLayout" else "Elements"
+		sheet.layout_elements = layout.get(elements_key, [])
+		sheet.canvas_size_options = layout.get("CanvasSizeOptions", {})
+
+	return _verified(sheet, sheet_json, "SHEET")
+
+def _import_filter_group(filter_group_json):
+	filter_group = FilterGroup(filter_group_json.get("CrossDataset", ""), filter_group_json.get("FilterGroupId", ""))
+	filter_group.filters = [_import_node(filter, FILTER_CLASSES) for filter in filter_group_json.get("Filters", [])]
+	filter_group.sheet_visual_scoping_configurations = (
+		filter_group_json.get("ScopeConfiguration", {}).get("SelectedSheets", {}).get("SheetVisualScopingConfigurations", [])
+	)
+	filter_group.status = filter_group_json.get("Status", "")
+	return _verified(filter_group, filter_group_json, "")
+
+# Returns the first class of classes whose object compiles back to node, or a RawNode
+def _import_node(node, classes, element_type = ""):
+	for cls in classes:
+		schema = _schema(cls)
+		if schema is None or (schema.key is not None and (len(node) != 1 or schema.key not in node)):
+			continue
+		compiled_object = schema.populate(node)
+		if compiled_object is not None and compiled_object.compile() == clean_dict(node):
+			return compiled_object
+	return RawNode(clean_dict(node), element_type)
+
+# Keeps compiled_object if it compiles back to its JSON, and falls back to a RawNode otherwise
+def _verified(compiled_object, node, element_type):
+	if compiled_object.compile() == clean_dict(node):
+		return compiled_object
+	return RawNode(clean_dict(node), element_type)
+
+# class -> _Schema, or None when the class cannot be imported
+_SCHEMAS = {}
+
+def _schema(cls):
+	if cls not in _SCHEMAS:
+		_SCHEMAS[cls] = _Schema.probe(cls)
+	return _SCHEMAS[cls]
+
+# Where a class writes each of its attributes in its compiled JSON. It is found once per class by setting every
+# attribute to a unique marker string, compiling, and looking for the markers in the output. Importing a node then
+# reads each attribute back from the same place.
+class _Schema():
+	def __init__(self, cls, key, paths, argument_count):
+		self.cls = cls
+		# Top-level key of the compiled JSON (BarChartVisual, Dropdown, ...), or None for classes without one
+		self.key = key
+		# attribute -> list of paths, each a tuple of keys
+		self.paths = paths
+		self.argument_count = argument_count
+
+	@classmethod
+	def probe(cls, klass):
+		if "compile" not in vars(klass):
+			return None
+		argument_count = len(inspect.signature(klass.__init__).parameters) - 1
+		try:
+			compiled_object = klass(*[""] * argument_count)
+			markers = {}
+			for name in _attribute_names(compiled_object):
+				markers["\0" + name] = name
+				object.__setattr__(compiled_object, name, "\0" + name)
+			compiled = compiled_object.compile()
+		except Exception:
+			return None
+
+		paths = {}
+		for path, value in _leaves(compiled, ()):
+			if type(value) is str and value in markers:
+				paths.setdefault(markers[value], []).append(path)
+		key = next(iter(compiled)) if len(compiled) == 1 and not any(len(path) == 1 for path_list in paths.values() for path in path_list) else None
+		return cls(klass, key, paths, argument_count)
+
+	# Returns a new object with the attributes found in node; attributes that are not in node are left empty
+	def populate(self, node):
+		compiled_object = self.cls(*[""] * self.argument_count)
+		shared = []
+		for name, path_list in self.paths.items():
+			for path in path_list:
+				found, value = _lookup(node, path)
+				if found:
+					break
+			if found:
+				object.__setattr__(compiled_object, name, value)
+				if type(value) in (list, dict):
+					shared.append(name)
+			elif name not in _LAZY_FIELDS or _is_set(compiled_object, name):
+				current = getattr(compiled_object, name)
+				object.__setattr__(compiled_object, name, type(current)() if type(current) in (list, dict) else "")
+		# Lists and dicts still belong to the input JSON; they are copied before the object changes them
+		compiled_object._shared = frozenset(shared)
+		compiled_object._dirty = True
+		return compiled_object
+
+def _attribute_names(compiled_object):
+	names = [name for name in _slot_names(type(compiled_object)) if name not in CompiledObject.__slots__]
+	names += [name for name in getattr(compiled_object, "__dict__", {}) if name != "element_type"]
+	return names
+
+def _is_set(compiled_object, name):
+	try:
+		object.__getattribute__(compiled_object, name)
+		return True
+	except AttributeError:
+		return False
+
+def _leaves(value, path):
+	if type(value) is dict:
+		for key, child in value.items():
+			yield from _leaves(child, path + (key,))
+	elif type(value) is list:
+		for index, child in enumerate(value):
+			yield from _leaves(child, path + (index,))
+	else:
+		yield path, value
+
+def _lookup(node, path):
+	for key in path:
+		try:
+			node = node[key]
+		except (KeyError, IndexError, TypeError):
+			return False, None
+	return True, node
+
+### STREAMING JSON ###
+def _open(source):
+	if isinstance(source, str):
+		return open(source, "r", encoding = "utf-8")
+	return _Borrowed(source)
+
+# Lets a file object passed in by the caller be used in a with statement without closing it.
+# Binary files are read through a TextIOWrapper that is detached again afterwards.
+class _Borrowed():
+	def __init__(self, infile):
+		self.infile = infile
+		self.wrapper = None
+
+	def __enter__(self):
+		if isinstance(self.infile, io.TextIOBase):
+			return self.infile
+		self.wrapper = io.TextIOWrapper(self.infile, encoding = "utf-8")
+		return self.wrapper
+
+	def __exit__(self, *exc_info):
+		if self.wrapper is not None:
+			self.wrapper.detach()
+		return False
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Reads JSON from a text file in chunks. Objects and arrays can be walked member by member (iter_object,
+# iter_array) and any value decoded on its own (decode_value), so only the value being decoded is in memory.
+class _JsonStream():
+	def __init__(self, infile, chunk_size = 1 << 16):
+		self.infile = infile
+		self.chunk_size = chunk_size
+		self.buffer = ""
+		self.position = 0
+		self.eof = False
+		self.decoder = json.JSONDecoder()
+
+	# Reads up to size more characters, dropping what was already consumed. Returns False at the end of the file.
+	def _fill(self, size):
+		if self.position:
+			self.buffer = self.buffer[self.position:]
+			self.position = 0
+		chunk = self.infile.read(size)
+		if not chunk:
+			self.eof = True
+			return False
+		self.buffer += chunk
+		return True
+
+	# Returns the next character that is not whitespace, without consuming it
+	def _peek(self):
+		while True:
+			self.position = _WHITESPACE.match(self.buffer, self.position).end()
+			if self.position < len(self.buffer):
+				return self.buffer[self.position]
+			if not self._fill(self.chunk_size):
+				raise ValueError("Unexpected end of JSON input")
+
+	def _expect(self, characters):
+		character = self._peek()
+		if character not in characters:
+			raise ValueError("Expected %s but found %r in JSON input" % (" or ".join(repr(c) for c in characters), character))
+		self.position += 1
+		return character
+
+	def decode_value(self):
+		self._peek()
+		size = self.chunk_size
+		while True:
+			try:
+				value, end = self.decoder.raw_decode(self.buffer, self.position)
+				# A number at the end of the buffer may go on in the next chunk
+				if end < len(self.buffer) or self.eof:
+					self.position = end
+					return value
+			except json.JSONDecodeError:
+				if self.eof:
+					raise
+			# The value is not complete yet: read more, doubling the chunk so large values need few retries
+			self._fill(size)
+			size *= 2
+
+	def skip_value(self):
+		self.decode_value()
+
+	# Yields the key of each member; the caller reads its value before asking for the next key
+	def iter_object(self):
+		self._expect("{")
+		if self._peek() == "}":
+			self.position += 1
+			return
+		while True:
+			key = self.decode_value()
+			self._expect(":")
+			yield key
+			if self._expect(",}") == "}":
+				return
+
+	# Yields once per element; the caller reads the element before the next iteration
+	def iter_array(self):
+		self._expect("[")
+		if self._peek() == "]":
+			self.position += 1
+			return
+		while True:
+			yield None
+			if self._expect(",]") == "]":
+				return
@@ -0,0 +1,189 @@
+### GRID LAYOUT ###
+# Number of columns of a QuickSight grid layout
+GRID_COLUMNS = 36
+
+# Occupancy bitmap of a grid layout: one int per row, with bit c set when column c of that row is taken.
+# Checking or taking a rectangle costs one mask operation per row it spans, whatever the number of columns.
+class GridOccupancy():
+	def __init__(self, columns = GRID_COLUMNS):
+		self.columns = columns
+		self.full_row = (1 << columns) - 1
+		self.rows = []
+		# Per row, column span -> _free_runs of the row for that span, dropped when the row changes
+		self._row_runs = []
+		# Every row above this one is full, so searches start here
+		self.first_open_row = 0
+		# (column span, row span) -> row where the last search for that size ended. Cells are only ever taken,
+		# never freed, so a size that did not fit above that row will not fit there later, and neither will any
+		# size at least as wide and as tall. Without this, every search would go through the gaps left near the top.
+		self._search_rows = {}
+
+	def _mask(self, column, column_span):
+		return ((1 << column_span) - 1) << column
+
+	def fits_grid(self, column, row, column_span, row_span):
+		return column >= 0 and row >= 0 and column_span >= 1 and row_span >= 1 and column + column_span <= self.columns
+
+	def overlaps(self, column, row, column_span, row_span):
+		mask = self._mask(column, column_span)
+		return any(occupied & mask for occupied in self.rows[row:row + row_span])
+
+	def occupy(self, column, row, column_span, row_span):
+		mask = self._mask(column, column_span) & self.full_row
+		if len(self.rows) < row + row_span:
+			self._row_runs.extend({} for _ in range(row + row_span - len(self.rows)))
+			self.rows.extend([0] * (row + row_span - len(self.rows)))
+		for position in range(row, row + row_span):
+			self.rows[position] |= mask
+			self._row_runs[position] = {}
+		while self.first_open_row < len(self.rows) and self.rows[self.first_open_row] == self.full_row:
+			self.first_open_row += 1
+
+	# Returns (column, row) of the first free rectangle, scanning rows from the top and columns from the left
+	def find(self, column_span, row_span):
+		if not 1 <= column_span <= self.columns or row_span < 1:
+			raise ValueError("A grid element must span 1 to %d columns and at least 1 row, not %s x %s" % (self.columns, column_span, row_span))
+		row = self.first_open_row
+		for (searched_column_span, searched_row_span), searched_row in self._search_rows.items():
+			if searched_row > row and searched_column_span <= column_span and searched_row_span <= row_span:
+				row = searched_row
+		empty_row = _free_runs(self.full_row, column_span)
+		while True:
+			# A window of rows fits where the free runs of all its rows overlap
+			columns = empty_row
+			blocking_row = row
+			end = min(row + row_span, len(self.rows))
+			while blocking_row < end:
+				columns &= self._runs(blocking_row, column_span)
+				if not columns:
+					break
+				blocking_row += 1
+			if columns:
+				self._search_rows[(column_span, row_span)] = row
+				return (columns & -columns).bit_length() - 1, row
+
+			# The window failed at blocking_row. No window that contains a row which cannot hold the element on its own
+			# can fit, and otherwise the next window starts at the highest row whose runs still overlap down to it.
+			window_start = row
+			combined = self._runs(blocking_row, column_span)
+			row = blocking_row if combined else blocking_row + 1
+			while combined and row - 1 > window_start:
+				combined &= self._runs(row - 1, column_span)
+				if combined:
+					row -= 1
+
+	def _runs(self, row, column_span):
+		cache = self._row_runs[row]
+		if column_span not in cache:
+			cache[column_span] = _free_runs(~self.rows[row] & self.full_row, column_span)
+		return cache[column_span]
+
+# Returns a mask with bit c set when bits c to c + length - 1 are all set in free.
+# Runs are combined by doubling, so this takes log2(length) steps.
+def _free_runs(free, length):
+	runs = free
+	covered = 1
+	while covered < length and runs:
+		step = min(covered, length - covered)
+		runs &= runs >> step
+		covered += step
+	return runs
+
+### FREEFORM LAYOUT ###
+# Number of entries or child nodes per node of a FreeformIndex tree
+_NODE_CAPACITY = 16
+
+# Returns the number of pixels of a pixel length such as "300px". Numbers are taken as pixels.
+def parse_pixels(length):
+	if type(length) in (int, float):
+		return length
+	text = str(length).strip().lower()
+	if text.endswith("px"):
+		text = text[:-2]
+	try:
+		pixels = float(text)
+	except ValueError:
+		raise ValueError("'%s' is not a pixel length such as '300px'" % length)
+	return int(pixels) if pixels.is_integer() else pixels
+
+# Spatial index of the rectangles of a freeform layout, in pixels. Entries are (left, top, right, bottom, key) tuples.
+# Entries go into R-trees packed by sorting (sort-tile-recursive), which are never changed once built. An insert adds
+# a tree of one entry and merges it with the trees that are not larger, like carrying in a binary counter, so there
+# are at most log2(n) + 1 trees and an overlap query costs O(log^2 n) plus the number of rectangles it returns.
+class FreeformIndex():
+	def __init__(self, entries = ()):
+		# (entries, root) of each tree, largest first
+		self._trees = []
+		self.count = 0
+		# Right and bottom edge of the rectangles, the size of the canvas they need
+		self.right = 0
+		self.bottom = 0
+		entries = list(entries)
+		if entries:
+			self._trees.append((entries, _build_tree(entries)))
+			self._extend(entries)
+
+	def insert(self, left, top, right, bottom, key):
+		entries = [(left, top, right, bottom, key)]
+		self._extend(entries)
+		while self._trees and len(self._trees[-1][0]) <= len(entries):
+			entries = self._trees.pop()[0] + entries
+		self._trees.append((entries, _build_tree(entries)))
+
+	def _extend(self, entries):
+		self.count += len(entries)
+		self.right = max([self.right] + [entry[2] for entry in entries])
+		self.bottom = max([self.bottom] + [entry[3] for entry in entries])
+
+	# Returns the entries whose rectangle shares an area with the given one. Rectangles that only touch do not overlap.
+	def overlaps(self, left, top, right, bottom):
+		found = []
+		for _, root in self._trees:
+			stack = [root]
+			while stack:
+				node = stack.pop()
+				if node[0] < right and left < node[2] and node[1] < bottom and top < node[3]:
+					if node[4]:
+						found.extend(entry for entry in node[5] if entry[0] < right and left < entry[2] and entry[1] < bottom and top < entry[3])
+					else:
+						stack.extend(node[5])
+		return found
+
+	# Returns all entries, ordered by key
+	def entries(self):
+		return sorted((entry for entries, _ in self._trees for entry in entries), key = lambda entry: entry[4])
+
+	# Returns (earlier key, later key) for each pair of overlapping rectangles, ordered by the later key.
+	# Each rectangle is looked up once, so the report costs O(n log^2 n) plus the number of pairs.
+	def collisions(self):
+		pairs = []
+		for entry in self.entries():
+			key = entry[4]
+			pairs.extend((other, key) for other in sorted(other[4] for other in self.overlaps(*entry[:4]) if other[4] < key))
+		return pairs
+
+# Returns the root of an R-tree over entries. A node is (left, top, right, bottom, is_leaf, children).
+def _build_tree(entries):
+	nodes = [_bounding_node(chunk, True) for chunk in _tiles(entries)]
+	while len(nodes) > 1:
+		nodes = [_bounding_node(chunk, False) for chunk in _tiles(nodes)]
+	return nodes[0]
+
+# Splits rectangles into groups of _NODE_CAPACITY that lie close together: sorted into vertical slices by their
+# centre x, then each slice by its centre y
+def _tiles(rectangles):
+	node_count = -(-len(rectangles) // _NODE_CAPACITY)
+	slice_size = _NODE_CAPACITY * -(-node_count // max(1, int(node_count ** 0.5)))
+	rectangles = sorted(rectangles, key = lambda rectangle: rectangle[0] + rectangle[2])
+	tiles = []
+	for start in range(0, len(rectangles), slice_size):
+		column = sorted(rectangles[start:start + slice_size], key = lambda rectangle: rectangle[1] + rectangle[3])
+		tiles.extend(column[position:position + _NODE_CAPACITY] for position in range(0, len(column), _NODE_CAPACITY))
+	return tiles
+
+def _bounding_node(children, is_leaf):
+	return (
+		min(child[0] for child in children), min(child[1] for child in children),
+		max(child[2] for child in children), max(child[3] for child in children),
+		is_leaf, children
+	)
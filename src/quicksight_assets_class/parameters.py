@@ -0,0 +1,149 @@
+from .core import CompiledObject, _sparse
+
+### PARAMETERS ###
+class Parameter(CompiledObject):
+	__slots__ = ("name", "default_value", "custom_value", "value_when_unset_option")
+
+	def __init__(self, name):
+		# The name of the parameter that is being declared.
+		self.name = name
+
+		# The default values of a parameter (default_value) are only allocated once they are set.
+		# If the parameter is a single-value parameter, a maximum of one default value can be provided.
+
+		# A custom value that's used when the value of a parameter isn't set.
+		self.custom_value = ""
+
+		# The built-in options for default values. The value can be one of the following:
+		# RECOMMENDED_VALUE | NULL
+		self.value_when_unset_option = ""
+
+	def set_static_default_value(self, static_default_value):
+		self.default_value = _sparse(
+			StaticValues = [static_default_value]
+		)
+
+	# TODO: NEEDS UPDATE
+	def set_dynamic_default_value(self, column_name, data_set_identifier):
+		self.default_value = _sparse(
+			DynamicValue = _sparse(
+				DefaultValueColumn = _sparse(
+					ColumnName = column_name,
+					DataSetIdentifier = data_set_identifier
+				),
+				GroupNameColumn = "",
+				UserNameColumn = ""
+			)
+		)
+
+	def set_value_when_unset(self, custom_value = "", value_when_unset_option=""):
+		# Value depends on parameter type
+		self.custom_value = custom_value
+		# RECOMMENDED_VALUE | NULL
+		self.value_when_unset_option = value_when_unset_option
+
+class DateTimeParameter(Parameter):
+	__slots__ = ("time_granularity",)
+
+	def __init__(self, name):
+		Parameter.__init__(self, name)
+
+		# The level of time precision that is used to aggregate DateTime values.
+		# Valid Values: YEAR | QUARTER | MONTH | WEEK | DAY | HOUR | MINUTE | SECOND | MILLISECOND
+		self.time_granularity = ""
+	
+	def set_rolling_date_default_value(self, expression, data_set_identifier = ""):
+		self.default_value = _sparse(
+			RollingDate = _sparse(
+				Expression = expression,
+				DataSetIdentifier = data_set_identifier
+			)
+		)
+
+	def set_time_granularity(self, time_granularity):
+		self.time_granularity = time_granularity
+
+	def compile(self):
+		self.json = _sparse(
+			DateTimeParameterDeclaration = _sparse(
+				Name = self.name,
+				DefaultValues = self.default_value,
+				TimeGranularity = self.time_granularity,
+				ValueWhenUnset = _sparse(
+					CustomValue = self.custom_value,
+					ValueWhenUnsetOption = self.value_when_unset_option
+				)
+			)
+		)
+
+		return self.json
+class DecimalParameter(Parameter):
+	__slots__ = ("parameter_value_type",)
+
+	def __init__(self, name, parameter_value_type):
+		Parameter.__init__(self, name)
+
+		# The value type determines whether the parameter is a single-value or multi-value parameter.
+		# MULTI_VALUED | SINGLE_VALUED
+		self.parameter_value_type = parameter_value_type
+
+	def compile(self):
+		self.json = _sparse(
+			DecimalParameterDeclaration = _sparse(
+				Name = self.name,
+				DefaultValues = self.default_value,
+				ParameterValueType = self.parameter_value_type,
+				ValueWhenUnset = _sparse(
+					CustomValue = self.custom_value,
+					ValueWhenUnsetOption = self.value_when_unset_option
+				)
+			)
+		)
+
+		return self.json
+class IntegerParameter(Parameter):
+	__slots__ = ("parameter_value_type",)
+
+	def __init__(self, name, parameter_value_type):
+		Parameter.__init__(self, name)
+
+		# The value type determines whether the parameter is a single-value or multi-value parameter.
+		# MULTI_VALUED | SINGLE_VALUED
+		self.parameter_value_type = parameter_value_type
+
+	def compile(self):
+		self.json = _sparse(
+			IntegerParameterDeclaration = _sparse(
+				Name = self.name,
+				DefaultValues = self.default_value,
+				ParameterValueType = self.parameter_value_type,
+				ValueWhenUnset = _sparse(
+					CustomValue = self.custom_value,
+					ValueWhenUnsetOption = self.value_when_unset_option
+				)
+			)
+		)
+		return self.json
+class StringParameter(Parameter):
+	__slots__ = ("parameter_value_type",)
+
+	def __init__(self, name, parameter_value_type):
+		Parameter.__init__(self, name)
+
+		# The value type determines whether the parameter is a single-value or multi-value parameter.
+		# MULTI_VALUED | SINGLE_VALUED
+		self.parameter_value_type = parameter_value_type
+
+	def compile(self):
+		self.json = _sparse(
+			IntegerParameterDeclaration = _sparse(
+				Name = self.name,
+				DefaultValues = self.default_value,
+				ParameterValueType = self.parameter_value_type,
+				ValueWhenUnset = _sparse(
+					CustomValue = self.custom_value,
+					ValueWhenUnsetOption = self.value_when_unset_option
+				)
+			)
+		)
+		return self.json
@@ -0,0 +1,316 @@
+import json
+
+### PAYLOAD SIZE ###
+# Size in bytes of a value as botocore sends it in a request body (json.dumps with its default separators)
+def payload_bytes(value):
+	return len(json.dumps(value).encode("utf-8"))
+
+# Serialized size of a compiled analysis, broken down by sheet, visual and filter group:
+#
+#	report = PayloadReport(analysis_1.compile())
+#	if report.exceeds(budget_bytes):
+#		print(report.format_table())
+#
+# Visual sizes are also counted in the size of their sheet.
+class PayloadReport():
+	def __init__(self, analysis_json):
+		definition = analysis_json.get("Definition", {})
+		self.total_bytes = payload_bytes(analysis_json)
+		self.definition_bytes = payload_bytes(definition)
+
+		# sheet id -> bytes
+		self.sheets = {}
+
+		# visual id -> (sheet id, visual type, bytes)
+		self.visuals = {}
+
+		# filter group id -> bytes
+		self.filter_groups = {}
+
+		for sheet in definition.get("Sheets", []):
+			self.sheets[sheet.get("SheetId", "")] = payload_bytes(sheet)
+			for visual in sheet.get("Visuals", []):
+				for visual_type, visual_json in visual.items():
+					self.visuals[visual_json.get("VisualId", "")] = (sheet.get("SheetId", ""), visual_type, payload_bytes(visual))
+
+		for filter_group in definition.get("FilterGroups", []):
+			self.filter_groups[filter_group.get("FilterGroupId", "")] = payload_bytes(filter_group)
+
+	def exceeds(self, budget_bytes):
+		return budget_bytes is not None and self.total_bytes > budget_bytes
+
+	# Returns the largest sheets, visuals and filter groups as (kind, id, bytes), largest first
+	def largest(self, count = 10):
+		items = [("sheet", sheet_id, size) for sheet_id, size in self.sheets.items()]
+		items += [("visual", visual_id, size) for visual_id, (_, _, size) in self.visuals.items()]
+		items += [("filter_group", filter_group_id, size) for filter_group_id, size in self.filter_groups.items()]
+		return sorted(items, key = lambda item: item[2], reverse = True)[:count]
+
+	def to_dict(self):
+		return {
+			"TotalBytes": self.total_bytes,
+			"DefinitionBytes": self.definition_bytes,
+			"Sheets": dict(self.sheets),
+			"Visuals": {visual_id: {"SheetId": sheet_id, "Type": visual_type, "Bytes": size} for visual_id, (sheet_id, visual_type, size) in self.visuals.items()},
+			"FilterGroups": dict(self.filter_groups)
+		}
+
+	def format_table(self):
+		lines = ["%-14s %-40s %10s %7s" % ("Kind", "Id", "Bytes", "Share")]
+		lines.append("%-14s %-40s %10d %6.1f%%" % ("analysis", "", self.total_bytes, 100.0))
+		for kind, item_id, size in self.largest(len(self.sheets) + len(self.visuals) + len(self.filter_groups)):
+			lines.append("%-14s %-40s %10d %6.1f%%" % (kind, item_id, size, 100.0 * size / self.total_bytes))
+		return "\n".join(lines)
+
+# Returns a smaller copy of a compiled analysis with the same meaning; the input is not changed.
+# - Field IDs are only names that tie a visual's field wells to its sorts, formatting and actions. They default to
+#   the column name (often prefixed with the dataset identifier), so every field ID of a visual is replaced with a
+#   short ID ("f0", "f1", ...) wherever the visual refers to it.
+# - Dataset identifiers are only names for the dataset declarations and are repeated in every column reference,
+#   so they are replaced with "d0", "d1", ... across the whole definition.
+def minify_analysis(analysis_json):
+	definition = analysis_json.get("Definition")
+	if not definition:
+		return dict(analysis_json)
+
+	data_set_ids = {
+		declaration["Identifier"]: "d%d" % position
+		for position, declaration in enumerate(definition.get("DataSetIdentifierDeclarations", []))
+		if "Identifier" in declaration
+	}
+	field_counter = [0]
+
+	minified_definition = {}
+	for key, value in definition.items():
+		if key == "Sheets":
+			value = [_minify_sheet(sheet, data_set_ids, field_counter) for sheet in value]
+		elif key == "DataSetIdentifierDeclarations":
+			value = [_rename_data_set_declaration(declaration, data_set_ids) for declaration in value]
+		else:
+			value = _rename(value, data_set_ids, None)
+		minified_definition[key] = value
+
+	minified = dict(analysis_json)
+	minified["Definition"] = minified_definition
+	return minified
+
+def _minify_sheet(sheet, data_set_ids, field_counter):
+	minified = {}
+	for key, value in sheet.items():
+		if key == "Visuals":
+			value = [_minify_visual(visual, data_set_ids, field_counter) for visual in value]
+		else:
+			value = _rename(value, data_set_ids, None)
+		minified[key] = value
+	return minified
+
+def _minify_visual(visual, data_set_ids, field_counter):
+	field_ids = {}
+	for field_id in _field_well_ids(visual):
+		if field_id not in field_ids:
+			field_ids[field_id] = "f%x" % field_counter[0]
+			field_counter[0] += 1
+	return _rename(visual, data_set_ids, field_ids)
+
+def _rename_data_set_declaration(declaration, data_set_ids):
+	declaration = dict(declaration)
+	if "Identifier" in declaration:
+		declaration["Identifier"] = data_set_ids[declaration["Identifier"]]
+	return declaration
+
+# Yields the field IDs declared in the field wells of a visual, in order
+def _field_well_ids(value, in_field_wells = False):
+	if type(value) is dict:
+		for key, child in value.items():
+			if key == "FieldId" and in_field_wells and type(child) is str:
+				yield child
+			else:
+				yield from _field_well_ids(child, in_field_wells or key == "FieldWells")
+	elif type(value) is list:
+		for child in value:
+			yield from _field_well_ids(child, in_field_wells)
+
+# Copies a value, replacing dataset identifiers and, when field_ids is given, field IDs
+def _rename(value, data_set_ids, field_ids):
+	if type(value) is dict:
+		renamed = {}
+		for key, child in value.items():
+			if key == "DataSetIdentifier" and type(child) is str and child in data_set_ids:
+				child = data_set_ids[child]
+			elif key == "FieldId" and field_ids is not None and type(child) is str and child in field_ids:
+				child = field_ids[child]
+			elif key == "SelectedFields" and field_ids is not None and type(child) is list:
+				child = [field_ids.get(field_id, field_id) if type(field_id) is str else field_id for field_id in child]
+			else:
+				child = _rename(child, data_set_ids, field_ids)
+			renamed[key] = child
+		return renamed
+	if type(value) is list:
+		return [_rename(child, data_set_ids, field_ids) for child in value]
+	return value
+
+### COLUMN FORMATS ###
+# Field types whose FormatConfiguration a column configuration can hold, and the key it is held under there
+_COLUMN_FORMAT_KEYS = {
+	"NumericalMeasureField": "NumberFormatConfiguration",
+	"NumericalDimensionField": "NumberFormatConfiguration",
+	"CategoricalMeasureField": "StringFormatConfiguration",
+	"CategoricalDimensionField": "StringFormatConfiguration",
+	"DateMeasureField": "DateTimeFormatConfiguration",
+	"DateDimensionField": "DateTimeFormatConfiguration"
+}
+
+# Bytes of ', "FormatConfiguration": ' that a field drops together with its format
+_FORMAT_KEY_BYTES = payload_bytes("FormatConfiguration") + 4
+
+# What hoist_column_formats moved into column configurations
+class ColumnFormatReport():
+	def __init__(self):
+		# (data set identifier, column name) -> (format key, fields that dropped their copy, bytes saved)
+		self.columns = {}
+
+		# Bytes saved in the serialized definition, net of the column configurations that were added
+		self.bytes_saved = 0
+
+	def to_dict(self):
+		return {
+			"BytesSaved": self.bytes_saved,
+			"Columns": [
+				{"DataSetIdentifier": data_set_identifier, "ColumnName": column_name, "Format": format_key, "Fields": fields, "BytesSaved": saved}
+				for (data_set_identifier, column_name), (format_key, fields, saved) in self.columns.items()
+			]
+		}
+
+	def format_table(self):
+		lines = ["%-24s %-32s %-28s %7s %10s" % ("Dataset", "Column", "Format", "Fields", "Bytes")]
+		for (data_set_identifier, column_name), (format_key, fields, saved) in sorted(self.columns.items(), key = lambda item: item[1][2], reverse = True):
+			lines.append("%-24s %-32s %-28s %7d %10d" % (data_set_identifier, column_name, format_key, fields, saved))
+		lines.append("%-24s %-32s %-28s %7s %10d" % ("total", "", "", "", self.bytes_saved))
+		return "\n".join(lines)
+
+# Returns (definition_json, ColumnFormatReport). The input is not changed; visuals that lose no format are reused.
+# A column configuration sets the default format of a column, so a field format that equals it can be dropped.
+# - Fields whose format equals the format in an existing column configuration drop their copy.
+# - A column without one gets the format most of its fields repeat, when that saves bytes. Columns that are shown
+#   unformatted anywhere are left alone, since those fields would take on the column format.
+def hoist_column_formats(definition_json):
+	report = ColumnFormatReport()
+	sheets = definition_json.get("Sheets", [])
+	configurations = list(definition_json.get("ColumnConfigurations", []))
+	configured = {}
+	for position, configuration in enumerate(configurations):
+		column = configuration.get("Column", {})
+		configured[(column.get("DataSetIdentifier"), column.get("ColumnName"))] = position
+
+	# column -> {serialized format: [format key, format, fields]}; None once a field of the column has no format
+	formats = {}
+	for sheet in sheets:
+		for visual in sheet.get("Visuals", []):
+			for field_type, field in _column_fields(visual):
+				column = (field["Column"].get("DataSetIdentifier"), field["Column"].get("ColumnName"))
+				if "FormatConfiguration" not in field:
+					formats[column] = None
+				elif formats.get(column, {}) is not None:
+					serialized = json.dumps(field["FormatConfiguration"], sort_keys = True)
+					formats.setdefault(column, {}).setdefault(serialized, [_COLUMN_FORMAT_KEYS[field_type], field["FormatConfiguration"], 0])[2] += 1
+
+	# column -> (format key, format) of the column configuration that field copies are dropped for
+	targets = {}
+	added = 0
+	for column, position in configured.items():
+		for format_key, column_format in configurations[position].get("FormatConfiguration", {}).items():
+			targets[column] = (format_key, column_format)
+	for column, column_formats in formats.items():
+		if column_formats is None or column in targets:
+			continue
+		format_key, column_format, fields = max(column_formats.values(), key = lambda candidate: candidate[2])
+		if column in configured:
+			configuration = dict(configurations[configured[column]])
+			cost = -payload_bytes(configurations[configured[column]])
+		else:
+			configuration = {"Column": {"DataSetIdentifier": column[0], "ColumnName": column[1]}}
+			cost = 2
+		configuration["FormatConfiguration"] = {format_key: column_format}
+		cost += payload_bytes(configuration)
+		if fields * (payload_bytes(column_format) + _FORMAT_KEY_BYTES) <= cost:
+			continue
+		if column in configured:
+			configurations[configured[column]] = configuration
+		else:
+			configurations.append(configuration)
+			added += 1
+		targets[column] = (format_key, column_format)
+		report.columns[column] = (format_key, 0, -cost)
+
+	if not targets:
+		return definition_json, report
+
+	# column -> fields that dropped their copy
+	dropped = {}
+	hoisted_sheets = [_drop_sheet_formats(sheet, targets, dropped) for sheet in sheets]
+	for column, fields in dropped.items():
+		format_key, column_format = targets[column]
+		_, _, saved = report.columns.get(column, (format_key, 0, 0))
+		report.columns[column] = (format_key, fields, saved + fields * (payload_bytes(column_format) + _FORMAT_KEY_BYTES))
+	report.bytes_saved = sum(saved for _, _, saved in report.columns.values())
+	if added and not definition_json.get("ColumnConfigurations"):
+		# ', "ColumnConfigurations": []', less the separator the first configuration does not need
+		report.bytes_saved -= payload_bytes("ColumnConfigurations") + 4
+
+	hoisted = {key: value for key, value in definition_json.items() if key not in ("ColumnConfigurations", "Sheets")}
+	hoisted["ColumnConfigurations"] = configurations
+	if "Sheets" in definition_json:
+		hoisted["Sheets"] = hoisted_sheets
+	return hoisted, report
+
+# Yields (field type, field) for each field of a visual that refers to a column
+def _column_fields(visual):
+	stack = [visual]
+	while stack:
+		value = stack.pop()
+		if type(value) is dict:
+			for key, child in value.items():
+				if key in _COLUMN_FORMAT_KEYS and type(child) is dict and type(child.get("Column")) is dict:
+					yield key, child
+				elif type(child) is dict or type(child) is list:
+					stack.append(child)
+		elif type(value) is list:
+			stack.extend(child for child in value if type(child) is dict or type(child) is list)
+
+def _drop_sheet_formats(sheet, targets, dropped):
+	visuals = sheet.get("Visuals")
+	if not visuals:
+		return sheet
+	hoisted_visuals = [_drop_formats(visual, targets, dropped) for visual in visuals]
+	if all(hoisted is visual for hoisted, visual in zip(hoisted_visuals, visuals)):
+		return sheet
+	sheet = dict(sheet)
+	sheet["Visuals"] = hoisted_visuals
+	return sheet
+
+# Returns value without the field formats that equal the format of their column, or value itself when there are none
+def _drop_formats(value, targets, dropped):
+	if type(value) is dict:
+		copied = None
+		for key, child in value.items():
+			if key in _COLUMN_FORMAT_KEYS and type(child) is dict and type(child.get("Column")) is dict:
+				column = (child["Column"].get("DataSetIdentifier"), child["Column"].get("ColumnName"))
+				target = targets.get(column)
+				if target is None or target[0] != _COLUMN_FORMAT_KEYS[key] or child.get("FormatConfiguration") != target[1]:
+					continue
+				hoisted = {field_key: field_value for field_key, field_value in child.items() if field_key != "FormatConfiguration"}
+				dropped[column] = dropped.get(column, 0) + 1
+			elif type(child) is dict or type(child) is list:
+				hoisted = _drop_formats(child, targets, dropped)
+				if hoisted is child:
+					continue
+			else:
+				continue
+			if copied is None:
+				copied = dict(value)
+			copied[key] = hoisted
+		return value if copied is None else copied
+	if type(value) is list:
+		hoisted = [_drop_formats(child, targets, dropped) for child in value]
+		return value if all(new is old for new, old in zip(hoisted, value)) else hoisted
+	return value
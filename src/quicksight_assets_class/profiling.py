@@ -0,0 +1,134 @@
+import functools
+import json
+import sys
+import time
+
+from . import _load_all
+from . import core
+from .core import CompiledObject
+
+### PROFILING ###
+_active_profiler = None
+
+# Times every compile() method in the library, clean_dict and dump_analysis while it is active:
+#
+#	with CompileProfiler() as profiler:
+#		analysis_json = analysis_1.compile()
+#	print(profiler.format_table())
+#
+# The wrappers are only installed between start() and stop(), so nothing is measured (or slowed down) otherwise.
+# For each class, the report holds the number of calls, cumulative and self time, and the number of 
+# dict and list nodes in the returned output (self_nodes leaves out the nodes emitted by nested compile() calls).
+# For clean_dict, nodes counts the nodes left after cleaning; Analysis.compile and dump_analysis only report times.
+class CompileProfiler():
+	def __init__(self):
+		self.stats = {}
+		self._stack = []
+		self._active = set()
+		self._patched = []
+
+	def __enter__(self):
+		self.start()
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.stop()
+
+	def start(self):
+		global _active_profiler
+		if _active_profiler is not None:
+			raise RuntimeError("A CompileProfiler is already active")
+		_active_profiler = self
+
+		modules = _load_all()
+		for cls in _classes_with_compile(modules):
+			original = vars(cls)["compile"]
+			setattr(cls, "compile", self._wrap(cls.__name__ + ".compile", original, count_nodes = issubclass(cls, CompiledObject)))
+			self._patched.append((cls, "compile", original))
+
+		# The functions are replaced in every submodule that imported them, and in the package namespace
+		namespaces = [vars(module) for module in modules] + [vars(sys.modules[__package__])]
+		for name in ("clean_dict", "dump_analysis"):
+			original = vars(core)[name]
+			wrapped = self._wrap(name, original, count_nodes = name == "clean_dict", nested = False)
+			for namespace in namespaces:
+				if namespace.get(name) is original:
+					namespace[name] = wrapped
+					self._patched.append((namespace, name, original))
+
+	def stop(self):
+		global _active_profiler
+		for target, name, original in reversed(self._patched):
+			if isinstance(target, dict):
+				target[name] = original
+			else:
+				setattr(target, name, original)
+		self._patched = []
+		_active_profiler = None
+
+	# Nodes of a call are added to the self_nodes of its caller only when both count nodes and the call is nested
+	def _wrap(self, name, function, count_nodes, nested = True):
+		stats = self.stats.setdefault(name, {"calls": 0, "cumulative_seconds": 0.0, "self_seconds": 0.0, "nodes": 0, "self_nodes": 0})
+
+		@functools.wraps(function)
+		def wrapper(*args, **kwargs):
+			# Recursive calls (clean_dict calls itself through the module global) are part of the outer call
+			if name in self._active:
+				return function(*args, **kwargs)
+
+			# child seconds, child nodes, profiling overhead, whether nodes are counted
+			frame = [0.0, 0, 0.0, count_nodes]
+			self._stack.append(frame)
+			self._active.add(name)
+			start = time.perf_counter()
+			try:
+				result = function(*args, **kwargs)
+			finally:
+				elapsed = time.perf_counter() - start - frame[2]
+				self._active.discard(name)
+				self._stack.pop()
+
+			overhead_start = time.perf_counter()
+			nodes = _count_nodes(result) if count_nodes else 0
+			stats["calls"] += 1
+			stats["cumulative_seconds"] += elapsed
+			stats["self_seconds"] += elapsed - frame[0]
+			stats["nodes"] += nodes
+			stats["self_nodes"] += nodes - frame[1]
+
+			if self._stack:
+				parent = self._stack[-1]
+				parent[0] += elapsed
+				if nested and parent[3]:
+					parent[1] += nodes
+				parent[2] += frame[2] + time.perf_counter() - overhead_start
+			return result
+		return wrapper
+
+	def report(self):
+		return {name: dict(stats) for name, stats in self.stats.items() if stats["calls"]}
+
+	def to_json(self, indent = 2):
+		return json.dumps(self.report(), indent = indent)
+
+	def format_table(self):
+		rows = sorted(self.report().items(), key = lambda item: item[1]["self_seconds"], reverse = True)
+		lines = ["%-40s %8s %12s %12s %10s %10s" % ("Name", "Calls", "Cumulative", "Self", "Nodes", "Self nodes")]
+		for name, stats in rows:
+			lines.append("%-40s %8d %11.4fs %11.4fs %10d %10d" % (name, stats["calls"], stats["cumulative_seconds"], stats["self_seconds"], stats["nodes"], stats["self_nodes"]))
+		return "\n".join(lines)
+
+# Classes defined in the given modules that have their own compile() method
+def _classes_with_compile(modules):
+	return [
+		value for module in modules for value in list(vars(module).values())
+		if isinstance(value, type) and value.__module__ == module.__name__ and "compile" in vars(value)
+	]
+
+# Number of dicts and lists in a compiled value
+def _count_nodes(value):
+	if type(value) is dict:
+		return 1 + sum(_count_nodes(child) for child in value.values())
+	if type(value) is list:
+		return 1 + sum(_count_nodes(child) for child in value)
+	return 0
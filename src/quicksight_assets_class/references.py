@@ -0,0 +1,199 @@
+from .validation import ValidationIssue, _format_path
+
+### CROSS-REFERENCES ###
+# Index of the IDs declared in a compiled definition and of the places that refer to them, built in one pass.
+# Definition.check_references() builds one from its compiled output, so dangling and duplicate IDs are known
+# before deploying:
+#
+#	for issue in definition_1.check_references():
+#		print(issue)
+#
+# Declarations and references are kept in dicts, so checking a definition costs O(n) in the number of nodes.
+# References are collected during the pass and resolved at the end, because a filter group can refer to a
+# sheet that is declared after it.
+
+# Kinds of IDs. Layout elements use the ElementType of the layout (VISUAL, PARAMETER_CONTROL, ...) as their kind.
+DATA_SET = "DATA_SET"
+CALCULATED_FIELD = "CALCULATED_FIELD"
+PARAMETER = "PARAMETER"
+FILTER_GROUP = "FILTER_GROUP"
+FILTER = "FILTER"
+SHEET = "SHEET"
+VISUAL = "VISUAL"
+PARAMETER_CONTROL = "PARAMETER_CONTROL"
+FILTER_CONTROL = "FILTER_CONTROL"
+TEXT_BOX = "TEXT_BOX"
+IMAGE = "IMAGE"
+
+# Kinds whose IDs belong to one sheet; references to them from a sheet must be on the same sheet
+SHEET_KINDS = frozenset([VISUAL, PARAMETER_CONTROL, FILTER_CONTROL, TEXT_BOX, IMAGE])
+
+# Sheet list key -> (kind, ID key) of the elements it holds
+_SHEET_ELEMENTS = {
+	"Visuals": (VISUAL, "VisualId"),
+	"ParameterControls": (PARAMETER_CONTROL, "ParameterControlId"),
+	"FilterControls": (FILTER_CONTROL, "FilterControlId"),
+	"TextBoxes": (TEXT_BOX, "SheetTextBoxId"),
+	"Images": (IMAGE, "SheetImageId")
+}
+
+# Keys whose string value refers to an ID, wherever they appear
+_REFERENCE_KEYS = {
+	"DataSetIdentifier": DATA_SET,
+	"SourceParameterName": PARAMETER,
+	"ParameterName": PARAMETER,
+	"DestinationParameterName": PARAMETER,
+	"Parameter": PARAMETER,
+	"SourceFilterId": FILTER
+}
+
+# Keys whose values only hold formatting and display settings, never IDs, so they are not scanned
+_SKIPPED_KEYS = frozenset([
+	"AggregationFunction", "FormatConfiguration", "NumberFormatConfiguration", "Title", "Subtitle", "FormatText",
+	"TitleOptions", "FontConfiguration", "CanvasSizeOptions", "TableOptions", "SortConfiguration", "IconOptions",
+	"TextFormat", "CategoryAxis", "XAxisDisplayOptions", "DisplayOptions"
+])
+
+# Definition keys that ReferenceIndex goes through section by section
+_INDEXED_KEYS = frozenset(["DataSetIdentifierDeclarations", "CalculatedFields", "ParameterDeclarations", "FilterGroups", "Sheets"])
+
+class ReferenceIndex():
+	def __init__(self, definition_json, root = "Definition"):
+		# kind -> {id: (path, sheet id)}
+		self.symbols = {}
+		# Dangling references and duplicate IDs, as ValidationIssue (codes DanglingReference and DuplicateId)
+		self.issues = []
+
+		# (kind, id, path, sheet id) of every reference, resolved once all IDs are declared
+		self._references = []
+		root_path = None if root is None else (None, root)
+
+		for position, declaration in enumerate(definition_json.get("DataSetIdentifierDeclarations", [])):
+			self._declare(DATA_SET, declaration.get("Identifier"), ((root_path, "DataSetIdentifierDeclarations"), position), None)
+
+		for position, calculated_field in enumerate(definition_json.get("CalculatedFields", [])):
+			path = ((root_path, "CalculatedFields"), position)
+			self._declare(CALCULATED_FIELD, calculated_field.get("Name"), path, None)
+			self._scan(calculated_field, path, None)
+
+		for position, parameter in enumerate(definition_json.get("ParameterDeclarations", [])):
+			path = ((root_path, "ParameterDeclarations"), position)
+			for parameter_type, declaration in parameter.items():
+				self._declare(PARAMETER, declaration.get("Name"), ((path, parameter_type), "Name"), None)
+				# Name is a declaration, not a reference, so only the rest of the declaration is scanned
+				for key, value in declaration.items():
+					if key != "Name":
+						self._scan(value, ((path, parameter_type), key), None)
+
+		for position, filter_group in enumerate(definition_json.get("FilterGroups", [])):
+			self._index_filter_group(filter_group, ((root_path, "FilterGroups"), position))
+
+		for position, sheet in enumerate(definition_json.get("Sheets", [])):
+			self._index_sheet(sheet, ((root_path, "Sheets"), position))
+
+		# Column configurations, analysis defaults and keys the library does not model hold references but no IDs
+		for key, value in definition_json.items():
+			if key not in _INDEXED_KEYS:
+				self._scan(value, (root_path, key), None)
+
+		self._resolve()
+		del self._references
+
+	# Returns (path, sheet id) of the declaration of an ID, or None
+	def find(self, kind, symbol_id):
+		return self.symbols.get(kind, {}).get(symbol_id)
+
+	def _declare(self, kind, symbol_id, path, sheet_id):
+		if not symbol_id:
+			return
+		symbols = self.symbols.setdefault(kind, {})
+		if symbol_id in symbols:
+			self.issues.append(ValidationIssue(
+				_format_path(path), "DuplicateId", "%s ID '%s' is already used at %s" % (kind, symbol_id, _format_path(symbols[symbol_id][0]))
+			))
+		else:
+			symbols[symbol_id] = (path, sheet_id)
+
+	def _index_filter_group(self, filter_group, path):
+		self._declare(FILTER_GROUP, filter_group.get("FilterGroupId"), path, None)
+		for position, filter in enumerate(filter_group.get("Filters", [])):
+			filter_path = ((path, "Filters"), position)
+			for filter_type, filter_json in filter.items():
+				self._declare(FILTER, filter_json.get("FilterId"), ((filter_path, filter_type), "FilterId"), None)
+			self._scan(filter, filter_path, None)
+
+		configurations = filter_group.get("ScopeConfiguration", {}).get("SelectedSheets", {}).get("SheetVisualScopingConfigurations", [])
+		configurations_path = (((path, "ScopeConfiguration"), "SelectedSheets"), "SheetVisualScopingConfigurations")
+		for position, configuration in enumerate(configurations):
+			configuration_path = (configurations_path, position)
+			sheet_id = configuration.get("SheetId")
+			self._refer(SHEET, sheet_id, (configuration_path, "SheetId"), None)
+			for visual_position, visual_id in enumerate(configuration.get("VisualIds", [])):
+				self._refer(VISUAL, visual_id, ((configuration_path, "VisualIds"), visual_position), sheet_id)
+
+	def _index_sheet(self, sheet, path):
+		sheet_id = sheet.get("SheetId")
+		self._declare(SHEET, sheet_id, path, None)
+		for key, value in sheet.items():
+			if key in _SHEET_ELEMENTS:
+				kind, id_key = _SHEET_ELEMENTS[key]
+				for position, element in enumerate(value):
+					element_path = ((path, key), position)
+					if id_key in element:
+						# Text boxes and images are not wrapped in a type key
+						self._declare(kind, element[id_key], (element_path, id_key), sheet_id)
+					else:
+						for element_type, element_json in element.items():
+							self._declare(kind, element_json.get(id_key), ((element_path, element_type), id_key), sheet_id)
+					self._scan(element, element_path, sheet_id)
+			elif key != "SheetId":
+				self._scan(value, (path, key), sheet_id)
+
+	# Collects the references found anywhere below value
+	def _scan(self, value, path, sheet_id):
+		references = self._references
+		stack = [(value, path)]
+		while stack:
+			value, path = stack.pop()
+			if type(value) is dict:
+				for key, child in value.items():
+					child_type = type(child)
+					if child_type is str:
+						if key in _REFERENCE_KEYS:
+							references.append((_REFERENCE_KEYS[key], child, (path, key), sheet_id))
+						elif key == "ElementId" and type(value.get("ElementType")) is str:
+							references.append((value["ElementType"], child, (path, key), sheet_id))
+					elif child_type is dict:
+						if key == "Column":
+							# Column references are the most common node, so they are read without going through the stack
+							data_set_identifier = child.get("DataSetIdentifier")
+							if type(data_set_identifier) is str:
+								references.append((DATA_SET, data_set_identifier, ((path, key), "DataSetIdentifier"), sheet_id))
+						elif key not in _SKIPPED_KEYS:
+							stack.append((child, (path, key)))
+					elif child_type is list:
+						if key == "TargetVisuals":
+							for position, visual_id in enumerate(child):
+								references.append((VISUAL, visual_id, ((path, key), position), sheet_id))
+						else:
+							stack.append((child, (path, key)))
+			elif type(value) is list:
+				for position, child in enumerate(value):
+					if type(child) is dict or type(child) is list:
+						stack.append((child, (path, position)))
+
+	def _refer(self, kind, symbol_id, path, sheet_id):
+		if symbol_id:
+			self._references.append((kind, symbol_id, path, sheet_id))
+
+	def _resolve(self):
+		for kind, symbol_id, path, sheet_id in self._references:
+			declaration = self.symbols.get(kind, {}).get(symbol_id)
+			if declaration is None:
+				self.issues.append(ValidationIssue(
+					_format_path(path), "DanglingReference", "%s ID '%s' is not declared" % (kind, symbol_id)
+				))
+			elif kind in SHEET_KINDS and sheet_id and declaration[1] != sheet_id:
+				self.issues.append(ValidationIssue(
+					_format_path(path), "DanglingReference", "%s ID '%s' is on sheet '%s', not on sheet '%s'" % (kind, symbol_id, declaration[1], sheet_id)
+				))
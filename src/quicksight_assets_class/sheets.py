@@ -0,0 +1,390 @@
+from .core import CompiledObject, _sparse, clean_dict
+from .layout import GRID_COLUMNS, FreeformIndex, GridOccupancy, parse_pixels
+
+### SHEET ###
+class Sheet(CompiledObject):
+	def __init__(self, sheet_id, name):
+		# The unique identifier of a sheet.
+		self.id = sheet_id
+
+		# The layout content type of the sheet. Choose one of the following options:
+		# Valid Values: PAGINATED | INTERACTIVE
+		self.content_type = ""	
+
+		# A description of the sheet.
+		self.description = ""
+
+		# The list of filter controls that are on a sheet.
+		self.filter_controls = []
+
+		# Layouts define how the components of a sheet are arranged.
+		# layout_type is the layout configuration that is used (GridLayout, FreeFormLayout or SectionBasedLayout), 
+		# layout_elements holds its elements and canvas_size_options its canvas size options.
+		self.layout_type = ""
+		self.layout_elements = []
+		self.canvas_size_options = {}
+
+		# The name of the sheet. 
+		# This name is displayed on the sheet's tab in the Amazon QuickSight console.
+		self.name = name
+
+		# The list of parameter controls that are on a sheet.
+		self.parameter_controls = []
+
+		# The control layouts of the sheet.
+		self.sheet_control_layouts = []
+
+		# The text boxes that are on a sheet.
+		self.text_boxes = []		
+
+		# The title of the sheet.
+		self.title = ""
+
+		# A list of the visuals that are on a sheet.
+		# Visual placement is determined by the layout of the sheet.
+		# Visuals, controls and text boxes are compiled together with the sheet.
+		self.visuals = []
+
+	def add_visual(self, visual):
+		self._field_well("visuals").append(visual)
+
+	def add_visuals(self, visual_list):
+		for visual in visual_list:
+			self.add_visual(visual)
+
+	def add_parameter_control(self, parameter_control):
+		self._field_well("parameter_controls").append(parameter_control)
+
+	def add_parameter_controls(self, parameter_control_list):
+		for parameter_control in parameter_control_list:
+			self.add_parameter_control(parameter_control)
+
+	def add_filter_control(self, filter_control):
+		self._field_well("filter_controls").append(filter_control)
+
+	def add_filter_controls(self, filter_control_list):
+		for filter_control in filter_control_list:
+			self.add_filter_control(filter_control)
+
+	def add_text_box(self, text_box):
+		self._field_well("text_boxes").append(text_box)
+	
+	def add_text_boxes(self, text_box_list):
+		for text_box in text_box_list:
+			self.add_text_box(text_box)
+
+	def _children(self):
+		return self.filter_controls + self.parameter_controls + self.text_boxes + self.visuals
+
+	# Returns a copy of this sheet with a new id. Its controls, text boxes and visuals are cloned too, with id_suffix
+	# (by default "-" + new_id) added to their IDs and to the custom action IDs of the visuals, since these must be
+	# unique in the analysis. Layout elements, control layouts and visual actions refer to the new IDs.
+	# Keyword arguments replace attributes on the copy, for example name = "Sheet 2".
+	def clone(self, new_id, id_suffix = None, **overrides):
+		if id_suffix is None:
+			id_suffix = "-" + new_id
+		clone = self._clone("id", new_id)
+		new_ids = {}
+		for name, id_name in (("filter_controls", "id"), ("parameter_controls", "id"), ("text_boxes", "text_box_id"), ("visuals", "id")):
+			children = []
+			for child in getattr(self, name):
+				child_id = getattr(child, id_name)
+				new_ids[child_id] = child_id + id_suffix
+				children.append(child._clone(id_name, new_ids[child_id]))
+			setattr(clone, name, children)
+
+		for visual in self.visuals:
+			for action in visual.actions:
+				if "CustomActionId" in action:
+					new_ids[action["CustomActionId"]] = action["CustomActionId"] + id_suffix
+		for visual in clone.visuals:
+			if visual.actions:
+				visual.actions = _replace_ids(visual.actions, new_ids)
+		clone.layout_elements = _replace_ids(self.layout_elements, new_ids)
+		clone.sheet_control_layouts = _replace_ids(self.sheet_control_layouts, new_ids)
+		return clone._override(overrides)
+
+	def set_content_type(self, content_type):
+		self.content_type = content_type
+
+	def set_name(self, name):
+		self.name = name
+
+	def set_title(self, title):
+		self.title = title
+	
+	def set_description(self, description):
+		self.description = description
+
+	def set_freeform_layout(self, view_port_width = ""):
+		self.layout_type = "FreeFormLayout"
+		self.layout_elements = []
+		self.canvas_size_options = _sparse(
+			ScreenCanvasSizeOptions = _sparse(
+				OptimizedViewPortWidth = view_port_width
+			)
+		)
+	
+	# Pixel lengths are strings such as "300px". They are parsed once here, and the element is added to the
+	# spatial index of the layout (see find_freeform_overlaps and check_freeform_layout).
+	def add_freeform_layout_element(self, element, height, width, x_axis_location, y_axis_location, background_style = None, border_style = None, loading_animation = None, rendering_rules = None, selected_border_style = None, visibility = ""):
+		left, top = parse_pixels(x_axis_location), parse_pixels(y_axis_location)
+		right, bottom = left + parse_pixels(width), top + parse_pixels(height)
+		layout_elements = self._field_well("layout_elements")
+		index = self._freeform_layout_index()
+		layout_elements.append(_sparse(
+				ElementId = element.id,
+				ElementType = element.element_type,
+				Height = height,
+				Width = width,
+				XAxisLocation = x_axis_location,
+				YAxisLocation = y_axis_location,
+				BorderStyle = clean_dict(border_style),
+				LoadingAnimation = clean_dict(loading_animation),
+				RenderingRules = clean_dict(rendering_rules),
+				SelectedBorderStyle = clean_dict(selected_border_style),
+				Visibility = visibility
+			))
+		index.insert(left, top, right, bottom, len(layout_elements) - 1)
+		self._freeform_index = (layout_elements, len(layout_elements), index)
+
+	# Returns the spatial index of the freeform elements, keyed by position in layout_elements.
+	# It is kept up to date by add_freeform_layout_element and built again when layout_elements is replaced,
+	# for example by set_freeform_layout or when a sheet is imported or cloned.
+	def _freeform_layout_index(self):
+		elements, count, index = getattr(self, "_freeform_index", (None, 0, None))
+		if elements is not self.layout_elements or count != len(self.layout_elements):
+			index = FreeformIndex(entry for entry in map(_freeform_rectangle, self.layout_elements, range(len(self.layout_elements))) if entry is not None)
+			self._freeform_index = (self.layout_elements, len(self.layout_elements), index)
+		return index
+
+	# Returns the IDs of the freeform elements that share an area with a rectangle, given in pixels or pixel lengths
+	#
+	#	sheet_2.find_freeform_overlaps("600px", "0px", "300px", "200px")
+	def find_freeform_overlaps(self, x_axis_location, y_axis_location, width, height):
+		left, top = parse_pixels(x_axis_location), parse_pixels(y_axis_location)
+		entries = self._freeform_layout_index().overlaps(left, top, left + parse_pixels(width), top + parse_pixels(height))
+		return [self.layout_elements[entry[4]].get("ElementId") for entry in sorted(entries, key = lambda entry: entry[4])]
+
+	# Returns (width, height) in pixels of the canvas that the freeform elements need
+	def freeform_canvas_size(self):
+		index = self._freeform_layout_index()
+		return index.right, index.bottom
+
+	# Returns a ValidationIssue for each freeform element that overlaps an earlier one, lies outside the canvas
+	# (left of or above it, or past the OptimizedViewPortWidth of the sheet) or has a length that is not in pixels.
+	# Paths are relative to the sheet.
+	def check_freeform_layout(self):
+		issues = []
+		if self.layout_type != "FreeFormLayout":
+			return issues
+		# Imported here so that building sheets does not load the validation module
+		from .validation import ValidationIssue
+
+		index = self._freeform_layout_index()
+		path = "$.Layouts[0].Configuration.FreeFormLayout.Elements[%d]"
+		view_port_width = self.canvas_size_options.get("ScreenCanvasSizeOptions", {}).get("OptimizedViewPortWidth")
+		try:
+			view_port_width = parse_pixels(view_port_width) if view_port_width else None
+		except ValueError:
+			issues.append(ValidationIssue("$.Layouts[0].Configuration.FreeFormLayout.CanvasSizeOptions.ScreenCanvasSizeOptions.OptimizedViewPortWidth",
+				"InvalidPattern", "'%s' is not a pixel length" % view_port_width))
+			view_port_width = None
+
+		rectangles = {entry[4]: entry for entry in index.entries()}
+		for position, layout_element in enumerate(self.layout_elements):
+			rectangle = rectangles.get(position)
+			if rectangle is None:
+				issues.append(ValidationIssue(path % position, "InvalidPattern", "'%s' has a location or size that is not a pixel length" % (
+					layout_element.get("ElementId"))))
+			elif rectangle[0] < 0 or rectangle[1] < 0:
+				issues.append(ValidationIssue(path % position, "OffCanvas", "'%s' starts at %spx, %spx, outside the canvas" % (
+					layout_element.get("ElementId"), rectangle[0], rectangle[1])))
+			elif view_port_width is not None and rectangle[2] > view_port_width:
+				issues.append(ValidationIssue(path % position, "OffCanvas", "'%s' ends at %spx, past the view port width of %spx" % (
+					layout_element.get("ElementId"), rectangle[2], view_port_width)))
+
+		overlaps = {}
+		for earlier, later in index.collisions():
+			overlaps.setdefault(later, []).append(earlier)
+		for position, others in sorted(overlaps.items()):
+			issues.append(ValidationIssue(path % position, "Overlap", "'%s' overlaps %s" % (
+				self.layout_elements[position].get("ElementId"), ", ".join("'%s'" % self.layout_elements[other].get("ElementId") for other in others))))
+		return issues
+
+	def set_grid_layout(self, resize_option = "", view_port_width = ""):
+		self.layout_type = "GridLayout"
+		self.layout_elements = []
+		self.canvas_size_options = _sparse(
+				ScreenCanvasSizeOptions = _sparse(
+					ResizeOption = resize_option,
+					OptimizedViewPortWidth = view_port_width
+				)
+			)
+	
+	def add_grid_layout_element(self, element,  x_length, y_length, x_position = "", y_position = ""):
+		self._field_well("layout_elements").append(_sparse(
+				ElementId = element.id,
+				ElementType = element.element_type,
+				ColumnSpan = x_length,
+				RowSpan = y_length,
+				ColumnIndex = x_position,
+				RowIndex = y_position
+			))
+
+	# Places elements on the grid without overlaps. elements holds (element, column_span, row_span) tuples, or bare
+	# elements that then take default_size. Each element goes to the first free spot from the top left, after the
+	# elements already placed on the sheet. With sort_by_size, larger elements are placed first, which packs denser
+	# but no longer keeps the given order.
+	#
+	#	sheet_1.pack_grid_layout([(barchart_1, 18, 10), (barchart_2, 18, 10), table_1])
+	def pack_grid_layout(self, elements, default_size = (12, 8), sort_by_size = False):
+		if not self.layout_type:
+			self.set_grid_layout()
+		elif self.layout_type != "GridLayout":
+			raise ValueError("pack_grid_layout needs a grid layout, but sheet '%s' has a %s" % (self.id, self.layout_type))
+
+		sized = [item if type(item) is tuple else (item,) + tuple(default_size) for item in elements]
+		if sort_by_size:
+			sized.sort(key = lambda item: item[1] * item[2], reverse = True)
+
+		occupancy = self._grid_occupancy()
+		for element, column_span, row_span in sized:
+			column, row = occupancy.find(column_span, row_span)
+			occupancy.occupy(column, row, column_span, row_span)
+			self.add_grid_layout_element(element, column_span, row_span, column, row)
+
+	# Returns the occupancy bitmap of the grid elements that have a position
+	def _grid_occupancy(self):
+		occupancy = GridOccupancy()
+		for layout_element in self.layout_elements:
+			rectangle = _grid_rectangle(layout_element)
+			if rectangle is not None and occupancy.fits_grid(*rectangle):
+				occupancy.occupy(*rectangle)
+		return occupancy
+
+	# Returns a ValidationIssue for each grid element that overlaps an earlier one or does not fit in the 36 columns.
+	# Paths are relative to the sheet.
+	def check_grid_layout(self):
+		issues = []
+		if self.layout_type != "GridLayout":
+			return issues
+		from .validation import ValidationIssue
+
+		occupancy = GridOccupancy()
+		placed = []
+		for position, layout_element in enumerate(self.layout_elements):
+			rectangle = _grid_rectangle(layout_element)
+			if rectangle is None:
+				continue
+			path = "$.Layouts[0].Configuration.GridLayout.Elements[%d]" % position
+			if not occupancy.fits_grid(*rectangle):
+				issues.append(ValidationIssue(path, "OutOfGrid", "'%s' spans columns %d to %d, but the grid has %d columns" % (
+					layout_element.get("ElementId"), rectangle[0], rectangle[0] + rectangle[2] - 1, GRID_COLUMNS)))
+			elif occupancy.overlaps(*rectangle):
+				# Only an overlap is traced back to the elements it covers, so the check stays linear otherwise
+				others = [other.get("ElementId") for other, other_rectangle in placed if _intersect(rectangle, other_rectangle)]
+				issues.append(ValidationIssue(path, "Overlap", "'%s' overlaps %s" % (
+					layout_element.get("ElementId"), ", ".join("'%s'" % other for other in others))))
+			occupancy.occupy(*rectangle)
+			placed.append((layout_element, rectangle))
+		return issues
+
+	def set_section_based_layout(self):
+		self.layout_type = "SectionBasedLayout"
+		self.layout_elements = []
+		self.canvas_size_options = _sparse(
+				ScreenCanvasSizeOptions = _sparse(
+					PaperCanvasSizeOptions = _sparse(
+						PaperMargin = _sparse(
+							Bottom = "",
+							Left = "",
+							Right = "",
+							Top = ""
+						),
+						PaperOrientation = "",
+						PaperSize = ""
+					)
+				)
+			)
+
+	def _compile_layout(self):
+		if not self.layout_type:
+			return {}
+
+		# Section based layouts hold body sections instead of elements
+		elements_key = "BodySections" if self.layout_type == "SectionBasedLayout" else "Elements"
+		return _sparse(Configuration = _sparse({
+			self.layout_type: _sparse({elements_key: self.layout_elements}, CanvasSizeOptions = self.canvas_size_options)
+		}))
+
+	def compile(self):
+		self.json = _sparse(
+			SheetId = self.id,
+			ContentType = self.content_type,
+			Description = self.description,
+			FilterControls = [filter_control.compile() for filter_control in self.filter_controls],
+			Layouts = [self._compile_layout()],
+			Name = self.name,
+			ParameterControls = [parameter_control.compile() for parameter_control in self.parameter_controls],
+			SheetControlLayouts = clean_dict(self.sheet_control_layouts),
+			TextBoxes = [text_box.compile() for text_box in self.text_boxes],
+			Title = self.title,
+			Visuals = [visual.compile() for visual in self.visuals]
+		)
+
+		return self.json
+
+# Returns (column, row, column span, row span) of a grid layout element, or None when it has no position
+def _grid_rectangle(layout_element):
+	try:
+		return (
+			int(layout_element["ColumnIndex"]), int(layout_element["RowIndex"]),
+			int(layout_element["ColumnSpan"]), int(layout_element["RowSpan"])
+		)
+	except (KeyError, TypeError, ValueError):
+		return None
+
+# Returns (left, top, right, bottom, position) in pixels of a freeform layout element, or None when a length is
+# missing or not in pixels
+def _freeform_rectangle(layout_element, position):
+	try:
+		left, top = parse_pixels(layout_element["XAxisLocation"]), parse_pixels(layout_element["YAxisLocation"])
+		return left, top, left + parse_pixels(layout_element["Width"]), top + parse_pixels(layout_element["Height"]), position
+	except (KeyError, ValueError):
+		return None
+
+# Returns a copy of value in which the IDs in new_ids are replaced where they appear as an ElementId or
+# CustomActionId, or in TargetVisuals
+def _replace_ids(value, new_ids):
+	if type(value) is list:
+		return [_replace_ids(item, new_ids) for item in value]
+	if type(value) is not dict:
+		return value
+	replaced = {}
+	for key, item in value.items():
+		if key in ("ElementId", "CustomActionId"):
+			replaced[key] = new_ids.get(item, item)
+		elif key == "TargetVisuals":
+			replaced[key] = [new_ids.get(visual_id, visual_id) for visual_id in item]
+		else:
+			replaced[key] = _replace_ids(item, new_ids)
+	return replaced
+
+def _intersect(first, second):
+	return (first[0] < second[0] + second[2] and second[0] < first[0] + first[2]
+		and first[1] < second[1] + second[3] and second[1] < first[1] + first[3])
+
+### TEXTBOX ###
+class TextBox(CompiledObject):
+	def __init__(self, text_box_id, content):
+		self.text_box_id = text_box_id
+		self.content = content
+
+	def compile(self):
+		self.json = _sparse(
+			SheetTextBoxId = self.text_box_id,
+			Content = self.content
+		)
+
+		return self.json
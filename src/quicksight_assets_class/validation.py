@@ -0,0 +1,234 @@
+import datetime
+import difflib
+import re
+import threading
+
+### OFFLINE VALIDATION ###
+# Checks compiled JSON against the QuickSight shape model that botocore ships, so that unknown keys (typos),
+# missing required keys, wrong types, values outside an enum and out-of-range sizes are found before any API call:
+#
+#	for issue in validate_analysis(analysis_1.compile()):
+#		print(issue)
+#
+# The model is read and turned into a lookup table once per process and operation (see get_validator).
+# botocore is only imported then, so the rest of the library does not need it.
+
+# A problem found in compiled JSON. path is a JSON path such as $.Definition.Sheets[0].Visuals[1].TableVisual.subtitle
+class ValidationIssue():
+	def __init__(self, path, code, message):
+		self.path = path
+		# UnknownKey, MissingRequiredKey, InvalidType, InvalidEnumValue, InvalidLength, InvalidRange, InvalidPattern
+		# or InvalidUnion
+		self.code = code
+		self.message = message
+
+	def to_dict(self):
+		return {"Path": self.path, "Code": self.code, "Message": self.message}
+
+	def __str__(self):
+		return "%s: %s" % (self.path, self.message)
+
+	def __repr__(self):
+		return "ValidationIssue(%r, %r, %r)" % (self.path, self.code, self.message)
+
+# Compiled shapes are tuples, indexed by position in SchemaValidator.shapes:
+#	(STRUCTURE, members {name: shape}, required names, is_union)
+#	(LIST, member shape, min, max)
+#	(MAP, key shape, value shape, min, max)
+#	(STRING, enum values or None, min, max, compiled pattern or None)
+#	(NUMBER, accepted types, min, max)
+#	(SCALAR, accepted types, type name)
+#	(DOCUMENT,)
+STRUCTURE, LIST, MAP, STRING, NUMBER, SCALAR, DOCUMENT = range(7)
+
+_NUMBER_TYPES = {
+	"integer": (int,),
+	"long": (int,),
+	"double": (int, float),
+	"float": (int, float)
+}
+_SCALAR_TYPES = {
+	"boolean": (bool,),
+	"timestamp": (str, int, float, datetime.datetime, datetime.date),
+	"blob": (str, bytes, bytearray)
+}
+_JSON_TYPE_NAMES = {dict: "object", list: "array", str: "string", int: "integer", float: "number", bool: "boolean"}
+
+# Validates the input of one QuickSight operation, for example CreateAnalysis
+class SchemaValidator():
+	def __init__(self, operation_name = "CreateAnalysis", service_model = None):
+		if service_model is None:
+			service_model = _load_service_model()
+		self.operation_name = operation_name
+		self.shapes = []
+		self._indexes = {}
+		self.root = self._compile_shape(service_model["operations"][operation_name]["input"]["shape"], service_model["shapes"])
+
+	# Turns the shape and every shape it refers to into tuples. Shapes refer to each other by index,
+	# so recursive shapes are compiled once.
+	def _compile_shape(self, root_name, model_shapes):
+		pending = [root_name]
+		self._index(root_name, pending)
+		while pending:
+			name = pending.pop()
+			shape = model_shapes[name]
+			shape_type = shape["type"]
+			if shape_type == "structure" and shape.get("document"):
+				compiled = (DOCUMENT,)
+			elif shape_type == "structure":
+				members = {member: self._index(definition["shape"], pending) for member, definition in shape.get("members", {}).items()}
+				compiled = (STRUCTURE, members, tuple(shape.get("required", ())), bool(shape.get("union")))
+			elif shape_type == "list":
+				compiled = (LIST, self._index(shape["member"]["shape"], pending), shape.get("min"), shape.get("max"))
+			elif shape_type == "map":
+				compiled = (MAP, self._index(shape["key"]["shape"], pending), self._index(shape["value"]["shape"], pending), shape.get("min"), shape.get("max"))
+			elif shape_type == "string":
+				enum = frozenset(shape["enum"]) if "enum" in shape else None
+				compiled = (STRING, enum, shape.get("min"), shape.get("max"), _compile_pattern(shape.get("pattern")))
+			elif shape_type in _NUMBER_TYPES:
+				compiled = (NUMBER, _NUMBER_TYPES[shape_type], shape.get("min"), shape.get("max"))
+			else:
+				compiled = (SCALAR, _SCALAR_TYPES.get(shape_type, (object,)), shape_type)
+			self.shapes[self._indexes[name]] = compiled
+		return self._indexes[root_name]
+
+	def _index(self, name, pending):
+		if name not in self._indexes:
+			self._indexes[name] = len(self.shapes)
+			self.shapes.append(None)
+			pending.append(name)
+		return self._indexes[name]
+
+	# Returns a list of ValidationIssue, empty when the JSON is valid.
+	# The JSON is walked once with an explicit stack. Paths are kept as (parent, key) pairs and only turned
+	# into strings for the values that have an issue.
+	def validate(self, value):
+		issues = []
+		shapes = self.shapes
+		stack = [(value, self.root, None)]
+		while stack:
+			value, shape_index, path = stack.pop()
+			shape = shapes[shape_index]
+			kind = shape[0]
+
+			if kind == STRUCTURE:
+				if type(value) is not dict:
+					issues.append(_type_issue(path, value, "object"))
+					continue
+				members = shape[1]
+				for key, child in reversed(value.items()):
+					member = members.get(key)
+					if member is None:
+						issues.append(_unknown_key_issue((path, key), key, members))
+					elif child is not None:
+						stack.append((child, member, (path, key)))
+				for key in shape[2]:
+					if key not in value:
+						issues.append(ValidationIssue(_format_path(path), "MissingRequiredKey", "missing required key '%s'" % key))
+				if shape[3] and len(value) != 1:
+					issues.append(ValidationIssue(
+						_format_path(path), "InvalidUnion", "exactly one of %s must be set, found %d" % (", ".join(members), len(value))
+					))
+
+			elif kind == LIST:
+				if type(value) is not list:
+					issues.append(_type_issue(path, value, "array"))
+					continue
+				_check_size(issues, path, len(value), shape[2], shape[3], "items")
+				member = shape[1]
+				for position in range(len(value) - 1, -1, -1):
+					stack.append((value[position], member, (path, position)))
+
+			elif kind == MAP:
+				if type(value) is not dict:
+					issues.append(_type_issue(path, value, "object"))
+					continue
+				_check_size(issues, path, len(value), shape[3], shape[4], "entries")
+				for key, child in reversed(value.items()):
+					stack.append((key, shape[1], (path, key)))
+					stack.append((child, shape[2], (path, key)))
+
+			elif kind == STRING:
+				if type(value) is not str:
+					issues.append(_type_issue(path, value, "string"))
+					continue
+				if shape[1] is not None:
+					if value not in shape[1]:
+						issues.append(_enum_issue(path, value, shape[1]))
+					continue
+				_check_size(issues, path, len(value), shape[2], shape[3], "characters")
+				if shape[4] is not None and not shape[4].search(value):
+					issues.append(ValidationIssue(_format_path(path), "InvalidPattern", "'%s' does not match %s" % (value, shape[4].pattern)))
+
+			elif kind == NUMBER:
+				if type(value) not in shape[1]:
+					issues.append(_type_issue(path, value, "number"))
+					continue
+				if (shape[2] is not None and value < shape[2]) or (shape[3] is not None and value > shape[3]):
+					issues.append(ValidationIssue(_format_path(path), "InvalidRange", "%r is outside %s..%s" % (
+						value, "" if shape[2] is None else shape[2], "" if shape[3] is None else shape[3])))
+
+			elif kind == SCALAR:
+				if not isinstance(value, shape[1]) or (bool in shape[1]) != (type(value) is bool):
+					issues.append(_type_issue(path, value, shape[2]))
+		return issues
+
+# operation name -> SchemaValidator
+_validators = {}
+_validators_lock = threading.Lock()
+
+# Returns the validator of an operation, building it on first use. Later calls in the same process reuse it.
+def get_validator(operation_name = "CreateAnalysis"):
+	with _validators_lock:
+		if operation_name not in _validators:
+			_validators[operation_name] = SchemaValidator(operation_name)
+		return _validators[operation_name]
+
+# Validates the output of Analysis.compile(). Use get_validator("CreateDashboard") or get_validator("CreateTemplate")
+# for dashboards and templates.
+def validate_analysis(analysis_json):
+	return get_validator("CreateAnalysis").validate(analysis_json)
+
+def _load_service_model():
+	import botocore.session
+
+	return botocore.session.get_session().get_component("data_loader").load_service_model("quicksight", "service-2")
+
+# Patterns use the regular expression syntax of the service; the few that Python cannot compile are not checked
+def _compile_pattern(pattern):
+	if pattern is None:
+		return None
+	try:
+		return re.compile(pattern)
+	except re.error:
+		return None
+
+def _format_path(path):
+	keys = []
+	while path is not None:
+		path, key = path
+		keys.append(key)
+	text = "$"
+	for key in reversed(keys):
+		text += "[%d]" % key if type(key) is int else "." + key
+	return text
+
+def _check_size(issues, path, size, minimum, maximum, unit):
+	if minimum is not None and size < minimum:
+		issues.append(ValidationIssue(_format_path(path), "InvalidLength", "%d %s, at least %d expected" % (size, unit, minimum)))
+	elif maximum is not None and size > maximum:
+		issues.append(ValidationIssue(_format_path(path), "InvalidLength", "%d %s, at most %d expected" % (size, unit, maximum)))
+
+def _type_issue(path, value, expected):
+	return ValidationIssue(_format_path(path), "InvalidType", "expected %s, found %s" % (expected, _JSON_TYPE_NAMES.get(type(value), type(value).__name__)))
+
+def _unknown_key_issue(path, key, members):
+	message = "unknown key '%s'" % key
+	suggestions = difflib.get_close_matches(key, list(members), 1) or [member for member in members if member.lower() == key.lower()]
+	if suggestions:
+		message += " (did you mean '%s'?)" % suggestions[0]
+	return ValidationIssue(_format_path(path), "UnknownKey", message)
+
+def _enum_issue(path, value, enum):
+	message = "'%s' is not one of %s" % (value, ", ".join(sorted(enum)))
+	return ValidationIssue(_format_path(path), "InvalidEnumValue", message)
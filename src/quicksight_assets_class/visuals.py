@@ -0,0 +1,1311 @@
+from .core import CompiledObject, _sparse, clean_dict
+
+### VISUALS ###
+class Visual(CompiledObject):
+	__slots__ = ("id", "actions", "title", "subtitle", "column_hierarchies", "conditional_formatting", "sizes", "category", "values", "colors", "small_multiples", "groups")
+	element_type = "VISUAL"
+
+	def __init__(self, visual_id):
+		# Available in All Visuals: id, actions, title, subtitle
+		# Available in BarChart, LineChart, etc: column_hierarchies
+		# Available in TableVisual, etc.: conditional_formatting
+		# Available in Scatterplot, Points on Map, Tree Map: sizes
+		# Field wells (category, values, colors, small_multiples, groups, ...) and the other list and dict settings 
+		# are not allocated here. They read as empty until something is added to them (see _LAZY_FIELDS).
+		self.id = visual_id
+
+	# Returns a copy of this visual with a new id. The copy shares its lists and dicts with this visual until either
+	# of them changes one. Keyword arguments replace attributes on the copy, for example orientation = "VERTICAL".
+	def clone(self, new_id, **overrides):
+		return self._clone("id", new_id)._override(overrides)
+
+	def add_title(self, visibility, text_format, text):
+		self.title = _sparse(
+			Visibility = visibility,
+			FormatText = _sparse({
+				text_format: text
+			})
+		)
+
+	def add_subtitle(self, visibility, text_format, text):
+		self.subtitle = _sparse(
+			Visibility = visibility,
+			FormatText = _sparse({
+				text_format: text
+			})
+		)
+
+	def add_categorical_dimension_field(self, column_name, data_set_identifier):
+		self._field_well("category").append(
+			_sparse(
+				CategoricalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					)
+				)
+			))
+
+	def add_date_dimension_field(self, column_name, data_set_identifier, date_granularity = "", date_time_format = "", null_string = ""):
+		self._field_well("category").append(
+			_sparse(
+				DateDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					DateGranularity = date_granularity,
+					FormatConfiguration = _sparse(
+						DateTimeFormat = date_time_format,
+						NullValueFormatConfiguration = _sparse(
+							NullString = null_string
+						),
+						NumericFormatConfiguration = {}
+					)
+				)
+			))
+
+	def add_numerical_dimension_field(self, column_name, data_set_identifier, hierarchy_id = ""):
+		self._field_well("category").append(
+			_sparse(
+				NumericalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					NumberFormatConfiguration = _sparse(
+						CurrencyDisplayFormatConfiguration = {},
+						NumberDisplayFormatConfiguration = {},
+						PercentageDisplayFormatConfiguration = {}
+					),
+					HierarchyId = hierarchy_id
+				)
+			))
+
+	def add_numerical_measure_field(self, column_name, data_set_identifier, aggregation_function = None, 
+				 currency_decimal_places = '', currency_number_scale = '', currency_prefix = '', currency_suffix = '',currency_symbol = '',
+				 percentage_suffix = ''):
+		self._field_well("values").append(
+				_sparse(
+					NumericalMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = _sparse(
+							SimpleNumericalAggregation = aggregation_function
+						),
+						FormatConfiguration = _sparse(
+							FormatConfiguration = _sparse(
+								CurrencyDisplayFormatConfiguration = _sparse(
+									DecimalPlacesConfiguration = _sparse(
+										DecimalPlaces = currency_decimal_places
+									),
+									NumberScale = currency_number_scale,
+									Prefix = currency_prefix,
+									Suffix = currency_suffix,
+									Symbol = currency_symbol
+								),
+								NumberDisplayFormatConfiguration = {},
+								PercentageDisplayFormatConfiguration = _sparse(
+									Suffix = percentage_suffix
+								)
+							)
+						)
+					)
+				))
+	
+	def add_calculated_measure_field(self, expression, field_id):
+		self._field_well("values").append(
+				_sparse(
+					CalculatedMeasureField = _sparse(
+						FieldId = field_id,
+						Expression = expression
+					)
+				))
+		
+	def add_date_measure_field(self, column_name, data_set_identifier, aggregation_function = None):
+		self._field_well("values").append(
+				_sparse(
+					DateMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = clean_dict(aggregation_function)
+					)
+				))
+
+	def add_categorical_measure_field(self, column_name, data_set_identifier, aggregation_function = None):
+		self._field_well("values").append(
+				_sparse(
+					CategoricalMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = clean_dict(aggregation_function)
+					)
+				))
+		
+
+
+	def add_column_hierarchy(self, hierarchy_id, column_names, data_set_identifier):
+		columns = []
+		for column_name in column_names:
+			columns.append(
+				_sparse(
+					DataSetIdentifier = data_set_identifier,
+					ColumnName = column_name
+				)
+			)
+
+		self._field_well("column_hierarchies").append(
+			_sparse(
+				ExplicitHierarchy = _sparse(
+					HierarchyId = hierarchy_id,
+					Columns = columns,
+					DrillDownFilters = []
+				)
+			)
+		)
+
+		if hierarchy_id:
+			# The first category field is replaced rather than changed, since earlier output may hold it
+			category = self._field_well("category")
+			category[0] = dict(category[0], CategoricalDimensionField = dict(category[0]["CategoricalDimensionField"], HierarchyId = hierarchy_id))
+
+	def add_filter_action(self,custom_action_id, action_name, trigger, status = "ENABLED", selected_field_options = "", selected_fields = None, target_visual_options = None, target_visuals = None):
+		self._field_well("actions").append(_sparse(
+			ActionOperations = [
+				_sparse(
+					FilterOperation = _sparse(
+						SelectedFieldsConfiguration = _sparse(
+							SelectedFieldOptions = selected_field_options,
+							SelectedFields = clean_dict(selected_fields)
+						),
+						TargetVisualsConfiguration = _sparse(
+							SameSheetTargetVisualConfiguration = _sparse(
+								TargetVisualOptions = clean_dict(target_visual_options),
+								TargetVisuals = clean_dict(target_visuals)
+							)
+						)
+					)
+				)
+			],
+			CustomActionId = custom_action_id,
+			Name = action_name,
+			Trigger = trigger,
+			Status = status
+		))
+
+	# Custom action IDs must be unique, so a cloned visual usually needs its actions renamed
+	def set_custom_action_id(self, custom_action_id, new_custom_action_id):
+		actions = self._field_well("actions")
+		for index, action in enumerate(actions):
+			if action["CustomActionId"] == custom_action_id:
+				actions[index] = dict(action, CustomActionId = new_custom_action_id)
+
+class BarChartVisual(Visual):
+	__slots__ = ("bars_arrangement", "orientation", "axis_line_visibility", "axis_offset", "grid_line_visibility", "scroll_bar_visibility", "visible_range_from", "visible_range_to")
+
+	def __init__(self, visual_id):
+		Visual.__init__(self, visual_id)
+
+		self.bars_arrangement = ""
+		self.orientation = ""
+
+		self.axis_line_visibility = ""
+		self.axis_offset = ""
+		self.grid_line_visibility = ""
+		self.scroll_bar_visibility = ""
+		self.visible_range_from = ""
+		self.visible_range_to = ""
+
+	def set_bars_arrangement(self, bars_arrangement):
+		self.bars_arrangement = bars_arrangement
+
+	def set_orientation(self, orientation):
+		self.orientation = orientation
+
+	def set_scroll_bar_visibility(self, scroll_bar_visibility):
+		self.scroll_bar_visibility = scroll_bar_visibility
+
+	def compile(self):
+		self.json = _sparse(
+			BarChartVisual = _sparse(
+				VisualId = self.id,
+				Actions = self.actions,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						BarChartAggregatedFieldWells = _sparse(
+							Category = self.category,
+							Values = self.values,
+							Colors = self.colors,
+							SmallMultiples = self.small_multiples
+						)
+					),
+					BarsArrangement = self.bars_arrangement,
+					Orientation = self.orientation,
+					CategoryAxis = _sparse(
+						AxisLineVisibility = self.axis_line_visibility,
+						AxisOffset = self.axis_offset,
+						GridLineVisibility = self.grid_line_visibility,
+						ScrollbarOptions = _sparse(
+							Visibility = self.scroll_bar_visibility,
+							VisibleRange = _sparse(
+								PercentRange = _sparse(
+									From = self.visible_range_from,
+									To = self.visible_range_to
+								)
+							)
+						)
+					)
+				),
+				ColumnHierarchies = self.column_hierarchies,
+				Title = self.title,
+				Subtitle = self.subtitle
+
+			)
+		)
+
+		return self.json
+	
+class LineChartVisual(Visual):
+	__slots__ = ("type", "axis_line_visibility", "axis_offset", "grid_line_visibility", "scroll_bar_visibility", "visible_range_from", "visible_range_to")
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+		self.type = ""
+		self.axis_line_visibility = ""
+		self.axis_offset = ""
+		self.grid_line_visibility = ""
+		self.scroll_bar_visibility = ""
+		self.visible_range_from = ""
+		self.visible_range_to = ""
+	
+	def set_type(self, type):
+		self.type = type
+
+	def set_scroll_bar_visibility(self, scroll_bar_visibility):
+		self.scroll_bar_visibility = scroll_bar_visibility
+
+	def compile(self):
+		self.json = _sparse(
+			LineChartVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						LineChartAggregatedFieldWells = _sparse(
+							Category = self.category,
+							Values = self.values,
+							Colors = self.colors,
+							SmallMultiples = self.small_multiples
+						)
+					),
+					XAxisDisplayOptions = _sparse(
+						AxisLineVisibility = self.axis_line_visibility,
+						AxisOffset = self.axis_offset,
+						GridLineVisibility = self.grid_line_visibility,
+						ScrollbarOptions = _sparse(
+							Visibility = self.scroll_bar_visibility,
+							VisibleRange = _sparse(
+								PercentRange = _sparse(
+									From = self.visible_range_from,
+									To = self.visible_range_to
+								)
+							)
+						)
+					),
+					Type = self.type
+
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+	
+class TableVisual(Visual):
+	__slots__ = ("unaggregated_values", "field_sort", "inline_visualizations", "conditional_formatting_options", "cell_background_color", "header_background_color", "cell_border", "header_border")
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+		self.cell_background_color = ""
+		self.header_background_color = ""
+	
+	def add_unaggregated_date_time_value(self, column_name, data_set_identifier, date_time_format="", null_string=""):
+		self._field_well("unaggregated_values").append(
+			_sparse(
+				UnaggregatedField = _sparse(
+					FieldId = data_set_identifier + column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+						),
+					FormatConfiguration = _sparse(
+						DateTimeFormatConfiguration = _sparse(
+							DateTimeFormat = date_time_format,
+							NullValueFormatConfiguration = _sparse(
+								NullString = null_string
+							),
+							NumericFormatConfiguration = ""
+						)
+					)
+				)
+			))
+
+	def add_field_sort(self, field_id, direction):
+		self._field_well("field_sort").append(_sparse(
+			FieldSort = _sparse(
+				Direction = direction,
+				FieldId = field_id
+			)
+		))
+
+	def set_cell_border_type(self, border_type, color = "", style="", thickness=""):
+
+		border_options = _sparse({
+			border_type: _sparse(
+				Color = color,
+				Style = style,
+				Thickness = thickness
+			)
+		})
+
+		if border_type == "UniformBorder":
+			self.cell_border = border_options
+		else:
+			self.cell_border = _sparse(
+				SideSpecificBorder = border_options
+			)
+	
+	def set_header_border_type(self, border_type, color = "", style="", thickness=""):
+		border_options = _sparse({
+			border_type: _sparse(
+				Color = color,
+				Style = style,
+				Thickness = thickness
+			)
+		})
+
+		if border_type == "UniformBorder":
+			self.header_border = border_options
+		else:
+			self.header_border = _sparse(
+				SideSpecificBorder = border_options
+			)
+
+	def add_inline_visualization(self, field_id, negative_color = "", positive_color = ""):
+		self._field_well("inline_visualizations").append(_sparse(
+			DataBars = _sparse(
+				FieldId = field_id,
+				NegativeColor = negative_color,
+				PositiveColor = positive_color
+			)
+		))
+
+	def add_icon_conditional_formatting(self, field_id, expression, icon = "", unicode_icon = "", color = "", icon_display_option = ""):
+		self._field_well("conditional_formatting_options").append(_sparse(
+			Cell = _sparse(
+				FieldId = field_id,
+				TextFormat = _sparse(
+					Icon = _sparse(
+						CustomCondition = _sparse(
+							Expression = expression,
+							IconOptions = _sparse(
+								Icon = icon,
+								UnicodeIcon = unicode_icon
+							),
+							Color = color,
+							DisplayConfiguration = _sparse(
+								IconDisplayOption = icon_display_option
+							)
+						),
+						# "IconSet": {
+						# 	"Expression": icon_set_expression,
+						# 	# PLUS_MINUS | CHECK_X | THREE_COLOR_ARROW | THREE_GRAY_ARROW | CARET_UP_MINUS_DOWN | THREE_SHAPE | 
+						# 	# THREE_CIRCLE | FLAGS | BARS | FOUR_COLOR_ARROW | FOUR_GRAY_ARROW
+						# 	"IconSetType": icon_set_type
+						# }
+					)
+				)
+			)
+		)
+		)
+
+	def add_gradient_text_conditional_formatting(self, field_id, expression, gradient_stops = None):
+		self._field_well("conditional_formatting_options").append(_sparse(
+			Cell = _sparse(
+				FieldId = field_id,
+				TextFormat = _sparse(
+					TextColor = _sparse(
+						Gradient = _sparse(
+							Expression = expression,
+							Color = _sparse(
+								Stops = clean_dict(gradient_stops)
+							)
+						)
+					)
+				)
+			)
+		)
+		)		
+
+	def compile(self):
+		self.json = _sparse(
+			TableVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						TableAggregatedFieldWells = _sparse(
+							GroupBy = self.category,
+							Values = self.values
+						),
+						TableUnaggregatedFieldWells = _sparse(
+							Values = self.unaggregated_values
+						)
+					),
+					SortConfiguration = _sparse(
+						RowSort = self.field_sort
+					),
+					TableInlineVisualizations = self.inline_visualizations,
+					TableOptions = _sparse(
+						CellStyle = _sparse(
+							BackgroundColor = self.cell_background_color,
+							Border = self.cell_border
+						),
+						HeaderStyle = _sparse(
+							BackgroundColor = self.header_background_color,
+							Border = self.header_border
+						)
+					)
+				),
+				ConditionalFormatting = _sparse(
+					ConditionalFormattingOptions = self.conditional_formatting_options
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+	
+class PivotTableVisual(Visual):
+	__slots__ = ("unaggregated_values",)
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def add_unaggregated_date_time_value(self, column_name, data_set_identifier, date_time_format="", null_string=""):
+		self._field_well("unaggregated_values").append(
+			_sparse(
+				UnaggregatedField = _sparse(
+					FieldId = data_set_identifier + column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+						),
+					FormatConfiguration = _sparse(
+						DateTimeFormatConfiguration = _sparse(
+							DateTimeFormat = date_time_format,
+							NullValueFormatConfiguration = _sparse(
+								NullString = null_string
+							),
+							NumericFormatConfiguration = ""
+						)
+					)
+				)
+			))
+
+	def add_group_by(self, column_name, data_set_identifier):
+		self.add_categorical_dimension_field(column_name, data_set_identifier)
+
+	def add_calculated_measure_field(self, expression, field_id):
+		self._field_well("values").append(
+				_sparse(
+					CalculatedMeasureField = _sparse(
+						FieldId = field_id,
+						Expression = expression
+					)
+				))
+
+class KPIVisual(Visual):
+	__slots__ = ("target_values", "trend_groups")
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def compile(self):
+		self.json = _sparse(
+			KPIVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+
+						TargetValues = self.target_values,
+						TrendGroups = self.trend_groups,
+						Values = self.values
+
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+
+class PieChartVisual(Visual):
+	__slots__ = ("donut_type",)
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+		# The option for define the arc of the chart shape. Valid values are as follows: 
+		# WHOLE - A pie chart | SMALL- A small-sized donut chart | MEDIUM- A medium-sized donut chart | LARGE- A large-sized donut chart
+		self.donut_type = ""
+
+	def set_donut_type(self, donut_type):
+		self.donut_type = donut_type
+
+	def compile(self):
+		self.json = _sparse(
+			PieChartVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						PieChartAggregatedFieldWells = _sparse(
+							Category = self.category,
+							Values = self.values,
+							SmallMultiples = self.small_multiples
+						)
+					),
+					DonutOptions = _sparse(
+						ArcOptions = _sparse(
+							ArcThickness = self.donut_type
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+	
+class ScatterPlotVisual(Visual):
+	__slots__ = ("x_axis", "y_axis")
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def compile(self):
+		self.json = _sparse(
+			ScatterPlotVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						ScatterPlotCategoricallyAggregatedFieldWells = _sparse(
+							Category = self.category
+						),
+						ScatterPlotUnaggregatedFieldWells = _sparse(
+							Category = self.category
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+
+class TreeMapVisual(Visual):
+	__slots__ = ()
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def add_group_categorical_dimension_field(self, column_name, data_set_identifier):
+		self._field_well("groups").append(
+			_sparse(
+				CategoricalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					)
+				)
+			))
+
+	def add_group_date_dimension_field(self, column_name, data_set_identifier, date_granularity = "", date_time_format = "", null_string = ""):
+		self._field_well("groups").append(
+			_sparse(
+				DateDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					DateGranularity = date_granularity,
+					FormatConfiguration = _sparse(
+						DateTimeFormat = date_time_format,
+						NullValueFormatConfiguration = _sparse(
+							NullString = null_string
+						),
+						NumericFormatConfiguration = {}
+					)
+				)
+			))
+
+	def add_group_numerical_dimension_field(self, column_name, data_set_identifier, hierarchy_id = ""):
+		self._field_well("groups").append(
+			_sparse(
+				NumericalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					NumberFormatConfiguration = _sparse(
+						CurrencyDisplayFormatConfiguration = {},
+						NumberDisplayFormatConfiguration = {},
+						PercentageDisplayFormatConfiguration = {}
+					),
+					HierarchyId = hierarchy_id
+				)
+			))
+
+	def add_color_numerical_measure_field(self, column_name, data_set_identifier, aggregation_function = None, 
+				 currency_decimal_places = '', currency_number_scale = '', currency_prefix = '', currency_suffix = '',currency_symbol = '',
+				 percentage_suffix = ''):
+		self._field_well("colors").append(
+				_sparse(
+					NumericalMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = _sparse(
+							SimpleNumericalAggregation = aggregation_function
+						),
+						FormatConfiguration = _sparse(
+							FormatConfiguration = _sparse(
+								CurrencyDisplayFormatConfiguration = _sparse(
+									DecimalPlacesConfiguration = _sparse(
+										DecimalPlaces = currency_decimal_places
+									),
+									NumberScale = currency_number_scale,
+									Prefix = currency_prefix,
+									Suffix = currency_suffix,
+									Symbol = currency_symbol
+								),
+								NumberDisplayFormatConfiguration = {},
+								PercentageDisplayFormatConfiguration = _sparse(
+									Suffix = percentage_suffix
+								)
+							)
+						)
+					)
+				))
+		
+	def add_color_categorical_measure_field(self, column_name, data_set_identifier, aggregation_function = None):
+		self._field_well("colors").append(
+				_sparse(
+					CategoricalMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = clean_dict(aggregation_function)
+					)
+				))
+		
+	def add_color_date_dimension_field(self, column_name, data_set_identifier, aggregation_function = "", date_time_format = "", null_string = ""):
+		self._field_well("colors").append(
+			_sparse(
+				DateDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					AggregationFunction = clean_dict(aggregation_function),
+					FormatConfiguration = _sparse(
+						DateTimeFormat = date_time_format,
+						NullValueFormatConfiguration = _sparse(
+							NullString = null_string
+						),
+						NumericFormatConfiguration = {}
+					)
+				)
+			))
+		
+	def add_size_numerical_measure_field(self, column_name, data_set_identifier, aggregation_function = None, 
+				 currency_decimal_places = '', currency_number_scale = '', currency_prefix = '', currency_suffix = '',currency_symbol = '',
+				 percentage_suffix = ''):
+		self._field_well("sizes").append(
+				_sparse(
+					NumericalMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = _sparse(
+							SimpleNumericalAggregation = aggregation_function
+						),
+						FormatConfiguration = _sparse(
+							FormatConfiguration = _sparse(
+								CurrencyDisplayFormatConfiguration = _sparse(
+									DecimalPlacesConfiguration = _sparse(
+										DecimalPlaces = currency_decimal_places
+									),
+									NumberScale = currency_number_scale,
+									Prefix = currency_prefix,
+									Suffix = currency_suffix,
+									Symbol = currency_symbol
+								),
+								NumberDisplayFormatConfiguration = {},
+								PercentageDisplayFormatConfiguration = _sparse(
+									Suffix = percentage_suffix
+								)
+							)
+						)
+					)
+				))
+		
+	def add_size_categorical_measure_field(self, column_name, data_set_identifier, aggregation_function = None):
+		self._field_well("sizes").append(
+				_sparse(
+					CategoricalMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = clean_dict(aggregation_function)
+					)
+				))
+		
+	def add_size_date_dimension_field(self, column_name, data_set_identifier, aggregation_function = "", date_time_format = "", null_string = ""):
+		self._field_well("sizes").append(
+			_sparse(
+				DateDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					AggregationFunction = clean_dict(aggregation_function),
+					FormatConfiguration = _sparse(
+						DateTimeFormat = date_time_format,
+						NullValueFormatConfiguration = _sparse(
+							NullString = null_string
+						),
+						NumericFormatConfiguration = {}
+					)
+				)
+			))
+		
+	def compile(self):
+		self.json = _sparse(
+			TreeMapVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						TreeMapAggregatedFieldWells = _sparse(
+							Colors = self.colors,
+							Groups = self.groups,
+							Sizes = self.sizes
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+
+class WaterfallVisual(Visual):
+	__slots__ = ("breakdowns",)
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def add_breakdown_categorical_dimension_field(self, column_name, data_set_identifier):
+		self._field_well("breakdowns").append(
+			_sparse(
+				CategoricalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					)
+				)
+			))
+
+	def add_breakdown_date_dimension_field(self, column_name, data_set_identifier, date_granularity = "", date_time_format = "", null_string = ""):
+		self._field_well("breakdowns").append(
+			_sparse(
+				DateDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					DateGranularity = date_granularity,
+					FormatConfiguration = _sparse(
+						DateTimeFormat = date_time_format,
+						NullValueFormatConfiguration = _sparse(
+							NullString = null_string
+						),
+						NumericFormatConfiguration = {}
+					)
+				)
+			))
+
+	def add_breakdown_numerical_dimension_field(self, column_name, data_set_identifier, hierarchy_id = ""):
+		self._field_well("breakdowns").append(
+			_sparse(
+				NumericalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					NumberFormatConfiguration = _sparse(
+						CurrencyDisplayFormatConfiguration = {},
+						NumberDisplayFormatConfiguration = {},
+						PercentageDisplayFormatConfiguration = {}
+					),
+					HierarchyId = hierarchy_id
+				)
+			))
+
+	def compile(self):
+		self.json = _sparse(
+			WaterfallVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						WaterfallChartAggregatedFieldWells = _sparse(
+							Breakdowns = self.breakdowns,
+							Categories = self.category,
+							Values = self.values
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+	
+class FilledMapVisual(Visual):
+	__slots__ = ("geospatial",)
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def add_geospatial_categorical_dimension_field(self, column_name, data_set_identifier):
+		self._field_well("geospatial").append(
+			_sparse(
+				CategoricalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					)
+				)
+			))
+
+	def compile(self):
+		self.json = _sparse(
+			FilledMapVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						FilledMapAggregatedFieldWells = _sparse(
+							Geospatial = self.geospatial,
+							Values = self.values
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+	
+class GeospatialMapVisual(Visual):
+	__slots__ = ("geospatial",)
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def add_geospatial_categorical_dimension_field(self, column_name, data_set_identifier):
+		self._field_well("geospatial").append(
+			_sparse(
+				CategoricalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					)
+				)
+			))
+		
+	def add_color_categorical_dimension_field(self, column_name, data_set_identifier):
+		self._field_well("colors").append(
+			_sparse(
+				CategoricalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					)
+				)
+			))
+		
+	def add_color_date_dimension_field(self, column_name, data_set_identifier, aggregation_function = "", date_time_format = "", null_string = ""):
+		self._field_well("colors").append(
+			_sparse(
+				DateDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					AggregationFunction = clean_dict(aggregation_function),
+					FormatConfiguration = _sparse(
+						DateTimeFormat = date_time_format,
+						NullValueFormatConfiguration = _sparse(
+							NullString = null_string
+						),
+						NumericFormatConfiguration = {}
+					)
+				)
+			))
+		
+	def add_color_numerical_dimension_field(self, column_name, data_set_identifier, hierarchy_id = ""):
+		self._field_well("colors").append(
+			_sparse(
+				NumericalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					NumberFormatConfiguration = _sparse(
+						CurrencyDisplayFormatConfiguration = {},
+						NumberDisplayFormatConfiguration = {},
+						PercentageDisplayFormatConfiguration = {}
+					),
+					HierarchyId = hierarchy_id
+				)
+			))		
+			
+	def compile(self):
+		self.json = _sparse(
+			GeospatialMapVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						GeospatialMapAggregatedFieldWells = _sparse(
+							Colors = self.colors,
+							Geospatial = self.geospatial,
+							Values = self.values
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+	
+class FunnelChartVisual(Visual):
+	__slots__ = ()
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def compile(self):
+		self.json = _sparse(
+			FunnelChartVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						FunnelChartAggregatedFieldWells = _sparse(
+							Category = self.category,
+							Values = self.values,
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+
+class HeatMapVisual(Visual):
+	__slots__ = ("columns", "rows")
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def add_column_categorical_dimension_field(self, column_name, data_set_identifier):
+		self._field_well("columns").append(
+			_sparse(
+				CategoricalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					)
+				)
+			))
+		
+	def add_column_date_dimension_field(self, column_name, data_set_identifier, aggregation_function = "", date_time_format = "", null_string = ""):
+		self._field_well("columns").append(
+			_sparse(
+				DateDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					AggregationFunction = clean_dict(aggregation_function),
+					FormatConfiguration = _sparse(
+						DateTimeFormat = date_time_format,
+						NullValueFormatConfiguration = _sparse(
+							NullString = null_string
+						),
+						NumericFormatConfiguration = {}
+					)
+				)
+			))
+		
+	def add_column_numerical_dimension_field(self, column_name, data_set_identifier, hierarchy_id = ""):
+		self._field_well("columns").append(
+			_sparse(
+				NumericalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					NumberFormatConfiguration = _sparse(
+						CurrencyDisplayFormatConfiguration = {},
+						NumberDisplayFormatConfiguration = {},
+						PercentageDisplayFormatConfiguration = {}
+					),
+					HierarchyId = hierarchy_id
+				)
+			))		
+	
+	def add_row_categorical_dimension_field(self, column_name, data_set_identifier):
+		self._field_well("rows").append(
+			_sparse(
+				CategoricalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					)
+				)
+			))
+		
+	def add_row_date_dimension_field(self, column_name, data_set_identifier, aggregation_function = "", date_time_format = "", null_string = ""):
+		self._field_well("rows").append(
+			_sparse(
+				DateDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					AggregationFunction = clean_dict(aggregation_function),
+					FormatConfiguration = _sparse(
+						DateTimeFormat = date_time_format,
+						NullValueFormatConfiguration = _sparse(
+							NullString = null_string
+						),
+						NumericFormatConfiguration = {}
+					)
+				)
+			))
+		
+	def add_row_numerical_dimension_field(self, column_name, data_set_identifier, hierarchy_id = ""):
+		self._field_well("rows").append(
+			_sparse(
+				NumericalDimensionField = _sparse(
+					FieldId = column_name,
+					Column = _sparse(
+						ColumnName = column_name,
+						DataSetIdentifier = data_set_identifier
+					),
+					NumberFormatConfiguration = _sparse(
+						CurrencyDisplayFormatConfiguration = {},
+						NumberDisplayFormatConfiguration = {},
+						PercentageDisplayFormatConfiguration = {}
+					),
+					HierarchyId = hierarchy_id
+				)
+			))		
+	
+	def compile(self):
+		self.json = _sparse(
+			HeatMapVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						HeatMapAggregatedFieldWells = _sparse(
+							Columns = self.columns,
+							Rows = self.rows,
+							Values = self.values
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+	
+class BoxPlotVisual(Visual):
+	__slots__ = ()
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def compile(self):
+		self.json = _sparse(
+			BoxPlotVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						BoxPlotAggregatedFieldWells = _sparse(
+							GroupBy = self.category,
+							Values = self.values
+						)
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
+
+class GaugeChartVisual(Visual):
+	__slots__ = ("target_values",)
+
+	def __init__(self, visual_id):
+		Visual.__init__(self,visual_id)
+
+	def add_target_value_calculated_measure_field(self, expression, field_id):
+		self._field_well("target_values").append(
+				_sparse(
+					CalculatedMeasureField = _sparse(
+						FieldId = field_id,
+						Expression = expression
+					)
+				))
+		
+	def add_target_value_date_measure_field(self, column_name, data_set_identifier, aggregation_function = None):
+		self._field_well("target_values").append(
+				_sparse(
+					DateMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = clean_dict(aggregation_function)
+					)
+				))
+
+	def add_target_value_numerical_measure_field(self, column_name, data_set_identifier, aggregation_function = None, 
+				 currency_decimal_places = '', currency_number_scale = '', currency_prefix = '', currency_suffix = '',currency_symbol = '',
+				 percentage_suffix = ''):
+		self._field_well("target_values").append(
+				_sparse(
+					NumericalMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = _sparse(
+							SimpleNumericalAggregation = aggregation_function
+						),
+						FormatConfiguration = _sparse(
+							FormatConfiguration = _sparse(
+								CurrencyDisplayFormatConfiguration = _sparse(
+									DecimalPlacesConfiguration = _sparse(
+										DecimalPlaces = currency_decimal_places
+									),
+									NumberScale = currency_number_scale,
+									Prefix = currency_prefix,
+									Suffix = currency_suffix,
+									Symbol = currency_symbol
+								),
+								NumberDisplayFormatConfiguration = {},
+								PercentageDisplayFormatConfiguration = _sparse(
+									Suffix = percentage_suffix
+								)
+							)
+						)
+					)
+				))
+		
+	def add_target_value_categorical_measure_field(self, column_name, data_set_identifier, aggregation_function = None):
+		self._field_well("target_values").append(
+				_sparse(
+					CategoricalMeasureField = _sparse(
+						FieldId = column_name,
+						Column = _sparse(
+							ColumnName = column_name,
+							DataSetIdentifier = data_set_identifier
+						),
+						AggregationFunction = clean_dict(aggregation_function)
+					)
+				))
+		
+
+	def compile(self):
+		self.json = _sparse(
+			GaugeChartVisual = _sparse(
+				VisualId = self.id,
+				ChartConfiguration = _sparse(
+					FieldWells = _sparse(
+						TargetValues = self.target_values,
+						Values = self.values
+					)
+				),
+				Title = self.title,
+				Subtitle = self.subtitle
+			)
+		)
+
+		return self.json
@@ -0,0 +1,757 @@
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+########################################################################
+### Deploys many compiled analyses at once through a shared client ###
+########################################################################
+
+# Keys of a compiled analysis that each API accepts, besides AwsAccountId, AnalysisId, Name and Definition
+CREATE_ANALYSIS_KEYS = ["Parameters", "Permissions", "SourceEntity", "Tags", "ThemeArn"]
+UPDATE_ANALYSIS_KEYS = ["Parameters", "SourceEntity", "ThemeArn"]
+
+# Resource tag that holds the fingerprint of the deployed definition
+FINGERPRINT_TAG_KEY = "DefinitionFingerprint"
+
+# Prefix of a fingerprint that was sent to QuickSight, but whose create or update was not yet seen to succeed
+FINGERPRINT_PENDING_PREFIX = "pending:"
+
+# Returns a stable hash of everything update_analysis would send for a compiled analysis.
+# Keys are sorted and whitespace is dropped so that the hash only changes when the content does.
+def fingerprint(analysis_json):
+	request = _request(analysis_json, UPDATE_ANALYSIS_KEYS)
+	canonical = json.dumps(request, sort_keys = True, separators = (",", ":"), ensure_ascii = False)
+	return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+# Keeps the fingerprints of deployed analyses in a local JSON file, keyed by account and analysis ID
+class FingerprintManifest():
+	def __init__(self, path):
+		self.path = path
+		self.fingerprints = {}
+		self._lock = threading.Lock()
+
+		if os.path.exists(path):
+			with open(path, "r") as infile:
+				self.fingerprints = json.load(infile)
+
+	def get(self, analysis_json):
+		with self._lock:
+			return self.fingerprints.get(_manifest_key(analysis_json))
+
+	def put(self, analysis_json, value):
+		with self._lock:
+			self.fingerprints[_manifest_key(analysis_json)] = value
+
+	def save(self):
+		with self._lock:
+			with open(self.path, "w") as outfile:
+				json.dump(self.fingerprints, outfile, indent = 2, sort_keys = True)
+
+# Keeps the fingerprint on the analysis itself as a resource tag, so every machine that deploys sees the same value.
+# Reading the tag costs one ListTagsForResource call, which is far cheaper than an update and its re-render.
+class FingerprintTagStore():
+	def __init__(self, client):
+		self.client = client
+
+	def get(self, analysis_json):
+		try:
+			response = self.client.list_tags_for_resource(ResourceArn = _analysis_arn(self.client, analysis_json))
+		except ClientError as error:
+			if error.response["Error"]["Code"] == "ResourceNotFoundException":
+				return None
+			raise
+		for tag in response.get("Tags", []):
+			if tag["Key"] == FINGERPRINT_TAG_KEY:
+				return tag["Value"]
+		return None
+
+	def put(self, analysis_json, value):
+		self.client.tag_resource(
+			ResourceArn = _analysis_arn(self.client, analysis_json),
+			Tags = [{"Key": FINGERPRINT_TAG_KEY, "Value": value}]
+		)
+
+	def save(self):
+		pass
+
+# Creates a QuickSight client whose connection pool is large enough for max_workers concurrent calls.
+# botocore clients are thread-safe, so one client is shared by every worker thread.
+def create_quicksight_client(max_workers = 10, region_name = None, session = None):
+	config = Config(
+		max_pool_connections = max_workers,
+		retries = {"max_attempts": 10, "mode": "adaptive"}
+	)
+	session = session or boto3.session.Session()
+	return session.client("quicksight", region_name = region_name, config = config)
+
+class DeploymentResult():
+	def __init__(self, aws_account_id, analysis_id, resource_type = "ANALYSIS"):
+		self.aws_account_id = aws_account_id
+
+		# The ID of the analysis, or of the template or dashboard when resource_type is TEMPLATE or DASHBOARD
+		self.analysis_id = analysis_id
+		self.resource_type = resource_type
+
+		# CREATED | UPDATED | SKIPPED | CHANGED | FAILED
+		# CHANGED is only used in dry runs, for analyses that would be deployed
+		self.operation = ""
+
+		# Fingerprint of the compiled definition
+		self.fingerprint = ""
+
+		# Size of the request body that was (or would have been) sent, and whether the analysis was minified to fit the budget
+		self.payload_bytes = 0
+		self.minified = False
+
+		# The creation status and ARN returned by the API
+		self.status = ""
+		self.arn = ""
+
+		# Dashboards and templates only: the ARN of the version created, and the dashboard version that was published
+		self.version_arn = ""
+		self.published_version = None
+
+		# Error code and message when the operation failed
+		self.error_code = ""
+		self.error_message = ""
+
+	def succeeded(self):
+		return self.operation != "FAILED"
+
+	def to_dict(self):
+		return {
+			"AwsAccountId": self.aws_account_id,
+			"AnalysisId": self.analysis_id,
+			"ResourceType": self.resource_type,
+			"Operation": self.operation,
+			"Fingerprint": self.fingerprint,
+			"PayloadBytes": self.payload_bytes,
+			"Minified": self.minified,
+			"Status": self.status,
+			"Arn": self.arn,
+			"VersionArn": self.version_arn,
+			"PublishedVersion": self.published_version,
+			"ErrorCode": self.error_code,
+			"ErrorMessage": self.error_message
+		}
+
+# Creates or updates many analyses through a bounded thread pool.
+# Analyses are updated first and created when QuickSight reports that they do not exist yet.
+#
+#	deployer = AnalysisDeployer(max_workers = 20)
+#	results = deployer.deploy([analysis_1, analysis_2])
+#
+# With a fingerprint store, analyses whose fingerprint matches the stored one are SKIPPED without any
+# create or update call. With dry_run = True nothing is deployed; analyses that would be deployed are
+# reported as CHANGED.
+# Create and update return before QuickSight applies the definition, so the fingerprint is first stored as pending.
+# It is confirmed by confirm() once AnalysisStatusPoller reports success, or else by the next deploy, which calls
+# describe_analysis: a successful analysis is then SKIPPED, one that is still in progress is SKIPPED and stays
+# pending, and a failed one is deployed again.
+#
+#	deployer = AnalysisDeployer(fingerprints = FingerprintManifest("deployed.json"), dry_run = True)
+#	changed = [result.analysis_id for result in deployer.deploy(analyses) if result.operation == "CHANGED"]
+#
+# With payload_budget set, analyses whose serialized size is above the budget fail with PayloadTooLarge before any
+# API call. With minify = True, those analyses are minified first (see minify_analysis) and only fail if still too large.
+#
+# With validate = True, each analysis is checked against the QuickSight shape model first (see validate_analysis)
+# and for dangling and duplicate IDs (see ReferenceIndex). Analyses with unknown keys, missing required keys,
+# invalid values or broken references fail with InvalidDefinition.
+#
+# For offline tests, pass a client wrapped in botocore.stub.Stubber. Use max_workers = 1 so that
+# the stubbed responses are consumed in order.
+class AnalysisDeployer():
+	def __init__(self, client = None, max_workers = 10, fingerprints = None, dry_run = False, payload_budget = None, minify = False, validate = False):
+		self.max_workers = max_workers
+		self.client = client or create_quicksight_client(max_workers)
+
+		# A FingerprintManifest, a FingerprintTagStore or None to always deploy
+		self.fingerprints = fingerprints
+		self.dry_run = dry_run
+
+		# Maximum request size in bytes, or None to send analyses of any size
+		self.payload_budget = payload_budget
+		self.minify = minify
+
+		# Check each analysis offline before deploying it
+		self.validate = validate
+
+	# Takes Analysis objects or dicts returned by Analysis.compile() and returns one DeploymentResult per analysis, in order
+	# Errors are recorded per analysis (see deploy_analysis), so one failing analysis does not stop the others.
+	# The fingerprints of the analyses deployed so far are saved even when the batch is interrupted.
+	def deploy(self, analyses):
+		analysis_jsons = [analysis if isinstance(analysis, dict) else analysis.compile(shared = True) for analysis in analyses]
+
+		try:
+			if self.max_workers <= 1 or len(analysis_jsons) <= 1:
+				results = [self.deploy_analysis(analysis_json) for analysis_json in analysis_jsons]
+			else:
+				with ThreadPoolExecutor(max_workers = self.max_workers) as executor:
+					results = list(executor.map(self.deploy_analysis, analysis_jsons))
+		finally:
+			if self.fingerprints is not None and not self.dry_run:
+				self.fingerprints.save()
+		return results
+
+	# Any exception, not only a ClientError from the API but also a BotoCoreError such as ParamValidationError or
+	# EndpointConnectionError, fails this analysis only. Its type and text become the error code and message.
+	def deploy_analysis(self, analysis_json):
+		result = DeploymentResult(analysis_json.get("AwsAccountId", ""), analysis_json.get("AnalysisId", ""))
+		try:
+			self._deploy_analysis(analysis_json, result)
+		except Exception as error:
+			result.operation = "FAILED"
+			result.error_code, result.error_message = _error_details(error)
+		return result
+
+	# The library modules are imported here, so that importing the deployer (in a Lambda handler, for example)
+	# does not load the payload, validation and reference checks
+	def _deploy_analysis(self, analysis_json, result):
+		from quicksight_assets_class import PayloadReport, minify_analysis
+
+		report = PayloadReport(analysis_json)
+		if report.exceeds(self.payload_budget) and self.minify:
+			analysis_json = minify_analysis(analysis_json)
+			report = PayloadReport(analysis_json)
+			result.minified = True
+		result.payload_bytes = report.total_bytes
+		if report.exceeds(self.payload_budget):
+			result.operation = "FAILED"
+			result.error_code = "PayloadTooLarge"
+			result.error_message = "%d bytes is over the budget of %d bytes. Largest: %s" % (
+				report.total_bytes, self.payload_budget,
+				", ".join("%s %s (%d bytes)" % item for item in report.largest(5))
+			)
+			return
+
+		if self.validate:
+			from quicksight_assets_class import ReferenceIndex, validate_analysis
+			issues = validate_analysis(analysis_json) + ReferenceIndex(analysis_json.get("Definition", {})).issues
+			if issues:
+				result.operation = "FAILED"
+				result.error_code = "InvalidDefinition"
+				result.error_message = "%d issues: %s" % (len(issues), "; ".join(str(issue) for issue in issues[:5]))
+				return
+
+		result.fingerprint = fingerprint(analysis_json)
+
+		if self.fingerprints is not None:
+			stored = self.fingerprints.get(analysis_json)
+			if stored == FINGERPRINT_PENDING_PREFIX + result.fingerprint:
+				stored = self._confirm_pending(analysis_json, result)
+			if stored == result.fingerprint:
+				result.operation = "SKIPPED"
+				return
+
+		if self.dry_run:
+			result.operation = "CHANGED"
+			return
+
+		try:
+			response = self.client.update_analysis(**_request(analysis_json, UPDATE_ANALYSIS_KEYS))
+			result.operation = "UPDATED"
+			result.status = response.get("UpdateStatus", "")
+		except ClientError as error:
+			if error.response["Error"]["Code"] != "ResourceNotFoundException":
+				raise
+			response = self.client.create_analysis(**_request(analysis_json, CREATE_ANALYSIS_KEYS))
+			result.operation = "CREATED"
+			result.status = response.get("CreationStatus", "")
+		result.arn = response.get("Arn", "")
+
+		if self.fingerprints is not None:
+			self.fingerprints.put(analysis_json, FINGERPRINT_PENDING_PREFIX + result.fingerprint)
+
+	# Returns the fingerprint when the pending deploy of the same definition succeeded or is still in progress,
+	# and None when it failed or the analysis is gone, so that it is deployed again
+	def _confirm_pending(self, analysis_json, result):
+		try:
+			analysis = self.client.describe_analysis(AwsAccountId = analysis_json["AwsAccountId"], AnalysisId = analysis_json["AnalysisId"])["Analysis"]
+		except ClientError as error:
+			if error.response["Error"]["Code"] != "ResourceNotFoundException":
+				raise
+			return None
+		result.status = analysis.get("Status", "")
+		if result.status in ["CREATION_SUCCESSFUL", "UPDATE_SUCCESSFUL"]:
+			if not self.dry_run:
+				self.fingerprints.put(analysis_json, result.fingerprint)
+			return result.fingerprint
+		if result.status in ["CREATION_IN_PROGRESS", "UPDATE_IN_PROGRESS"]:
+			return result.fingerprint
+		return None
+
+	# Confirms the pending fingerprints of deployed analyses that AnalysisStatusPoller reports as successful,
+	# so that the next deploy skips them without calling describe_analysis.
+	# Takes the results of deploy() and the dict returned by AnalysisStatusPoller.wait().
+	def confirm(self, results, statuses):
+		if self.fingerprints is None or self.dry_run:
+			return
+		try:
+			for result in results:
+				status = statuses.get((result.aws_account_id, result.analysis_id))
+				if result.operation in ["CREATED", "UPDATED"] and status is not None and status.succeeded():
+					self.fingerprints.put({"AwsAccountId": result.aws_account_id, "AnalysisId": result.analysis_id}, result.fingerprint)
+		finally:
+			self.fingerprints.save()
+
+########################################################################
+### Waits for many analyses to finish creating or updating ###
+########################################################################
+
+# Statuses after which describe_analysis is no longer polled
+TERMINAL_STATUSES = ["CREATION_SUCCESSFUL", "CREATION_FAILED", "UPDATE_SUCCESSFUL", "UPDATE_FAILED", "DELETED"]
+
+# Error codes that are retried with backoff instead of ending the poll
+RETRYABLE_ERROR_CODES = ["ThrottlingException", "InternalFailureException", "ServiceUnavailableException"]
+
+class StatusResult():
+	def __init__(self, aws_account_id, analysis_id):
+		self.aws_account_id = aws_account_id
+		self.analysis_id = analysis_id
+
+		# The last status reported by describe_analysis, or
+		# NOT_FOUND | TIMED_OUT | BUDGET_EXHAUSTED | ERROR when polling stopped for another reason
+		self.status = ""
+
+		# The Errors list QuickSight reports for the analysis, e.g. [{"Type": "...", "Message": "..."}]
+		self.errors = []
+
+		# Error code and message of the describe_analysis call that ended the poll
+		self.error_code = ""
+		self.error_message = ""
+
+		# Number of describe_analysis calls made for this analysis
+		self.requests = 0
+
+	def succeeded(self):
+		return self.status in ["CREATION_SUCCESSFUL", "UPDATE_SUCCESSFUL"]
+
+	def to_dict(self):
+		return {
+			"AwsAccountId": self.aws_account_id,
+			"AnalysisId": self.analysis_id,
+			"Status": self.status,
+			"Errors": self.errors,
+			"ErrorCode": self.error_code,
+			"ErrorMessage": self.error_message,
+			"Requests": self.requests
+		}
+
+# Polls describe_analysis for many in-flight analyses at once until each reaches a terminal status.
+# Each analysis backs off exponentially with full jitter between polls. All polls share one request budget:
+# at most requests_per_second calls are started per second, at most max_concurrency run at once and,
+# when max_requests is set, no more than max_requests calls are made in total.
+#
+#	results = deployer.deploy(analyses)
+#	statuses = AnalysisStatusPoller(deployer.client).wait([result for result in results if result.operation in ["CREATED", "UPDATED"]])
+#
+# wait() returns a dict keyed by (AwsAccountId, AnalysisId). From async code, await poll() instead.
+# boto3 calls are blocking, so each one runs in a worker thread; a stubbed client that sleeps simulates API latency.
+class AnalysisStatusPoller():
+	def __init__(self, client = None, max_concurrency = 20, requests_per_second = 10, max_requests = None,
+			base_delay = 1, max_delay = 30, timeout = 900, seed = None):
+		self.client = client or create_quicksight_client(max_concurrency)
+		self.max_concurrency = max_concurrency
+		self.requests_per_second = requests_per_second
+		self.max_requests = max_requests
+		self.base_delay = base_delay
+		self.max_delay = max_delay
+		self.timeout = timeout
+		self.random = random.Random(seed)
+
+	# Takes DeploymentResult objects, compiled analysis dicts or (aws_account_id, analysis_id) tuples
+	def wait(self, analyses):
+		return asyncio.run(self.poll(analyses))
+
+	async def poll(self, analyses):
+		loop = asyncio.get_running_loop()
+		self._semaphore = asyncio.Semaphore(self.max_concurrency)
+		self._budget = _RequestBudget(self.requests_per_second, self.max_requests)
+		self._deadline = loop.time() + self.timeout
+
+		# The default executor is sized by CPU count, so blocking calls get a pool as large as the concurrency limit
+		with ThreadPoolExecutor(max_workers = self.max_concurrency) as executor:
+			self._executor = executor
+			results = await asyncio.gather(*[self._poll_analysis(*_identity(analysis)) for analysis in analyses])
+		return {(result.aws_account_id, result.analysis_id): result for result in results}
+
+	async def _poll_analysis(self, aws_account_id, analysis_id):
+		loop = asyncio.get_running_loop()
+		result = StatusResult(aws_account_id, analysis_id)
+		attempt = 0
+
+		while True:
+			if not await self._budget.acquire():
+				result.status = "BUDGET_EXHAUSTED"
+				return result
+
+			result.requests += 1
+			try:
+				async with self._semaphore:
+					response = await loop.run_in_executor(self._executor, functools.partial(
+						self.client.describe_analysis, AwsAccountId = aws_account_id, AnalysisId = analysis_id
+					))
+				analysis = response["Analysis"]
+				result.status = analysis.get("Status", "")
+				result.errors = analysis.get("Errors", [])
+				result.error_code = ""
+				result.error_message = ""
+				if result.status in TERMINAL_STATUSES:
+					return result
+			except ClientError as error:
+				result.error_code, result.error_message = _error_details(error)
+				if result.error_code not in RETRYABLE_ERROR_CODES:
+					result.status = "NOT_FOUND" if result.error_code == "ResourceNotFoundException" else "ERROR"
+					return result
+			except Exception as error:
+				# BotoCoreErrors (after the client's own retries) and other exceptions end the poll of this analysis only
+				result.error_code, result.error_message = _error_details(error)
+				result.status = "ERROR"
+				return result
+
+			delay = self.random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+			if loop.time() + delay > self._deadline:
+				result.status = "TIMED_OUT"
+				return result
+			await asyncio.sleep(delay)
+			attempt += 1
+
+# Spaces request starts evenly at the given rate and optionally caps the total number of requests
+class _RequestBudget():
+	def __init__(self, requests_per_second, max_requests):
+		self.interval = 1 / requests_per_second if requests_per_second else 0
+		self.max_requests = max_requests
+		self.requests = 0
+		self.next_start = 0
+		self._lock = asyncio.Lock()
+
+	# Waits for the next free slot; returns False once max_requests have been made
+	async def acquire(self):
+		loop = asyncio.get_running_loop()
+		async with self._lock:
+			if self.max_requests is not None and self.requests >= self.max_requests:
+				return False
+			self.requests += 1
+			start = max(loop.time(), self.next_start)
+			self.next_start = start + self.interval
+		await asyncio.sleep(start - loop.time())
+		return True
+
+########################################################################
+### Deploys the same analyses to many accounts ###
+########################################################################
+
+# One account that analyses are fanned out to.
+# data_set_arns maps each dataset identifier of the definition to the dataset ARN in this account.
+# Credentials come from session (a boto3 Session), or from session_factory, a function that returns a Session
+# (for example assume_role_session) and is only called when the account's turn comes.
+# overrides replaces top-level keys of each request for this account, for example Permissions or ThemeArn.
+class AccountTarget():
+	def __init__(self, aws_account_id, data_set_arns, session = None, session_factory = None, region_name = None, max_workers = 4, overrides = None):
+		self.aws_account_id = aws_account_id
+		self.data_set_arns = data_set_arns
+		self.session = session
+		self.session_factory = session_factory
+		self.region_name = region_name
+
+		# Number of analyses deployed to this account at once
+		self.max_workers = max_workers
+		self.overrides = overrides or {}
+
+	def create_client(self):
+		session = self.session
+		if session is None and self.session_factory is not None:
+			session = self.session_factory()
+		return create_quicksight_client(self.max_workers, region_name = self.region_name, session = session)
+
+# Returns a function that assumes role_arn and returns a boto3 Session with the temporary credentials,
+# for use as AccountTarget(session_factory = ...)
+def assume_role_session(role_arn, session_name = "assets-as-code", base_session = None):
+	def factory():
+		sts = (base_session or boto3.session.Session()).client("sts")
+		credentials = sts.assume_role(RoleArn = role_arn, RoleSessionName = session_name)["Credentials"]
+		return boto3.session.Session(
+			aws_access_key_id = credentials["AccessKeyId"],
+			aws_secret_access_key = credentials["SecretAccessKey"],
+			aws_session_token = credentials["SessionToken"]
+		)
+	return factory
+
+# Returns the request of a compiled analysis for another account, without recompiling or copying the definition.
+# Only the top-level dict, the Definition dict and the dataset declarations are new; sheets, visuals and
+# filter groups are shared with analysis_json, so each account costs a few small dicts.
+# Raises KeyError when data_set_arns has no ARN for one of the dataset identifiers.
+def stamp_analysis(analysis_json, aws_account_id, data_set_arns, overrides = None):
+	stamped = dict(analysis_json)
+	stamped["AwsAccountId"] = aws_account_id
+	if "Definition" in analysis_json:
+		definition = dict(analysis_json["Definition"])
+		declarations = []
+		for declaration in definition.get("DataSetIdentifierDeclarations", []):
+			identifier = declaration.get("Identifier")
+			if identifier not in data_set_arns:
+				raise KeyError("No dataset ARN for '%s' in account %s" % (identifier, aws_account_id))
+			declaration = dict(declaration)
+			declaration["DataSetArn"] = data_set_arns[identifier]
+			declarations.append(declaration)
+		definition["DataSetIdentifierDeclarations"] = declarations
+		stamped["Definition"] = definition
+	stamped.update(overrides or {})
+	return stamped
+
+# Compiles analyses once and deploys them to many accounts:
+#
+#	targets = [AccountTarget("111122223333", {"SaaS-Sales.csv": "arn:aws:quicksight:...:dataset/..."}, session_factory = assume_role_session("arn:aws:iam::111122223333:role/deploy"))]
+#	for aws_account_id, results in FanOutDeployer([analysis_1], targets, max_accounts = 10).deploy():
+#		print(aws_account_id, [result.operation for result in results])
+#
+# Up to max_accounts accounts are deployed at once, each through its own client and AnalysisDeployer limited to
+# the account's max_workers. Requests are stamped per account only when that account starts, and deploy() yields
+# each account's results as soon as it finishes, so memory does not grow with the number of accounts.
+# deployer_options are passed to every AnalysisDeployer, for example fingerprints, dry_run or payload_budget.
+# A FingerprintTagStore is replaced with one that uses each account's client. An account whose client cannot be
+# created, for example because its role cannot be assumed, gets a FAILED result for every analysis.
+class FanOutDeployer():
+	def __init__(self, analyses, targets, max_accounts = 10, **deployer_options):
+		self.analysis_jsons = [analysis if isinstance(analysis, dict) else analysis.compile(shared = True) for analysis in analyses]
+		self.targets = targets
+		self.max_accounts = max_accounts
+		self.deployer_options = deployer_options
+
+	# Yields (aws_account_id, [DeploymentResult]) in the order accounts finish
+	def deploy(self):
+		targets = iter(self.targets)
+		with ThreadPoolExecutor(max_workers = self.max_accounts) as executor:
+			# Only max_accounts accounts are submitted at a time; the next one starts when one finishes
+			pending = {}
+			for target in targets:
+				pending[executor.submit(self.deploy_account, target)] = target
+				if len(pending) >= self.max_accounts:
+					break
+			while pending:
+				done, _ = wait(pending, return_when = FIRST_COMPLETED)
+				for future in done:
+					target = pending.pop(future)
+					yield target.aws_account_id, future.result()
+					next_target = next(targets, None)
+					if next_target is not None:
+						pending[executor.submit(self.deploy_account, next_target)] = next_target
+
+	# Returns one DeploymentResult per analysis, in the order the analyses were given
+	def deploy_account(self, target):
+		results = [None] * len(self.analysis_jsons)
+		positions = []
+		requests = []
+		for position, analysis_json in enumerate(self.analysis_jsons):
+			try:
+				requests.append(stamp_analysis(analysis_json, target.aws_account_id, target.data_set_arns, target.overrides))
+				positions.append(position)
+			except KeyError as error:
+				result = DeploymentResult(target.aws_account_id, analysis_json["AnalysisId"])
+				result.operation = "FAILED"
+				result.error_code = "MissingDataSetArn"
+				result.error_message = error.args[0]
+				results[position] = result
+
+		if not requests:
+			return results
+
+		# Assuming the account's role can fail (AccessDenied, expired credentials, ...); that fails this account only
+		try:
+			client = target.create_client()
+		except Exception as error:
+			error_code, error_message = _error_details(error)
+			for position in positions:
+				result = DeploymentResult(target.aws_account_id, self.analysis_jsons[position]["AnalysisId"])
+				result.operation = "FAILED"
+				result.error_code = error_code
+				result.error_message = error_message
+				results[position] = result
+			return results
+
+		# Tags are read and written in each account, so a tag store gets the account's own client
+		deployer_options = dict(self.deployer_options)
+		if isinstance(deployer_options.get("fingerprints"), FingerprintTagStore):
+			deployer_options["fingerprints"] = FingerprintTagStore(client)
+
+		deployer = AnalysisDeployer(client, max_workers = target.max_workers, **deployer_options)
+		for position, result in zip(positions, deployer.deploy(requests)):
+			results[position] = result
+		return results
+
+########################################################################
+### Publishes an analysis as a template and a dashboard ###
+########################################################################
+
+# Keys of a compiled dashboard or template that each API accepts, besides AwsAccountId and the resource ID
+CREATE_DASHBOARD_KEYS = ["Name", "Definition", "Parameters", "Permissions", "SourceEntity", "Tags", "VersionDescription", "DashboardPublishOptions", "ThemeArn"]
+UPDATE_DASHBOARD_KEYS = ["Name", "Definition", "Parameters", "SourceEntity", "VersionDescription", "DashboardPublishOptions", "ThemeArn"]
+CREATE_TEMPLATE_KEYS = ["Name", "Definition", "Permissions", "SourceEntity", "Tags", "VersionDescription"]
+UPDATE_TEMPLATE_KEYS = ["Name", "Definition", "SourceEntity", "VersionDescription"]
+
+# Creates or updates an analysis, its template and its dashboard in one call:
+#
+#	dashboard = analysis_1.to_dashboard("dashboard1")
+#	dashboard.set_version_description("Nightly build")
+#	results = PublishPipeline().publish(analysis_1, analysis_1.to_template("template1"), dashboard)
+#
+# The three resources share one Definition, which is compiled once before any request is sent. The requests
+# do not depend on each other, so they are sent at the same time. update_dashboard only creates a new dashboard
+# version; the pipeline waits for that version to be created and then publishes it.
+# Returns one DeploymentResult per resource given, in the order analysis, template, dashboard.
+class PublishPipeline():
+	def __init__(self, client = None, version_timeout = 300, poll_interval = 2):
+		self.client = client or create_quicksight_client(3)
+
+		# How long to wait for a new dashboard version before giving up on publishing it, in seconds
+		self.version_timeout = version_timeout
+		self.poll_interval = poll_interval
+
+	def publish(self, analysis = None, template = None, dashboard = None):
+		# Compiled here, one after the other, so that the shared Definition is compiled once and never from two threads
+		jobs = []
+		if analysis is not None:
+			jobs.append(functools.partial(AnalysisDeployer(self.client, max_workers = 1).deploy_analysis, _compiled(analysis)))
+		if template is not None:
+			jobs.append(functools.partial(self.deploy_template, _compiled(template)))
+		if dashboard is not None:
+			jobs.append(functools.partial(self.deploy_dashboard, _compiled(dashboard)))
+		if not jobs:
+			return []
+
+		with ThreadPoolExecutor(max_workers = len(jobs)) as executor:
+			futures = [executor.submit(job) for job in jobs]
+			return [future.result() for future in futures]
+
+	def deploy_template(self, template_json):
+		return _upsert(
+			DeploymentResult(template_json["AwsAccountId"], template_json["TemplateId"], "TEMPLATE"),
+			self.client.update_template, _resource_request(template_json, "TemplateId", UPDATE_TEMPLATE_KEYS),
+			self.client.create_template, _resource_request(template_json, "TemplateId", CREATE_TEMPLATE_KEYS)
+		)
+
+	def deploy_dashboard(self, dashboard_json):
+		result = _upsert(
+			DeploymentResult(dashboard_json["AwsAccountId"], dashboard_json["DashboardId"], "DASHBOARD"),
+			self.client.update_dashboard, _resource_request(dashboard_json, "DashboardId", UPDATE_DASHBOARD_KEYS),
+			self.client.create_dashboard, _resource_request(dashboard_json, "DashboardId", CREATE_DASHBOARD_KEYS)
+		)
+		# A created dashboard publishes its first version; an updated one has to be published
+		if result.operation == "UPDATED":
+			self._publish_version(result)
+		return result
+
+	def _publish_version(self, result):
+		version_number = _version_number(result.version_arn)
+		if version_number is None:
+			result.operation = "FAILED"
+			result.error_code = "MissingVersionArn"
+			result.error_message = "update_dashboard returned no version number to publish (VersionArn '%s')" % result.version_arn
+			return
+		deadline = time.monotonic() + self.version_timeout
+		try:
+			while True:
+				version = self.client.describe_dashboard(
+					AwsAccountId = result.aws_account_id, DashboardId = result.analysis_id, VersionNumber = version_number
+				)["Dashboard"]["Version"]
+				result.status = version.get("Status", "")
+				if result.status == "CREATION_SUCCESSFUL":
+					break
+				if result.status == "CREATION_FAILED":
+					result.operation = "FAILED"
+					result.error_code = "VersionCreationFailed"
+					result.error_message = "; ".join("%s: %s" % (error.get("Type", ""), error.get("Message", "")) for error in version.get("Errors", []))
+					return
+				if time.monotonic() + self.poll_interval > deadline:
+					result.error_code = "VersionNotPublished"
+					result.error_message = "Version %d was still %s after %d seconds" % (version_number, result.status, self.version_timeout)
+					return
+				time.sleep(self.poll_interval)
+
+			self.client.update_dashboard_published_version(
+				AwsAccountId = result.aws_account_id, DashboardId = result.analysis_id, VersionNumber = version_number
+			)
+			result.published_version = version_number
+		except Exception as error:
+			result.operation = "FAILED"
+			result.error_code, result.error_message = _error_details(error)
+
+def _compiled(resource):
+	return resource if isinstance(resource, dict) else resource.compile(shared = True)
+
+# Updates a resource and creates it when QuickSight reports that it does not exist yet.
+# Like AnalysisDeployer.deploy_analysis, any exception fails this resource only.
+def _upsert(result, update, update_request, create, create_request):
+	try:
+		try:
+			response = update(**update_request)
+			result.operation = "UPDATED"
+		except ClientError as error:
+			if error.response["Error"]["Code"] != "ResourceNotFoundException":
+				raise
+			response = create(**create_request)
+			result.operation = "CREATED"
+		result.status = response.get("CreationStatus", "")
+		result.arn = response.get("Arn", "")
+		result.version_arn = response.get("VersionArn", "")
+	except Exception as error:
+		result.operation = "FAILED"
+		result.error_code, result.error_message = _error_details(error)
+	return result
+
+# Returns the number at the end of a dashboard VersionArn (.../dashboard/<id>/version/<number>), or None
+def _version_number(version_arn):
+	prefix, _, number = (version_arn or "").rpartition("/version/")
+	return int(number) if prefix and number.isdigit() else None
+
+# Returns (error code, message) of a ClientError, or the type and text of any other exception
+def _error_details(error):
+	if isinstance(error, ClientError):
+		return error.response["Error"]["Code"], error.response["Error"].get("Message", "")
+	return type(error).__name__, str(error)
+
+def _identity(analysis):
+	if isinstance(analysis, tuple):
+		return analysis
+	if isinstance(analysis, dict):
+		return analysis["AwsAccountId"], analysis["AnalysisId"]
+	return analysis.aws_account_id, analysis.analysis_id
+
+# Compiled analyses are sparse, so optional keys are only passed when they are set
+def _request(analysis_json, optional_keys):
+	request = {
+		"AwsAccountId": analysis_json["AwsAccountId"],
+		"AnalysisId": analysis_json["AnalysisId"],
+		"Name": analysis_json["Name"],
+		"Definition": analysis_json.get("Definition", {})
+	}
+	for key in optional_keys:
+		if key in analysis_json:
+			request[key] = analysis_json[key]
+	return request
+
+def _resource_request(resource_json, id_key, optional_keys):
+	request = {"AwsAccountId": resource_json["AwsAccountId"], id_key: resource_json[id_key]}
+	for key in optional_keys:
+		if key in resource_json:
+			request[key] = resource_json[key]
+	return request
+
+def _manifest_key(analysis_json):
+	return analysis_json["AwsAccountId"] + "/" + analysis_json["AnalysisId"]
+
+def _analysis_arn(client, analysis_json):
+	return "arn:aws:quicksight:{}:{}:analysis/{}".format(
+		client.meta.region_name, analysis_json["AwsAccountId"], analysis_json["AnalysisId"]
+	)
@@ -0,0 +1,63 @@
+import io
+import os
+import sys
+
+import pytest
+
+# The library, the deployer and the sample scripts live in src and are run from there
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC)
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Path of the sample output committed next to create_analysis.py
+SAMPLE_OUTPUT = os.path.join(SRC, "asset_definition.json")
+
+# The sample Analysis that create_analysis.py builds. main() writes it with dump_analysis, which is replaced here
+# so that the test gets the object and nothing is written to the source tree.
+@pytest.fixture
+def sample_analysis(monkeypatch, tmp_path):
+	import create_analysis
+
+	analyses = []
+	monkeypatch.setattr(create_analysis, "dump_analysis", lambda analysis, outfile, **options: analyses.append(analysis))
+	monkeypatch.chdir(tmp_path)
+	create_analysis.main()
+	return analyses[0]
+
+# Returns the text dump_analysis writes for an analysis
+def dump_text(analysis, **options):
+	from quicksight_assets_class import dump_analysis
+
+	outfile = io.StringIO()
+	dump_analysis(analysis, outfile, **options)
+	return outfile.getvalue()
+
+# A QuickSight client that never reaches AWS. Wrap it in botocore.stub.Stubber to give it responses.
+@pytest.fixture
+def quicksight_client():
+	import boto3
+
+	return boto3.client("quicksight", region_name = "us-east-1", aws_access_key_id = "testing", aws_secret_access_key = "testing")
+
+# A compiled analysis small enough to write out in a test
+def compiled_analysis(analysis_id, aws_account_id = "111122223333", name = None):
+	return {
+		"AwsAccountId": aws_account_id,
+		"AnalysisId": analysis_id,
+		"Name": name or analysis_id,
+		"Definition": {
+			"DataSetIdentifierDeclarations": [
+				{"Identifier": "ds", "DataSetArn": "arn:aws:quicksight:us-east-1:%s:dataset/ds" % aws_account_id}
+			]
+		}
+	}
+
+def analysis_response(analysis_id, status_key, status, aws_account_id = "111122223333"):
+	return {
+		"Arn": "arn:aws:quicksight:us-east-1:%s:analysis/%s" % (aws_account_id, analysis_id),
+		"AnalysisId": analysis_id,
+		status_key: status,
+		"Status": 200,
+		"RequestId": "request"
+	}
@@ -0,0 +1,95 @@
+import json
+import os
+import random
+import sys
+
+from conftest import DATA
+from quicksight_assets_class import clean_dict
+
+# clean_dict as it was before it was made single-pass, kept as the reference output
+def reference_clean_dict(input):
+	if type(input) is dict:
+		return dict((key, reference_clean_dict(value)) for key, value in input.items() if (value or value == 0) and reference_clean_dict(value) not in [{},[],""])
+	elif type(input) is list:
+		return [reference_clean_dict(item) for item in input if (item or item == 0) and reference_clean_dict(item) not in [{},[],""]]
+	else:
+		if input or input == 0:
+			return input
+
+# The reference calls itself twice per level, so a tree 30 levels deep would take 2^30 calls. For those trees its
+# calls go through a cache keyed by node identity. The function is pure, so the cache does not change its output.
+def cached_reference_clean_dict(tree):
+	cache = {}
+	def cached(input):
+		if id(input) not in cache:
+			cache[id(input)] = (input, uncached(input))
+		return cache[id(input)][1]
+	uncached = _with_recursion(cached)
+	return cached(tree)
+
+# Returns a copy of the reference whose recursive calls go to recurse. The def statement binds the name in the
+# namespace, so the name is pointed at recurse only after it has run.
+def _with_recursion(recurse):
+	namespace = {}
+	exec(compile(_REFERENCE_SOURCE, __file__, "exec"), namespace)
+	function = namespace["reference_clean_dict"]
+	namespace["reference_clean_dict"] = recurse
+	return function
+
+_REFERENCE_SOURCE = '''
+def reference_clean_dict(input):
+	if type(input) is dict:
+		return dict((key, reference_clean_dict(value)) for key, value in input.items() if (value or value == 0) and reference_clean_dict(value) not in [{},[],""])
+	elif type(input) is list:
+		return [reference_clean_dict(item) for item in input if (item or item == 0) and reference_clean_dict(item) not in [{},[],""]]
+	else:
+		if input or input == 0:
+			return input
+'''
+
+# Leaves that are dropped, kept, or kept only because they equal 0
+_LEAVES = ["", None, [], {}, 0, 0.0, False, True, 1, -2.5, "text", " ", "0"]
+
+# Returns a tree of the given depth. Each level holds a few leaves, a dict or list that goes on to the next level and
+# sometimes a short side branch, so that whole subtrees become empty and are dropped level after level.
+def deep_tree(rnd, depth):
+	if depth == 0:
+		return rnd.choice(_LEAVES)
+	children = [rnd.choice(_LEAVES) for _ in range(rnd.randint(0, 3))]
+	children.append(deep_tree(rnd, depth - 1))
+	if rnd.random() < 0.3:
+		children.append(deep_tree(rnd, min(depth - 1, 3)))
+	rnd.shuffle(children)
+	if rnd.random() < 0.6:
+		return {"Key%d" % position: child for position, child in enumerate(children)}
+	return children
+
+def test_sample_matches_reference():
+	with open(os.path.join(DATA, "sample_uncleaned.json")) as infile:
+		sample = json.load(infile)
+	expected = reference_clean_dict(sample)
+	assert json.dumps(clean_dict(sample)) == json.dumps(expected)
+
+def test_deep_trees_match_reference():
+	rnd = random.Random(2024)
+	for _ in range(200):
+		tree = deep_tree(rnd, 30)
+		assert json.dumps(clean_dict(tree)) == json.dumps(cached_reference_clean_dict(tree))
+
+def test_deep_trees_do_not_hit_the_recursion_limit():
+	rnd = random.Random(7)
+	tree = deep_tree(rnd, min(200, sys.getrecursionlimit() // 4))
+	assert json.dumps(clean_dict(tree)) == json.dumps(cached_reference_clean_dict(tree))
+
+def test_input_is_not_changed():
+	rnd = random.Random(3)
+	tree = deep_tree(rnd, 30)
+	before = json.dumps(tree)
+	clean_dict(tree)
+	assert json.dumps(tree) == before
+
+def test_cached_reference_matches_reference():
+	rnd = random.Random(11)
+	for _ in range(20):
+		tree = deep_tree(rnd, 10)
+		assert json.dumps(cached_reference_clean_dict(tree)) == json.dumps(reference_clean_dict(tree))
@@ -0,0 +1,58 @@
+import pytest
+
+from quicksight_assets_class import (BarChartVisual, CategoryFilter, Definition, FilterDateTimePickerControl,
+	FilterGroup, Sheet, TextBox)
+
+def issue_codes(definition):
+	return sorted(issue.code for issue in definition.check_references())
+
+def test_cloned_sample_sheet_has_no_duplicate_ids(sample_analysis):
+	definition = sample_analysis.definition
+	sheet = definition.sheets[0]
+	definition.add_sheet(sheet.clone("sheet9", name = "Copy"))
+	assert issue_codes(definition) == []
+
+	clone = definition.sheets[-1]
+	assert clone.name == "Copy"
+	assert [visual.id for visual in clone.visuals] == [visual.id + "-sheet9" for visual in sheet.visuals]
+	elements = clone.compile()["Layouts"][0]["Configuration"]["GridLayout"]["Elements"]
+	assert {element["ElementId"] for element in elements} <= {child.id for child in clone._children()}
+
+def test_sharing_the_children_gives_duplicate_ids(sample_analysis):
+	definition = sample_analysis.definition
+	definition.add_sheet(definition.sheets[0]._clone("id", "sheet9"))
+	assert "DuplicateId" in issue_codes(definition)
+
+def test_cloned_sheet_remaps_actions_and_text_boxes():
+	target = BarChartVisual("bar2")
+	source = BarChartVisual("bar1")
+	source.add_filter_action("action1", "Filter", "DATA_POINT_CLICK", target_visual_options = "", target_visuals = ["bar2"])
+	sheet = Sheet("sheet1", "Sheet 1")
+	sheet.add_visuals([source, target])
+	sheet.add_text_box(TextBox("text1", "<text-box>Hello</text-box>"))
+	sheet.add_filter_control(FilterDateTimePickerControl("control1", "filter1", "Date"))
+	sheet.pack_grid_layout([source, target, sheet.filter_controls[0]])
+
+	clone = sheet.clone("sheet2", id_suffix = "_2")
+	action = clone.visuals[0].compile()["BarChartVisual"]["Actions"][0]
+	assert action["CustomActionId"] == "action1_2"
+	assert action["ActionOperations"][0]["FilterOperation"]["TargetVisualsConfiguration"]["SameSheetTargetVisualConfiguration"]["TargetVisuals"] == ["bar2_2"]
+	assert [text_box.text_box_id for text_box in clone.text_boxes] == ["text1_2"]
+	assert [element["ElementId"] for element in clone.layout_elements] == ["bar1_2", "bar2_2", "control1_2"]
+
+	# The original keeps its IDs
+	assert source.compile()["BarChartVisual"]["Actions"][0]["CustomActionId"] == "action1"
+	assert [element["ElementId"] for element in sheet.layout_elements] == ["bar1", "bar2", "control1"]
+
+def test_cloned_filter_group_renames_its_filters():
+	filter_group = FilterGroup("ALL_DATASETS", "group1")
+	filter_group.add_filter(CategoryFilter("filter1", "Region", "ds"))
+	clone = filter_group.clone("group2")
+	assert [filter.filter_id for filter in clone.filters] == ["filter1-group2"]
+	assert [filter.filter_id for filter in filter_group.filters] == ["filter1"]
+
+def test_only_documented_objects_can_be_cloned():
+	with pytest.raises(AttributeError):
+		Definition([]).clone("definition2")
+	with pytest.raises(AttributeError):
+		CategoryFilter("filter1", "Region", "ds").clone("filter2")
@@ -0,0 +1,56 @@
+import json
+
+from benchmarks.compile_benchmark import generate_analysis
+from quicksight_assets_class import BarChartVisual, payload_bytes
+from quicksight_assets_class.payload import _COLUMN_FORMAT_KEYS, _column_fields
+
+# Returns (field type, column, format) for every field, where the format is the field's own or else the one
+# its column configuration sets
+def effective_formats(definition_json):
+	column_formats = {}
+	for configuration in definition_json.get("ColumnConfigurations", []):
+		column = configuration["Column"]
+		column_formats[(column["DataSetIdentifier"], column["ColumnName"])] = configuration.get("FormatConfiguration", {})
+	formats = []
+	for sheet in definition_json["Sheets"]:
+		for visual in sheet.get("Visuals", []):
+			for field_type, field in _column_fields(visual):
+				column = (field["Column"]["DataSetIdentifier"], field["Column"]["ColumnName"])
+				field_format = field.get("FormatConfiguration") or column_formats.get(column, {}).get(_COLUMN_FORMAT_KEYS[field_type])
+				formats.append((field_type, column, json.dumps(field_format, sort_keys = True)))
+	return formats
+
+def compile_both(analysis):
+	plain = analysis.compile()["Definition"]
+	analysis.definition.set_column_format_hoisting()
+	hoisted = analysis.compile()["Definition"]
+	return plain, hoisted, analysis.definition.column_format_report()
+
+def test_hoisting_keeps_every_effective_format():
+	plain, hoisted, report = compile_both(generate_analysis(3, 6, conditional_formats_per_table = 2, filter_group_count = 2))
+
+	assert list(report.columns) == [("SaaS-Sales.csv", "Discount")]
+	assert effective_formats(hoisted) == effective_formats(plain)
+	assert payload_bytes(plain) - payload_bytes(hoisted) == report.bytes_saved > 0
+
+def test_fields_drop_the_format_of_an_existing_column_configuration():
+	analysis = generate_analysis(3, 6)
+	plain = analysis.compile()["Definition"]
+	field_format = next(field["FormatConfiguration"] for sheet in plain["Sheets"] for visual in sheet["Visuals"]
+		for _, field in _column_fields(visual) if field["Column"]["ColumnName"] == "Discount" and "FormatConfiguration" in field)
+	analysis.definition.add_column_configuration("Discount", "SaaS-Sales.csv", {"NumberFormatConfiguration": field_format})
+	plain, hoisted, report = compile_both(analysis)
+
+	assert report.columns[("SaaS-Sales.csv", "Discount")][1] == 3
+	assert len(hoisted["ColumnConfigurations"]) == 1
+	assert effective_formats(hoisted) == effective_formats(plain)
+
+def test_column_shown_unformatted_is_not_hoisted():
+	analysis = generate_analysis(3, 6)
+	unformatted = BarChartVisual("unformatted")
+	unformatted.add_numerical_measure_field("Discount", "SaaS-Sales.csv", "SUM")
+	analysis.definition.sheets[0].add_visual(unformatted)
+	plain, hoisted, report = compile_both(analysis)
+
+	assert report.columns == {}
+	assert hoisted == plain
@@ -0,0 +1,111 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks.compile_benchmark import generate_analysis
+from conftest import SAMPLE_OUTPUT, dump_text
+from quicksight_assets_class import Analysis, BarChartVisual, Definition, Sheet, get_compile_stats
+
+def small_analysis():
+	visual = BarChartVisual("bar1")
+	visual.add_categorical_dimension_field("Region", "ds")
+	visual.add_title("VISIBLE", "PlainText", "A")
+	sheet = Sheet("sheet1", "Sheet 1")
+	sheet.add_visual(visual)
+	definition = Definition([{"Identifier": "ds", "DataSetArn": "arn:aws:quicksight:us-east-1:111122223333:dataset/ds"}])
+	definition.add_sheet(sheet)
+	analysis = Analysis("111122223333", "analysis1", "Analysis 1")
+	analysis.add_definition(definition)
+	return analysis, definition, sheet, visual
+
+def visual_titles(analysis_json):
+	return [
+		visual["BarChartVisual"]["Title"]["FormatText"]["PlainText"]
+		for sheet in analysis_json["Definition"]["Sheets"] for visual in sheet["Visuals"]
+	]
+
+def test_recompiling_the_sample_reuses_everything(sample_analysis):
+	with open(SAMPLE_OUTPUT) as infile:
+		expected = infile.read()
+	assert dump_text(sample_analysis) == expected
+	sample_analysis.compile()
+	assert get_compile_stats()["recompiled"] == 0
+	assert dump_text(sample_analysis) == expected
+
+def test_only_the_changed_path_is_compiled_again():
+	analysis, _, _, visual = small_analysis()
+	analysis.compile()
+	visual.add_title("VISIBLE", "PlainText", "B")
+	assert visual_titles(analysis.compile()) == ["B"]
+	# The visual, its sheet and the definition
+	assert get_compile_stats()["recompiled"] == 3
+
+def test_child_compiled_on_its_own_is_picked_up_by_its_parent():
+	analysis, _, _, visual = small_analysis()
+	analysis.compile()
+	visual.add_title("VISIBLE", "PlainText", "B")
+	visual.compile()
+	assert visual_titles(analysis.compile()) == ["B"]
+	assert get_compile_stats()["recompiled"] > 0
+
+def test_child_shared_by_two_parents():
+	analysis, definition, _, visual = small_analysis()
+	other_sheet = Sheet("sheet2", "Sheet 2")
+	other_sheet.add_visual(visual)
+	definition.add_sheet(other_sheet)
+	assert visual_titles(analysis.compile()) == ["A", "A"]
+
+	visual.add_title("VISIBLE", "PlainText", "B")
+	# Compiling the first sheet compiles the visual again, after which it is clean
+	definition.sheets[0].compile()
+	assert not visual.is_dirty()
+	assert other_sheet.is_dirty()
+	assert visual_titles(analysis.compile()) == ["B", "B"]
+
+def test_changing_the_output_does_not_change_later_compiles():
+	analysis, _, _, _ = small_analysis()
+	output = analysis.compile()
+	output["Definition"]["Sheets"][0]["Name"] = "Changed"
+	output["Definition"]["Sheets"][0]["Visuals"][0]["BarChartVisual"]["Title"]["FormatText"]["PlainText"] = "Changed"
+	again = analysis.compile()
+	assert again["Definition"]["Sheets"][0]["Name"] == "Sheet 1"
+	assert visual_titles(again) == ["A"]
+
+def test_shared_output_is_the_cache():
+	analysis, _, _, _ = small_analysis()
+	first = analysis.compile(shared = True)
+	assert analysis.compile(shared = True)["Definition"] is first["Definition"]
+	assert json.dumps(analysis.compile()) == json.dumps(first)
+
+def test_parallel_compile_is_cached_and_counted():
+	analysis = generate_analysis(6, 4)
+	expected = json.dumps(generate_analysis(6, 4).compile())
+	serial_stats = get_compile_stats()
+
+	with ThreadPoolExecutor(max_workers = 3) as executor:
+		assert json.dumps(analysis.compile(executor)) == expected
+	assert get_compile_stats() == serial_stats
+
+	assert not analysis.definition.is_dirty()
+	analysis.compile()
+	assert get_compile_stats()["recompiled"] == 0
+
+def test_process_pool_compile_counts_the_workers():
+	analysis = generate_analysis(4, 3)
+	expected = json.dumps(generate_analysis(4, 3).compile())
+	serial_stats = get_compile_stats()
+
+	with ProcessPoolExecutor(max_workers = 2) as executor:
+		assert json.dumps(analysis.compile(executor)) == expected
+	assert get_compile_stats() == serial_stats
+	# The sheets were compiled in the workers, so they and the definition are compiled again here
+	assert analysis.definition.is_dirty()
+	assert json.dumps(analysis.compile()) == expected
+
+def test_compiles_in_other_threads_keep_their_own_stats():
+	analysis, _, _, _ = small_analysis()
+	analysis.compile()
+	analysis.compile()
+	stats = get_compile_stats()
+	with ThreadPoolExecutor(max_workers = 1) as executor:
+		executor.submit(generate_analysis(3, 3).compile).result()
+	assert get_compile_stats() == stats == {"recompiled": 0, "reused": 1}
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+from botocore.stub import Stubber
+
+from conftest import analysis_response, compiled_analysis
+from quicksight_deployer import FINGERPRINT_PENDING_PREFIX, AnalysisDeployer, AnalysisStatusPoller, FingerprintManifest, fingerprint
+
+def test_updates_and_creates(quicksight_client):
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_response("update_analysis", analysis_response("a1", "UpdateStatus", "UPDATE_IN_PROGRESS"))
+		stubber.add_client_error("update_analysis", "ResourceNotFoundException")
+		stubber.add_response("create_analysis", analysis_response("a2", "CreationStatus", "CREATION_IN_PROGRESS"))
+		results = AnalysisDeployer(quicksight_client, max_workers = 1).deploy([compiled_analysis("a1"), compiled_analysis("a2")])
+		stubber.assert_no_pending_responses()
+
+	assert [(result.operation, result.status) for result in results] == [("UPDATED", "UPDATE_IN_PROGRESS"), ("CREATED", "CREATION_IN_PROGRESS")]
+	assert results[1].arn.endswith("analysis/a2")
+
+def test_client_and_botocore_errors_fail_one_analysis(quicksight_client):
+	# An analysis name must be a string, so botocore raises ParamValidationError before sending the request
+	invalid = compiled_analysis("a2", name = 123)
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_client_error("update_analysis", "AccessDeniedException", "Not allowed")
+		stubber.add_response("update_analysis", analysis_response("a3", "UpdateStatus", "UPDATE_IN_PROGRESS"))
+		results = AnalysisDeployer(quicksight_client, max_workers = 1).deploy([compiled_analysis("a1"), invalid, compiled_analysis("a3")])
+		stubber.assert_no_pending_responses()
+
+	assert [(result.operation, result.error_code) for result in results] == [
+		("FAILED", "AccessDeniedException"), ("FAILED", "ParamValidationError"), ("UPDATED", "")
+	]
+	assert results[0].error_message == "Not allowed"
+
+def test_manifest_is_saved_when_the_batch_is_interrupted(quicksight_client, monkeypatch, tmp_path):
+	manifest = FingerprintManifest(str(tmp_path / "deployed.json"))
+	calls = []
+	def update_analysis(**request):
+		calls.append(request["AnalysisId"])
+		if len(calls) > 1:
+			raise KeyboardInterrupt
+		return analysis_response(request["AnalysisId"], "UpdateStatus", "UPDATE_IN_PROGRESS")
+	monkeypatch.setattr(quicksight_client, "update_analysis", update_analysis)
+
+	with pytest.raises(KeyboardInterrupt):
+		AnalysisDeployer(quicksight_client, max_workers = 1, fingerprints = manifest).deploy([compiled_analysis("a1"), compiled_analysis("a2")])
+	with open(manifest.path) as infile:
+		assert json.load(infile) == {"111122223333/a1": FINGERPRINT_PENDING_PREFIX + fingerprint(compiled_analysis("a1"))}
+
+def test_dry_run_reports_changes_without_calls(quicksight_client, tmp_path):
+	manifest = FingerprintManifest(str(tmp_path / "deployed.json"))
+	manifest.put(compiled_analysis("a1"), fingerprint(compiled_analysis("a1")))
+	with Stubber(quicksight_client):
+		results = AnalysisDeployer(quicksight_client, fingerprints = manifest, dry_run = True).deploy([compiled_analysis("a1"), compiled_analysis("a2")])
+	assert [result.operation for result in results] == ["SKIPPED", "CHANGED"]
+
+def describe_response(analysis_id, status):
+	return {"Analysis": {"AnalysisId": analysis_id, "Status": status}, "Status": 200, "RequestId": "request"}
+
+def test_fingerprint_is_pending_until_the_deploy_succeeds(quicksight_client, tmp_path):
+	manifest = FingerprintManifest(str(tmp_path / "deployed.json"))
+	deployer = AnalysisDeployer(quicksight_client, max_workers = 1, fingerprints = manifest)
+	analyses = [compiled_analysis("a1"), compiled_analysis("a2"), compiled_analysis("a3")]
+	with Stubber(quicksight_client) as stubber:
+		for analysis in analyses:
+			stubber.add_response("update_analysis", analysis_response(analysis["AnalysisId"], "UpdateStatus", "UPDATE_IN_PROGRESS"))
+		assert [result.operation for result in deployer.deploy(analyses)] == ["UPDATED"] * 3
+		assert manifest.get(analyses[0]) == FINGERPRINT_PENDING_PREFIX + fingerprint(analyses[0])
+
+		# Succeeded, still in progress, failed
+		stubber.add_response("describe_analysis", describe_response("a1", "UPDATE_SUCCESSFUL"))
+		stubber.add_response("describe_analysis", describe_response("a2", "UPDATE_IN_PROGRESS"))
+		stubber.add_response("describe_analysis", describe_response("a3", "UPDATE_FAILED"))
+		stubber.add_response("update_analysis", analysis_response("a3", "UpdateStatus", "UPDATE_IN_PROGRESS"))
+		results = deployer.deploy(analyses)
+		stubber.assert_no_pending_responses()
+
+	assert [result.operation for result in results] == ["SKIPPED", "SKIPPED", "UPDATED"]
+	assert manifest.get(analyses[0]) == fingerprint(analyses[0])
+	assert manifest.get(analyses[1]) == FINGERPRINT_PENDING_PREFIX + fingerprint(analyses[1])
+
+	# A confirmed fingerprint is skipped without any call
+	with Stubber(quicksight_client):
+		assert deployer.deploy(analyses[:1])[0].operation == "SKIPPED"
+
+def test_confirm_after_polling(quicksight_client, tmp_path):
+	manifest = FingerprintManifest(str(tmp_path / "deployed.json"))
+	deployer = AnalysisDeployer(quicksight_client, max_workers = 1, fingerprints = manifest)
+	analyses = [compiled_analysis("a1"), compiled_analysis("a2")]
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_response("update_analysis", analysis_response("a1", "UpdateStatus", "UPDATE_IN_PROGRESS"))
+		stubber.add_response("update_analysis", analysis_response("a2", "UpdateStatus", "UPDATE_IN_PROGRESS"))
+		results = deployer.deploy(analyses)
+		stubber.add_response("describe_analysis", describe_response("a1", "UPDATE_SUCCESSFUL"))
+		stubber.add_response("describe_analysis", describe_response("a2", "UPDATE_FAILED"))
+		statuses = AnalysisStatusPoller(quicksight_client, max_concurrency = 1, requests_per_second = None).wait(results)
+	deployer.confirm(results, statuses)
+
+	with open(manifest.path) as infile:
+		assert json.load(infile) == {
+			"111122223333/a1": fingerprint(analyses[0]),
+			"111122223333/a2": FINGERPRINT_PENDING_PREFIX + fingerprint(analyses[1])
+		}
@@ -0,0 +1,41 @@
+import json
+import os
+import tracemalloc
+
+from benchmarks.compile_benchmark import generate_analysis
+from conftest import SAMPLE_OUTPUT, dump_text
+from quicksight_assets_class import dump_analysis
+
+def test_sample_is_written_as_before(sample_analysis):
+	with open(SAMPLE_OUTPUT) as infile:
+		assert dump_text(sample_analysis) == infile.read()
+
+def test_streamed_text_matches_json_dumps():
+	analysis = generate_analysis(4, 17, 3, 4)
+	streamed = dump_text(analysis)
+	streamed_compact = dump_text(analysis, compact = True)
+	expected = analysis.compile()
+	assert streamed == json.dumps(expected, indent = 6)
+	assert streamed_compact == json.dumps(expected, separators = (",", ":"))
+	# Written again from the cache
+	assert dump_text(analysis) == streamed
+
+def test_changes_after_a_dump_are_written():
+	analysis = generate_analysis(2, 3)
+	dump_text(analysis)
+	analysis.definition.sheets[1].visuals[0].add_title("VISIBLE", "PlainText", "Changed")
+	assert dump_text(analysis) == json.dumps(analysis.compile(), indent = 6)
+	assert "Changed" in dump_text(analysis, compact = True)
+
+def peak_bytes(analysis):
+	with open(os.devnull, "w") as outfile:
+		tracemalloc.start()
+		dump_analysis(analysis, outfile)
+		_, peak = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+	return peak
+
+def test_peak_memory_does_not_grow_with_sheets():
+	small = peak_bytes(generate_analysis(2, 10))
+	large = peak_bytes(generate_analysis(20, 10))
+	assert large < 2 * small
@@ -0,0 +1,42 @@
+import boto3
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+
+from conftest import analysis_response, compiled_analysis
+from quicksight_deployer import AccountTarget, FanOutDeployer, FingerprintTagStore
+
+DATA_SET_ARNS = {"ds": "arn:aws:quicksight:us-east-1:444455556666:dataset/ds"}
+
+def denied_session():
+	raise ClientError({"Error": {"Code": "AccessDenied", "Message": "Not authorized to assume the role"}}, "AssumeRole")
+
+def client_target(aws_account_id, client):
+	target = AccountTarget(aws_account_id, DATA_SET_ARNS, max_workers = 1)
+	target.create_client = lambda: client
+	return target
+
+def test_account_whose_role_cannot_be_assumed_fails_alone(quicksight_client):
+	targets = [
+		AccountTarget("111122223333", DATA_SET_ARNS, session_factory = denied_session),
+		client_target("444455556666", quicksight_client)
+	]
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_response("update_analysis", analysis_response("a1", "UpdateStatus", "UPDATE_IN_PROGRESS", "444455556666"))
+		stubber.add_response("update_analysis", analysis_response("a2", "UpdateStatus", "UPDATE_IN_PROGRESS", "444455556666"))
+		results = dict(FanOutDeployer([compiled_analysis("a1"), compiled_analysis("a2")], targets, max_accounts = 1).deploy())
+		stubber.assert_no_pending_responses()
+
+	assert [(result.analysis_id, result.operation, result.error_code) for result in results["111122223333"]] == [
+		("a1", "FAILED", "AccessDenied"), ("a2", "FAILED", "AccessDenied")
+	]
+	assert [result.operation for result in results["444455556666"]] == ["UPDATED", "UPDATED"]
+
+def test_tag_store_uses_each_account_client(quicksight_client):
+	# The store given to FanOutDeployer has a client without responses; each account reads its own tags
+	other_client = boto3.client("quicksight", region_name = "us-east-1", aws_access_key_id = "testing", aws_secret_access_key = "testing")
+	with Stubber(quicksight_client) as stubber, Stubber(other_client):
+		stubber.add_response("list_tags_for_resource", {"Tags": [{"Key": "Team", "Value": "sales"}], "Status": 200, "RequestId": "request"})
+		results = dict(FanOutDeployer([compiled_analysis("a1")], [client_target("444455556666", quicksight_client)],
+			fingerprints = FingerprintTagStore(other_client), dry_run = True).deploy())
+		stubber.assert_no_pending_responses()
+	assert results["444455556666"][0].operation == "CHANGED"
@@ -0,0 +1,28 @@
+import pytest
+
+@pytest.fixture
+def handler_module(monkeypatch):
+	# The module creates its QuickSight client on import
+	monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+	import create_analysis_lambda
+
+	create_analysis_lambda._compiled_analyses.clear()
+	return create_analysis_lambda
+
+def test_warm_invocations_reuse_the_compiled_analysis(handler_module):
+	first = handler_module.lambda_handler({"AnalysisId": "analysis1"}, None)
+	second = handler_module.lambda_handler({"AnalysisId": "analysis1"}, None)
+	assert (first["CacheHit"], second["CacheHit"]) == (False, True)
+	assert second["AnalysisId"] == "analysis1"
+
+def test_cache_keeps_only_the_most_recently_used_analyses(handler_module):
+	limit = handler_module.MAX_CACHED_ANALYSES
+	for number in range(limit):
+		handler_module.lambda_handler({"AnalysisId": "analysis%d" % number}, None)
+	# Using analysis0 again makes analysis1 the oldest, so it is evicted by the next new analysis
+	assert handler_module.lambda_handler({"AnalysisId": "analysis0"}, None)["CacheHit"]
+	handler_module.lambda_handler({"AnalysisId": "new"}, None)
+
+	assert len(handler_module._compiled_analyses) == limit
+	assert handler_module.lambda_handler({"AnalysisId": "analysis0"}, None)["CacheHit"]
+	assert not handler_module.lambda_handler({"AnalysisId": "analysis1"}, None)["CacheHit"]
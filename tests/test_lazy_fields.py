@@ -0,0 +1,36 @@
+import pytest
+
+from quicksight_assets_class import BarChartVisual
+
+def is_stored(compiled_object, name):
+	try:
+		object.__getattribute__(compiled_object, name)
+		return True
+	except AttributeError:
+		return False
+
+def test_changing_an_unset_field_in_place_raises():
+	visual = BarChartVisual("bar1")
+	with pytest.raises(TypeError):
+		visual.actions.append({"CustomActionId": "action1"})
+	with pytest.raises(TypeError):
+		visual.title["Visibility"] = "HIDDEN"
+	with pytest.raises(TypeError):
+		visual.category += [{}]
+	assert not is_stored(visual, "actions")
+
+def test_compiling_does_not_allocate_unset_fields():
+	visual = BarChartVisual("bar1")
+	visual.add_categorical_dimension_field("Region", "ds")
+	visual.compile()
+	assert is_stored(visual, "category")
+	assert not is_stored(visual, "values")
+	assert not is_stored(visual, "title")
+
+def test_assigned_fields_reach_the_output():
+	visual = BarChartVisual("bar1")
+	visual.title = {"Visibility": "VISIBLE"}
+	visual.actions = [{"CustomActionId": "action1", "Name": "Action", "Trigger": "DATA_POINT_CLICK"}]
+	compiled = visual.compile()["BarChartVisual"]
+	assert compiled["Title"] == {"Visibility": "VISIBLE"}
+	assert [action["CustomActionId"] for action in compiled["Actions"]] == ["action1"]
@@ -0,0 +1,44 @@
+from botocore.stub import Stubber
+
+from quicksight_deployer import PublishPipeline
+
+DASHBOARD_ARN = "arn:aws:quicksight:us-east-1:111122223333:dashboard/dashboard1"
+
+def compiled_dashboard():
+	return {
+		"AwsAccountId": "111122223333",
+		"DashboardId": "dashboard1",
+		"Name": "Dashboard 1",
+		"Definition": {
+			"DataSetIdentifierDeclarations": [{"Identifier": "ds", "DataSetArn": "arn:aws:quicksight:us-east-1:111122223333:dataset/ds"}]
+		}
+	}
+
+def update_response(version_arn = None):
+	response = {"Arn": DASHBOARD_ARN, "DashboardId": "dashboard1", "CreationStatus": "CREATION_IN_PROGRESS", "Status": 200, "RequestId": "request"}
+	if version_arn is not None:
+		response["VersionArn"] = version_arn
+	return response
+
+def test_publishes_the_new_version(quicksight_client):
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_response("update_dashboard", update_response(DASHBOARD_ARN + "/version/3"))
+		stubber.add_response("describe_dashboard", {
+			"Dashboard": {"DashboardId": "dashboard1", "Version": {"Status": "CREATION_SUCCESSFUL", "VersionNumber": 3}},
+			"Status": 200, "RequestId": "request"
+		}, {"AwsAccountId": "111122223333", "DashboardId": "dashboard1", "VersionNumber": 3})
+		stubber.add_response("update_dashboard_published_version", {
+			"DashboardId": "dashboard1", "DashboardArn": DASHBOARD_ARN, "Status": 200, "RequestId": "request"
+		}, {"AwsAccountId": "111122223333", "DashboardId": "dashboard1", "VersionNumber": 3})
+		result = PublishPipeline(quicksight_client, poll_interval = 0).deploy_dashboard(compiled_dashboard())
+		stubber.assert_no_pending_responses()
+
+	assert (result.operation, result.status, result.published_version) == ("UPDATED", "CREATION_SUCCESSFUL", 3)
+
+def test_missing_or_malformed_version_arn_fails_the_dashboard(quicksight_client):
+	for version_arn in [None, DASHBOARD_ARN, DASHBOARD_ARN + "/version/latest"]:
+		with Stubber(quicksight_client) as stubber:
+			stubber.add_response("update_dashboard", update_response(version_arn))
+			result = PublishPipeline(quicksight_client).deploy_dashboard(compiled_dashboard())
+			stubber.assert_no_pending_responses()
+		assert (result.operation, result.error_code, result.published_version) == ("FAILED", "MissingVersionArn", None)
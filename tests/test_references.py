@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+from conftest import SRC
+from quicksight_assets_class import BarChartVisual
+
+def issue_codes(definition):
+	return sorted(issue.code for issue in definition.check_references())
+
+def test_index_is_built_by_check_references_only(sample_analysis):
+	definition = sample_analysis.definition
+	sample_analysis.compile()
+	assert definition._references is None
+	assert issue_codes(definition) == []
+	index = definition._references
+	assert issue_codes(definition) == []
+	assert definition._references is index
+
+	# A layout element whose visual was never added to the sheet
+	definition.sheets[0].add_grid_layout_element(BarChartVisual("missing"), 6, 6, 0, 40)
+	sample_analysis.compile()
+	assert definition._references is None
+	assert issue_codes(definition) == ["DanglingReference"]
+
+# Builds and compiles a small analysis twice in a fresh interpreter, importing only the classes it uses
+BUILD_SCRIPT = """
+import sys
+sys.path.insert(0, %r)
+from quicksight_assets_class import Analysis, BarChartVisual, CategoryFilter, Definition, FilterGroup, Sheet
+visual = BarChartVisual("bar1")
+visual.add_categorical_dimension_field("Region", "ds")
+sheet = Sheet("sheet1", "Sheet 1")
+sheet.add_visual(visual)
+sheet.add_grid_layout_element(visual, 12, 8, 0, 0)
+filter_group = FilterGroup("ALL_DATASETS", "group1")
+filter_group.add_filter(CategoryFilter("filter1", "Region", "ds"))
+definition = Definition([{"Identifier": "ds", "DataSetArn": "arn:aws:quicksight:us-east-1:111122223333:dataset/ds"}])
+definition.add_sheet(sheet)
+definition.add_filter_group(filter_group)
+analysis = Analysis("111122223333", "analysis1", "Analysis 1")
+analysis.add_definition(definition)
+analysis.compile()
+visual.add_title("VISIBLE", "PlainText", "Changed")
+analysis.compile()
+print(" ".join(name for name in sys.modules if name.startswith("quicksight_assets_class.")))
+"""
+
+def test_compiling_does_not_load_optional_modules():
+	loaded = subprocess.run([sys.executable, "-c", BUILD_SCRIPT % SRC], capture_output = True, text = True, check = True).stdout.split()
+	assert "quicksight_assets_class.core" in loaded
+	for name in ["payload", "references", "validation", "importer", "profiling"]:
+		assert "quicksight_assets_class." + name not in loaded
@@ -0,0 +1,30 @@
+import json
+
+from benchmarks.compile_benchmark import generate_analysis
+from quicksight_assets_class import BarChartVisual, Sheet, clean_dict
+
+def test_compiled_output_equals_its_cleaned_copy():
+	analysis_json = generate_analysis(3, 6, conditional_formats_per_table = 2, filter_group_count = 2).compile()
+	assert clean_dict(analysis_json) == analysis_json
+
+def test_later_add_calls_do_not_change_earlier_output():
+	visual = BarChartVisual("bar1")
+	visual.add_categorical_dimension_field("Region", "ds")
+	visual.add_filter_action("action1", "Filter", "DATA_POINT_CLICK")
+	compiled = visual.compile()
+	before = json.dumps(compiled, sort_keys = True)
+
+	visual.add_categorical_dimension_field("Country", "ds")
+	visual.add_filter_action("action2", "Filter", "DATA_POINT_MENU")
+	visual.add_column_hierarchy("hierarchy1", ["Region", "Country"], "ds")
+	assert json.dumps(compiled, sort_keys = True) == before
+
+	field_wells = visual.compile()["BarChartVisual"]["ChartConfiguration"]["FieldWells"]["BarChartAggregatedFieldWells"]
+	assert field_wells["Category"][0]["CategoricalDimensionField"]["HierarchyId"] == "hierarchy1"
+
+def test_later_add_calls_do_not_change_earlier_sheet_output():
+	sheet = Sheet("sheet1", "Sheet 1")
+	sheet.add_visual(BarChartVisual("bar1"))
+	compiled = sheet.compile()
+	sheet.add_visual(BarChartVisual("bar2"))
+	assert [visual["BarChartVisual"]["VisualId"] for visual in compiled["Visuals"]] == ["bar1"]
@@ -0,0 +1,47 @@
+from botocore.stub import Stubber
+
+from quicksight_deployer import AnalysisStatusPoller
+
+def describe_response(status, errors = None):
+	analysis = {"AnalysisId": "a1", "Status": status}
+	if errors:
+		analysis["Errors"] = errors
+	return {"Analysis": analysis, "Status": 200, "RequestId": "request"}
+
+def poller(client, **options):
+	return AnalysisStatusPoller(client, max_concurrency = 1, requests_per_second = None, base_delay = 0.001, max_delay = 0.001, seed = 1, **options)
+
+def test_polls_until_a_terminal_status(quicksight_client):
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_response("describe_analysis", describe_response("UPDATE_IN_PROGRESS"))
+		stubber.add_client_error("describe_analysis", "ThrottlingException")
+		stubber.add_response("describe_analysis", describe_response("UPDATE_SUCCESSFUL"))
+		result = poller(quicksight_client).wait([("111122223333", "a1")])[("111122223333", "a1")]
+		stubber.assert_no_pending_responses()
+
+	assert result.succeeded()
+	assert (result.requests, result.error_code) == (3, "")
+
+def test_reports_failures_and_missing_analyses(quicksight_client):
+	errors = [{"Type": "COLUMN_TYPE_MISMATCH", "Message": "Bad column"}]
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_response("describe_analysis", describe_response("CREATION_FAILED", errors))
+		stubber.add_client_error("describe_analysis", "ResourceNotFoundException")
+		results = poller(quicksight_client).wait([("111122223333", "a1"), ("111122223333", "a2")])
+
+	assert (results[("111122223333", "a1")].status, results[("111122223333", "a1")].errors) == ("CREATION_FAILED", errors)
+	assert results[("111122223333", "a2")].status == "NOT_FOUND"
+
+def test_botocore_errors_end_the_poll(quicksight_client):
+	# An account ID must be a string, so botocore raises ParamValidationError before the stubbed response is used
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_response("describe_analysis", describe_response("UPDATE_SUCCESSFUL"))
+		result = poller(quicksight_client).wait([(111122223333, "a1")])[(111122223333, "a1")]
+	assert (result.status, result.error_code) == ("ERROR", "ParamValidationError")
+
+def test_request_budget(quicksight_client):
+	with Stubber(quicksight_client) as stubber:
+		stubber.add_response("describe_analysis", describe_response("UPDATE_IN_PROGRESS"))
+		stubber.add_response("describe_analysis", describe_response("UPDATE_IN_PROGRESS"))
+		result = poller(quicksight_client, max_requests = 2).wait([("111122223333", "a1")])[("111122223333", "a1")]
+	assert (result.status, result.requests) == ("BUDGET_EXHAUSTED", 2)